@@ -8,10 +8,11 @@ __version__ = "1.0.0"
 __author__ = "WIRED CHAOS Team"
 
 from .config import get_config
-from .sources import SourceManager
-from .nlp import ProfileMatcher, EligibilityFilter, GrantPrioritizer
+from .sources import SourceManager, HTTPClientPool, FeedParsePool, create_grant_store
+from .nlp import ProfileMatcher, EligibilityFilter, GrantPrioritizer, FeatureCache, SemanticMatcher
 from .automation import ApplicationDrafter, SubmissionHandler, StatusMonitor, BlockchainLogger
 from .gamma import PitchGenerator, ExecutiveSummary
+from .tenants import TenantProfile, TenantRegistry
 
 __all__ = [
     "get_config",
@@ -25,6 +26,8 @@ __all__ = [
     "BlockchainLogger",
     "PitchGenerator",
     "ExecutiveSummary",
+    "TenantProfile",
+    "TenantRegistry",
     "GrantBot",
 ]
 
@@ -48,12 +51,52 @@ class GrantBot:
         self.config = get_config()
         self.tenant_id = tenant_id
         
+        # Shared HTTP connection pool and feed parse pool for all grant sources
+        sources_config = self.config.sources
+        self.http_client = HTTPClientPool(
+            timeout=sources_config.http_timeout_seconds,
+            max_connections=sources_config.http_max_connections,
+            max_keepalive_connections=sources_config.http_max_keepalive_connections,
+            max_connections_per_host=sources_config.http_max_connections_per_host,
+            http2=sources_config.http2_enabled
+        )
+        self.parse_pool = FeedParsePool(
+            max_workers=sources_config.feed_parse_workers,
+            max_queued=sources_config.feed_parse_queue_size,
+            use_processes=sources_config.feed_parse_processes
+        )
+        
+        # Persistent grant store (SQLite locally, MongoDB in production)
+        tenant_config = self.config.tenant
+        self.grant_store = create_grant_store(
+            tenant_config.grant_store_backend,
+            sqlite_path=tenant_config.grant_store_path,
+            database_url=tenant_config.tenant_database_url
+        )
+        
         # Initialize modules
         self.source_manager = SourceManager(
             rss_feeds=self.config.sources.grant_rss_feeds,
             api_keys=self.config.sources.grants_api_keys,
             swarm_feed_url=self.config.sources.swarm_rss_feed_url,
-            tenant_id=tenant_id
+            tenant_id=tenant_id,
+            http_client=self.http_client,
+            parse_pool=self.parse_pool,
+            feed_scheduler=sources_config.feed_scheduler_enabled,
+            poll_min_interval=sources_config.feed_poll_min_seconds,
+            poll_max_interval=sources_config.feed_poll_max_seconds,
+            grant_store=self.grant_store,
+            cache_ttl=sources_config.discovery_cache_ttl_seconds,
+            stale_ttl=sources_config.discovery_stale_ttl_seconds,
+            discovery_deadline=sources_config.discovery_deadline_seconds,
+            breaker_failure_threshold=sources_config.source_breaker_failure_threshold,
+            breaker_reset_timeout=sources_config.source_breaker_reset_seconds,
+            rss_mirrors=sources_config.grant_rss_feed_mirrors,
+            hedge_delay=sources_config.feed_hedge_delay_seconds,
+            grants_gov_page_size=sources_config.grants_gov_page_size,
+            grants_gov_concurrency=sources_config.grants_gov_max_concurrency,
+            crawl_concurrency=sources_config.feed_crawl_concurrency,
+            crawl_domain_delay=sources_config.feed_crawl_domain_delay_seconds
         )
         
         org_profile = {
@@ -64,9 +107,29 @@ class GrantBot:
             'size': self.config.organization.org_size,
         }
         
-        self.profile_matcher = ProfileMatcher(org_profile)
-        self.eligibility_filter = EligibilityFilter(org_profile)
-        self.prioritizer = GrantPrioritizer()
+        # Tenants share the source layer, NLP feature cache and grant vector
+        # index; the bot's own tenant sees the globally configured feeds
+        self.feature_cache = FeatureCache(max_entries=self.config.nlp.feature_cache_size)
+        self.semantic_matcher = None
+        if self.config.nlp.semantic_matching_enabled:
+            self.semantic_matcher = SemanticMatcher(
+                model_name=self.config.nlp.semantic_model,
+                max_indexed=self.config.nlp.semantic_index_size
+            )
+        self.tenants = TenantRegistry(
+            self.source_manager,
+            feature_cache=self.feature_cache,
+            semantic_matcher=self.semantic_matcher
+        )
+        default_tenant = self.tenants.register(tenant_id, org_profile)
+        
+        self.profile_matcher = ProfileMatcher(
+            org_profile,
+            feature_cache=self.feature_cache,
+            semantic_matcher=self.semantic_matcher
+        )
+        self.eligibility_filter = default_tenant.eligibility_filter
+        self.prioritizer = default_tenant.prioritizer
         
         self.drafter = ApplicationDrafter(
             org_profile=org_profile,
@@ -101,15 +164,43 @@ class GrantBot:
             template_id=self.config.gamma.gamma_exec_summary_template_id
         )
     
-    async def discover_grants(self, use_cache: bool = False):
+    def register_tenant(self, tenant_id: str, org_profile: dict = None, **settings):
+        """Register a tenant on the shared source layer (defaults to the configured profile)"""
+        if org_profile is None:
+            org_profile = dict(self.tenants.get(self.tenant_id).org_profile, name=tenant_id)
+        return self.tenants.register(tenant_id, org_profile, **settings)
+    
+    async def discover_grants(self, use_cache: bool = False, tenant_id: str = None):
         """Discover all grants from configured sources"""
-        grants = await self.source_manager.discover_all_grants(use_cache=use_cache)
+        grants = await self.tenants.discover(tenant_id or self.tenant_id, use_cache=use_cache)
         await self.blockchain_logger.log_discovery(grants)
         return grants
     
-    async def filter_eligible(self, grants):
-        """Filter grants for eligibility"""
-        eligible = self.eligibility_filter.filter_grants(grants)
+    async def get_grant(self, grant_id: str, tenant_id: str = None):
+        """Look up a discovered grant by id"""
+        tenant_id = tenant_id or self.tenant_id
+        tenant = self.tenants.get(tenant_id)
+        grant = await self.source_manager.get_grant(grant_id)
+        if grant is None or not tenant.subscribes_to(grant):
+            return None
+        return dict(grant, tenant_id=tenant_id)
+    
+    async def stream_grants(self, tenant_id: str = None):
+        """Yield grants from configured sources as each source finishes"""
+        tenant_id = tenant_id or self.tenant_id
+        tenant = self.tenants.get(tenant_id)
+        grants = []
+        async for grant in self.source_manager.stream_all_grants():
+            if tenant.subscribes_to(grant):
+                grant = dict(grant, tenant_id=tenant_id)
+                grants.append(grant)
+                yield grant
+        await self.blockchain_logger.log_discovery(grants)
+    
+    async def filter_eligible(self, grants, tenant_id: str = None, **criteria):
+        """Filter grants for eligibility (criteria: min_amount, max_amount, days_minimum, categories)"""
+        tenant = self.tenants.get(tenant_id or self.tenant_id)
+        eligible = tenant.eligibility_filter.filter_grants(grants, **criteria)
         
         # Log eligibility checks
         for grant in eligible:
@@ -121,9 +212,10 @@ class GrantBot:
         
         return eligible
     
-    async def prioritize_grants(self, grants):
+    async def prioritize_grants(self, grants, tenant_id: str = None):
         """Prioritize grants by multiple factors"""
-        return self.prioritizer.prioritize_grants(grants)
+        tenant = self.tenants.get(tenant_id or self.tenant_id)
+        return tenant.prioritizer.prioritize_grants(grants)
     
     async def draft_application(self, grant, use_llm: bool = False):
         """Draft grant application"""
@@ -164,10 +256,17 @@ class GrantBot:
         """Check application status"""
         return await self.status_monitor.check_status(submission_id)
     
+    async def close(self):
+        """Release shared resources (HTTP connection pool, feed parse pool, grant store)"""
+        await self.source_manager.aclose()
+    
     def get_stats(self):
         """Get comprehensive bot statistics"""
         return {
             'sources': self.source_manager.get_source_stats(),
+            'tenants': self.tenants.get_stats(),
+            'feature_cache': self.feature_cache.get_stats(),
+            'semantic_matcher': self.semantic_matcher.get_stats() if self.semantic_matcher else None,
             'submissions': self.submission_handler.get_submission_stats(),
             'tracking': self.status_monitor.get_tracking_stats(),
         }
@@ -36,6 +36,95 @@ class GrantSourcesConfig(BaseSettings):
         default=None,
         description="Foundation Center API key"
     )
+    http_timeout_seconds: float = Field(
+        default=15.0,
+        description="Timeout for every outbound source request"
+    )
+    http_max_connections: int = Field(
+        default=100,
+        description="Total pooled HTTP connections across all sources"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20,
+        description="Idle keep-alive connections kept for reuse"
+    )
+    http_max_connections_per_host: int = Field(
+        default=6,
+        description="Concurrent requests allowed per source host"
+    )
+    http2_enabled: bool = Field(
+        default=False,
+        description="Use HTTP/2 for source requests (requires h2)"
+    )
+    feed_parse_workers: int = Field(
+        default=2,
+        description="Feed parse jobs run concurrently, off the event loop"
+    )
+    feed_parse_queue_size: int = Field(
+        default=32,
+        description="Feed parse jobs allowed to wait for a parse worker"
+    )
+    feed_parse_processes: bool = Field(
+        default=False,
+        description="Parse feeds in worker processes instead of threads (default threads, "
+                    "matching FeedParsePool; processes only pay off for large feeds)"
+    )
+    discovery_cache_ttl_seconds: float = Field(
+        default=900,
+        description="Seconds cached discovery results are served as fresh"
+    )
+    discovery_stale_ttl_seconds: float = Field(
+        default=86400,
+        description="Seconds stale results are served while refreshing in the background"
+    )
+    discovery_deadline_seconds: float = Field(
+        default=20.0,
+        description="Seconds discovery waits for sources before falling back to late sources' previous results"
+    )
+    source_breaker_failure_threshold: int = Field(
+        default=3,
+        description="Consecutive failures that trip a source's circuit breaker"
+    )
+    source_breaker_reset_seconds: float = Field(
+        default=300.0,
+        description="Seconds before a tripped source is probed again"
+    )
+    grant_rss_feed_mirrors: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Mirror URLs by RSS feed URL, raced against slow primaries"
+    )
+    feed_hedge_delay_seconds: float = Field(
+        default=1.0,
+        description="Seconds before a slow feed request is hedged to a mirror"
+    )
+    grants_gov_page_size: int = Field(
+        default=100,
+        description="Opportunities requested per Grants.gov search page"
+    )
+    grants_gov_max_concurrency: int = Field(
+        default=4,
+        description="Grants.gov result pages fetched concurrently during a sync"
+    )
+    feed_crawl_concurrency: int = Field(
+        default=50,
+        description="Sites scanned concurrently when crawling for RSS feeds"
+    )
+    feed_crawl_domain_delay_seconds: float = Field(
+        default=1.0,
+        description="Minimum seconds between crawl requests to the same domain"
+    )
+    feed_scheduler_enabled: bool = Field(
+        default=True,
+        description="Poll RSS feeds in the background at learned per-feed intervals"
+    )
+    feed_poll_min_seconds: float = Field(
+        default=300,
+        description="Shortest per-feed RSS polling interval"
+    )
+    feed_poll_max_seconds: float = Field(
+        default=86400,
+        description="Longest per-feed RSS polling interval"
+    )
     
     class Config:
         env_file = ".env"
@@ -56,6 +145,22 @@ class NLPConfig(BaseSettings):
         default="text-embedding-3-small",
         description="Embedding model for semantic matching"
     )
+    feature_cache_size: int = Field(
+        default=10000,
+        description="Grant feature cache entries (tags, match features, priorities) kept in LRU order"
+    )
+    semantic_matching_enabled: bool = Field(
+        default=False,
+        description="Add local embedding similarity to eligibility scores (requires sentence-transformers)"
+    )
+    semantic_model: str = Field(
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        description="CPU-friendly sentence-transformers model for semantic matching"
+    )
+    semantic_index_size: int = Field(
+        default=50000,
+        description="Grant vectors kept in the semantic index (least recently used are evicted)"
+    )
     
     class Config:
         env_file = ".env"
@@ -116,6 +221,14 @@ class TenantConfig(BaseSettings):
         default="mongodb://localhost:27017/grants_bot",
         description="Database URL for tenant management"
     )
+    grant_store_backend: str = Field(
+        default="sqlite",
+        description="Grant store backend: 'sqlite' locally, 'mongo' uses tenant_database_url"
+    )
+    grant_store_path: str = Field(
+        default="grants.db",
+        description="SQLite file for the local grant store"
+    )
     default_tenant_id: str = Field(
         default="wired-chaos",
         description="Default tenant ID"
@@ -204,6 +317,10 @@ class APIConfig(BaseSettings):
         default=None,
         description="JWT secret for authentication"
     )
+    admin_api_key: Optional[str] = Field(
+        default=None,
+        description="API key required (X-API-Key header) for admin endpoints such as tenant registration; they are disabled when unset"
+    )
     
     class Config:
         env_file = ".env"
@@ -4,10 +4,21 @@ NLP Module - Package Initialization
 
 from .profile_matcher import ProfileMatcher
 from .eligibility_filter import EligibilityFilter
-from .prioritization import GrantPrioritizer
+from .prioritization import GrantPrioritizer, IncrementalRanker
+from .keyword_matcher import KeywordMatcher, GRANT_KEYWORDS
+from .feature_cache import FeatureCache
+from .semantic_matcher import SemanticMatcher, VectorIndex
+from .match_matrix import MatchMatrix
 
 __all__ = [
     "ProfileMatcher",
     "EligibilityFilter",
     "GrantPrioritizer",
+    "IncrementalRanker",
+    "KeywordMatcher",
+    "GRANT_KEYWORDS",
+    "FeatureCache",
+    "SemanticMatcher",
+    "VectorIndex",
+    "MatchMatrix",
 ]
@@ -0,0 +1,187 @@
+"""
+Grant Deadline Normalization
+
+Deadlines arrive as ISO dates, ISO timestamps or US-style MM/DD/YYYY
+strings. They are parsed once (at ingestion, or memoized on first use)
+into a proleptic Gregorian ordinal stored on the grant as
+`deadline_ordinal`, and days-until / urgency buckets are computed for a
+whole batch at once with NumPy.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SECONDS_PER_DAY = 86400
+
+# Urgency by days until deadline: (upper bound, inclusive?, score)
+# < 7 too urgent, 7-14 tight, 14-30 good, 30-60 optimal, 60-90 good, > 90 less urgent
+URGENCY_BUCKETS = [
+    (7, False, 0.3),
+    (14, False, 0.6),
+    (30, False, 0.8),
+    (60, True, 1.0),
+    (90, True, 0.8),
+]
+URGENCY_LATER = 0.6
+URGENCY_UNKNOWN = 0.5
+
+
+@lru_cache(maxsize=4096)
+def parse_deadline(value: str) -> Optional[int]:
+    """
+    Parse a deadline string to a date ordinal
+
+    The time of day is ignored. 'YYYY-MM-DD' (optionally followed by
+    'T...') takes a fast ISO path; other formats fall back to strptime.
+
+    Args:
+        value: Deadline string
+
+    Returns:
+        date.toordinal() of the deadline, or None if it cannot be parsed
+    """
+    if not value:
+        return None
+    head = value.split('T')[0]
+    if len(head) == 10 and head[4] == '-' and head[7] == '-':
+        try:
+            return date.fromisoformat(head).toordinal()
+        except ValueError:
+            pass
+    for fmt in ('%Y-%m-%d', '%m/%d/%Y'):
+        try:
+            return datetime.strptime(head, fmt).toordinal()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_deadline(grant: Dict) -> Optional[int]:
+    """Parse a grant's deadline and store it as deadline_ordinal"""
+    deadline = grant.get('deadline')
+    grant['deadline_ordinal'] = parse_deadline(deadline) if isinstance(deadline, str) else None
+    return grant['deadline_ordinal']
+
+
+def deadline_ordinal(grant: Dict) -> Optional[int]:
+    """Normalized deadline of a grant, parsing it if ingestion did not"""
+    if 'deadline_ordinal' in grant:
+        return grant['deadline_ordinal']
+    deadline = grant.get('deadline')
+    return parse_deadline(deadline) if isinstance(deadline, str) else None
+
+
+def _seconds_until(ordinals: Sequence[float], now: datetime):
+    """Seconds from now until midnight (UTC) of each deadline"""
+    midnight_offset = (now - datetime(now.year, now.month, now.day)).total_seconds()
+    today = now.toordinal()
+    return (np.asarray(ordinals, dtype=np.float64) - today) * SECONDS_PER_DAY - midnight_offset
+
+
+def days_until(ordinals: List[Optional[int]], now: Optional[datetime] = None):
+    """
+    Whole days until each deadline, rounded down like timedelta.days
+
+    Args:
+        ordinals: Deadline ordinals (None for unknown)
+        now: Current UTC time (defaults to utcnow)
+
+    Returns:
+        Float array of days; NaN where the deadline is unknown
+    """
+    now = now or datetime.utcnow()
+    values = [np.nan if ordinal is None else ordinal for ordinal in ordinals]
+    return np.floor(_seconds_until(values, now) / SECONDS_PER_DAY)
+
+
+def urgency_score(days: Optional[float]) -> float:
+    """Urgency bucket for one deadline"""
+    if days is None:
+        return URGENCY_UNKNOWN
+    for bound, inclusive, score in URGENCY_BUCKETS:
+        if days < bound or (inclusive and days == bound):
+            return score
+    return URGENCY_LATER
+
+
+def urgency_scores(ordinals: List[Optional[int]], now: Optional[datetime] = None) -> List[float]:
+    """
+    Urgency scores for a batch of deadlines
+
+    Args:
+        ordinals: Deadline ordinals (None for unknown)
+        now: Current UTC time (defaults to utcnow)
+
+    Returns:
+        Urgency score per deadline
+    """
+    now = now or datetime.utcnow()
+    if np is None:
+        return [
+            urgency_score(None if ordinal is None else (datetime.fromordinal(ordinal) - now).days)
+            for ordinal in ordinals
+        ]
+
+    days = days_until(ordinals, now)
+    conditions = [
+        (days <= bound) if inclusive else (days < bound)
+        for bound, inclusive, _ in URGENCY_BUCKETS
+    ]
+    choices = [score for _, _, score in URGENCY_BUCKETS]
+    scores = np.select(conditions, choices, default=URGENCY_LATER)
+    scores[np.isnan(days)] = URGENCY_UNKNOWN
+    return scores.tolist()
+
+
+def earliest_deadline(days_minimum: int, now: Optional[datetime] = None) -> int:
+    """
+    Earliest deadline ordinal at least days_minimum days away
+
+    deadline_at_least for a single grant reduces to ordinal >= this value.
+
+    Args:
+        days_minimum: Minimum days until deadline
+        now: Current UTC time (defaults to utcnow)
+
+    Returns:
+        Date ordinal
+    """
+    now = now or datetime.utcnow()
+    past_midnight = now != datetime(now.year, now.month, now.day)
+    return now.toordinal() + days_minimum + (1 if past_midnight else 0)
+
+
+def deadline_at_least(
+    ordinals: List[Optional[int]],
+    days_minimum: int,
+    now: Optional[datetime] = None
+) -> List[bool]:
+    """
+    Check which deadlines are at least days_minimum days away
+
+    Unknown deadlines count as far enough away.
+
+    Args:
+        ordinals: Deadline ordinals (None for unknown)
+        days_minimum: Minimum days until deadline
+        now: Current UTC time (defaults to utcnow)
+
+    Returns:
+        One flag per deadline
+    """
+    now = now or datetime.utcnow()
+    if np is None:
+        return [
+            ordinal is None or (datetime.fromordinal(ordinal) - now).total_seconds() >= days_minimum * SECONDS_PER_DAY
+            for ordinal in ordinals
+        ]
+
+    values = [np.nan if ordinal is None else ordinal for ordinal in ordinals]
+    seconds = _seconds_until(values, now)
+    return (np.isnan(seconds) | (seconds >= days_minimum * SECONDS_PER_DAY)).tolist()
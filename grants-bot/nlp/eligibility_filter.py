@@ -3,13 +3,19 @@ Eligibility Filter
 
 NLP-based filtering to identify grants the organization qualifies for.
 Uses ProfileMatcher for scoring and applies configurable thresholds.
+Category, amount, deadline and exclusion checks run as one chain of
+predicates in a single pass, cheapest first, before the batch match score.
 """
 
-from typing import Dict, List, Optional
+import re
+from typing import Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from .deadlines import deadline_at_least, deadline_ordinal, earliest_deadline
+from .feature_cache import FeatureCache, content_version
 from .profile_matcher import ProfileMatcher
+from .semantic_matcher import SemanticMatcher
 
 
 class EligibilityFilter:
@@ -19,7 +25,9 @@ class EligibilityFilter:
         self,
         org_profile: Dict,
         min_match_score: float = 0.3,
-        exclude_keywords: Optional[List[str]] = None
+        exclude_keywords: Optional[List[str]] = None,
+        feature_cache: Optional[FeatureCache] = None,
+        semantic_matcher: Optional[SemanticMatcher] = None
     ):
         """
         Initialize eligibility filter
@@ -28,19 +36,52 @@ class EligibilityFilter:
             org_profile: Organization profile dictionary
             min_match_score: Minimum match score for eligibility (0.0-1.0)
             exclude_keywords: Keywords that disqualify grants
+            feature_cache: Shared feature cache (creates its own if omitted)
+            semantic_matcher: Shared embedding matcher for semantic scoring (optional)
         """
-        self.matcher = ProfileMatcher(org_profile)
+        self.matcher = ProfileMatcher(
+            org_profile,
+            feature_cache=feature_cache,
+            semantic_matcher=semantic_matcher
+        )
+        self.cache = self.matcher.cache
         self.min_match_score = min_match_score
         self.exclude_keywords = [kw.lower() for kw in (exclude_keywords or [])]
+        self.exclude_version = content_version(self.exclude_keywords)
+        
+        # All exclusion keywords in one alternation (longest first), matched as substrings
+        self.exclude_pattern = None
+        if self.exclude_keywords:
+            self.exclude_pattern = re.compile('|'.join(
+                re.escape(kw) for kw in sorted(set(self.exclude_keywords), key=len, reverse=True)
+            ))
+        
+        # Grants rejected by each step of the last filter_grants call
+        self.last_rejections: Dict[str, int] = {}
         
         logger.info(f"🔍 Initialized EligibilityFilter with threshold: {min_match_score}")
     
-    def filter_grants(self, grants: List[Dict]) -> List[Dict]:
+    def filter_grants(
+        self,
+        grants: List[Dict],
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        days_minimum: Optional[int] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Dict]:
         """
         Filter grants for eligibility
         
+        Every check runs in one pass over the grants; a grant stops at the
+        first check it fails. Match scores are computed last, in one batch,
+        for the grants that pass.
+        
         Args:
             grants: List of grant opportunities
+            min_amount: Minimum grant amount (grants without an amount pass)
+            max_amount: Maximum grant amount
+            days_minimum: Minimum days until deadline (grants without one pass)
+            categories: Allowed categories (case-insensitive)
             
         Returns:
             List of eligible grants with match scores
@@ -49,27 +90,97 @@ class EligibilityFilter:
         
         logger.info(f"🔍 Filtering {len(grants)} grants for eligibility...")
         
+        chain = self.build_chain(min_amount, max_amount, days_minimum, categories)
+        rejections = {name: 0 for name, _ in chain}
+        candidates = []
         for grant in grants:
-            # Check for exclusions
-            if self._is_excluded(grant):
-                continue
-            
-            # Calculate match score
-            match_details = self.matcher.get_match_details(grant)
-            
+            for name, check in chain:
+                if not check(grant):
+                    rejections[name] += 1
+                    break
+            else:
+                candidates.append(grant)
+        
+        # Embed new grant text in one batch, extract features once per grant,
+        # then score the whole batch at once
+        self.matcher.prepare(candidates)
+        features = [self.matcher.extract_features(grant) for grant in candidates]
+        scores = self.matcher.score_batch(features)
+        
+        for grant, grant_features, score in zip(candidates, features, scores):
             # Check eligibility
-            if match_details['match_score'] >= self.min_match_score:
+            if score >= self.min_match_score:
                 # Add match details to grant
+                match_details = self.matcher.details_from_features(grant, grant_features, float(score))
                 grant['match_score'] = match_details['match_score']
                 grant['match_details'] = match_details
                 grant['is_eligible'] = True
                 
                 eligible_grants.append(grant)
         
+        rejections['match_score'] = len(candidates) - len(eligible_grants)
+        self.last_rejections = rejections
+        
         logger.info(f"✅ Found {len(eligible_grants)} eligible grants")
         
         return eligible_grants
     
+    def build_chain(
+        self,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        days_minimum: Optional[int] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Tuple[str, Callable[[Dict], bool]]]:
+        """
+        Checks a grant must pass, cheapest and most selective first
+        
+        Unset criteria are left out of the chain.
+        
+        Args:
+            min_amount: Minimum grant amount
+            max_amount: Maximum grant amount
+            days_minimum: Minimum days until deadline
+            categories: Allowed categories
+            
+        Returns:
+            (name, check) pairs; a check returns True to keep the grant
+        """
+        chain = []
+        
+        if categories is not None:
+            allowed = {cat.lower() for cat in categories}
+            chain.append(('category', lambda grant: grant.get('category', '').lower() in allowed))
+        
+        if min_amount is not None or max_amount is not None:
+            chain.append(('amount', lambda grant: self._amount_in_range(grant, min_amount, max_amount)))
+        
+        if days_minimum is not None:
+            cutoff = earliest_deadline(days_minimum)
+            
+            def deadline_ok(grant: Dict) -> bool:
+                ordinal = deadline_ordinal(grant)
+                return ordinal is None or ordinal >= cutoff
+            
+            chain.append(('deadline', deadline_ok))
+        
+        if self.exclude_pattern is not None:
+            chain.append(('excluded', lambda grant: not self._is_excluded(grant)))
+        
+        return chain
+    
+    @staticmethod
+    def _amount_in_range(grant: Dict, min_amount: Optional[float], max_amount: Optional[float]) -> bool:
+        """Check a grant's amount against a range (unspecified amounts pass)"""
+        amount = grant.get('amount', 0)
+        if amount == 0:
+            return True
+        if min_amount is not None and amount < min_amount:
+            return False
+        if max_amount is not None and amount > max_amount:
+            return False
+        return True
+    
     def _is_excluded(self, grant: Dict) -> bool:
         """
         Check if grant contains excluded keywords
@@ -83,16 +194,21 @@ class EligibilityFilter:
         if not self.exclude_keywords:
             return False
         
-        # Check title and description
+        key = self.cache.key(self.exclude_version, grant, ('title', 'description'))
+        return self.cache.get_or_compute('eligibility_filter', key, lambda: self._check_excluded(grant))
+    
+    def _check_excluded(self, grant: Dict) -> bool:
+        """Check exclusions without the cache"""
+        # Check title and description in one scan for every keyword
         text = (
             grant.get('title', '') + ' ' +
             grant.get('description', '')
         ).lower()
         
-        for keyword in self.exclude_keywords:
-            if keyword in text:
-                logger.debug(f"❌ Excluded grant due to keyword '{keyword}': {grant.get('title')}")
-                return True
+        match = self.exclude_pattern.search(text)
+        if match:
+            logger.debug(f"❌ Excluded grant due to keyword '{match.group(0)}': {grant.get('title')}")
+            return True
         
         return False
     
@@ -113,23 +229,10 @@ class EligibilityFilter:
         Returns:
             Filtered list of grants
         """
-        filtered = []
-        
-        for grant in grants:
-            amount = grant.get('amount', 0)
-            
-            # Skip if amount is not specified
-            if amount == 0:
-                filtered.append(grant)
-                continue
-            
-            # Check range
-            if min_amount is not None and amount < min_amount:
-                continue
-            if max_amount is not None and amount > max_amount:
-                continue
-            
-            filtered.append(grant)
+        filtered = [
+            grant for grant in grants
+            if self._amount_in_range(grant, min_amount, max_amount)
+        ]
         
         logger.info(f"💰 Filtered to {len(filtered)} grants by amount range")
         return filtered
@@ -149,42 +252,12 @@ class EligibilityFilter:
         Returns:
             Filtered list of grants
         """
-        from datetime import datetime, timedelta
-        
         if days_minimum is None:
             return grants
         
-        filtered = []
-        cutoff_date = datetime.utcnow() + timedelta(days=days_minimum)
-        
-        for grant in grants:
-            deadline_str = grant.get('deadline', '')
-            
-            if not deadline_str:
-                # Include if no deadline specified
-                filtered.append(grant)
-                continue
-            
-            try:
-                # Parse deadline (multiple formats)
-                for fmt in ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%m/%d/%Y']:
-                    try:
-                        deadline = datetime.strptime(deadline_str.split('T')[0], fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    # Could not parse, include anyway
-                    filtered.append(grant)
-                    continue
-                
-                # Check if deadline is far enough away
-                if deadline >= cutoff_date:
-                    filtered.append(grant)
-                    
-            except Exception as e:
-                logger.debug(f"Could not parse deadline '{deadline_str}': {e}")
-                filtered.append(grant)
+        # Grants without a parseable deadline are kept
+        keep = deadline_at_least([deadline_ordinal(grant) for grant in grants], days_minimum)
+        filtered = [grant for grant, ok in zip(grants, keep) if ok]
         
         logger.info(f"📅 Filtered to {len(filtered)} grants by deadline")
         return filtered
@@ -243,6 +316,7 @@ class EligibilityFilter:
             'eligibility_rate': eligible / total if total > 0 else 0,
             'average_match_score': avg_score,
             'min_threshold': self.min_match_score,
+            'rejections': dict(self.last_rejections),
         }
 
 
@@ -0,0 +1,108 @@
+"""
+Grant Feature Cache
+
+LRU cache for per-grant NLP results (tags, match features, exclusion
+checks, priority scores). Entries are keyed by a hash of the grant fields
+a component reads plus a version string for the component's own inputs
+(organization profile, exclusion keywords, weights), so a changed grant or
+a changed profile never hits a stale entry.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+
+def content_version(*parts: Any) -> str:
+    """Stable short hash of a component's configuration"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+class FeatureCache:
+    """Content-addressed LRU cache shared by the NLP components"""
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Initialize feature cache
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+
+    @staticmethod
+    def key(version: str, grant: Dict, fields: Iterable[str]) -> str:
+        """
+        Hash the fields of a grant a component depends on
+
+        Args:
+            version: Component configuration version
+            grant: Grant dictionary
+            fields: Grant fields read by the component
+
+        Returns:
+            Content key
+        """
+        payload = json.dumps(
+            [version, [grant.get(field) for field in fields]],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def get_or_compute(self, namespace: str, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for a key, computing and storing it on a miss
+
+        Cached values are shared between callers and must not be mutated.
+
+        Args:
+            namespace: Component name, kept separate in keys and stats
+            key: Content key from FeatureCache.key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        stats = self.stats.get(namespace)
+        if stats is None:
+            stats = self.stats[namespace] = {'hits': 0, 'misses': 0}
+
+        entry_key = (namespace, key)
+        if entry_key in self._entries:
+            self._entries.move_to_end(entry_key)
+            stats['hits'] += 1
+            return self._entries[entry_key]
+
+        stats['misses'] += 1
+        value = compute()
+        self._entries[entry_key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get size and per-component hit rates"""
+        components = {}
+        for namespace, stats in self.stats.items():
+            lookups = stats['hits'] + stats['misses']
+            components[namespace] = dict(
+                stats,
+                hit_rate=round(stats['hits'] / lookups, 3) if lookups else 0.0
+            )
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'evictions': self.evictions,
+            'components': components,
+        }
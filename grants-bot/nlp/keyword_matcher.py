@@ -0,0 +1,167 @@
+"""
+Keyword Matcher
+
+Single-pass keyword tagging for grant text. Every keyword table used for
+grant tagging and Web3 metadata is compiled once into one trie-shaped
+regular expression, so a grant's text is scanned once no matter how many
+tables or keywords there are. Matches respect word boundaries ("eth" does
+not match "method", "sol" does not match "solution") and accept a simple
+trailing plural ("grant" matches "grants").
+"""
+
+import re
+from typing import Dict, Iterable, List, Set
+
+# Tags inferred from grant titles and descriptions (ProfileMatcher)
+GRANT_TAG_KEYWORDS = {
+    'web3': ['web3', 'web 3', 'decentralized'],
+    'women': ['women', 'woman', 'female', 'ladies'],
+    'woman-owned': ['woman-owned', 'women-owned', 'female-founded'],
+    'tech': ['tech', 'technology', 'technologies', 'digital'],
+    'nonprofit': ['nonprofit', 'non-profit', '501c3', 'ngo'],
+    'blockchain': ['blockchain', 'crypto', 'cryptocurrency', 'cryptocurrencies', 'distributed ledger'],
+    'ai': ['ai', 'artificial intelligence', 'machine learning', 'ml'],
+}
+
+# Words that mark a feed entry as a grant opportunity (SwarmFeed)
+GRANT_SIGNAL_KEYWORDS = {
+    'grant': [
+        'grant', 'funding', 'rfp', 'proposal',
+        'application', 'opportunity', 'opportunities', 'award',
+        'bounty', 'bounties', 'prize', 'competition'
+    ],
+}
+
+# Web3 tags added to SWARM feed entries
+WEB3_TAG_KEYWORDS = {
+    'web3': ['web3', 'web 3'],
+    'blockchain': ['blockchain', 'chain'],
+    'defi': ['defi', 'decentralized finance'],
+    'nft': ['nft', 'non-fungible'],
+    'dao': ['dao', 'decentralized autonomous'],
+    'smart-contract': ['smart contract', 'solidity'],
+    'ethereum': ['ethereum', 'eth'],
+    'crypto': ['crypto', 'cryptocurrency', 'cryptocurrencies'],
+}
+
+# Blockchain networks mentioned in SWARM feed entries
+NETWORK_KEYWORDS = {
+    'ethereum': ['ethereum', 'eth', 'evm'],
+    'solana': ['solana', 'sol'],
+    'polygon': ['polygon', 'matic'],
+    'arbitrum': ['arbitrum'],
+    'optimism': ['optimism'],
+    'avalanche': ['avalanche', 'avax'],
+    'cardano': ['cardano', 'ada'],
+}
+
+# Grant types in priority order; the first one found wins
+GRANT_TYPE_KEYWORDS = {
+    'research': ['research'],
+    'development': ['development', 'builder'],
+    'community': ['community', 'communities'],
+    'ecosystem': ['ecosystem'],
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_BOUNDARY_START = r'(?<![a-z0-9])'
+_BOUNDARY_END = r's?(?![a-z0-9])'
+
+
+def normalize_keyword_text(text: str) -> str:
+    """Lowercase and collapse whitespace so multi-word keywords match"""
+    return _WHITESPACE.sub(' ', text.lower())
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation shaped like a trie of the words
+
+    Shared prefixes are factored out so the engine walks each candidate
+    position once instead of retrying every keyword. Longer continuations
+    are tried first, falling back to shorter keywords on a boundary miss.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Compiled word-boundary matcher over several keyword tables"""
+
+    def __init__(self, tables: Dict[str, Dict[str, List[str]]]):
+        """
+        Compile keyword tables
+
+        Args:
+            tables: Keyword tables by name, each mapping a label to its keywords
+        """
+        self.tables = tables
+
+        # keyword -> {table: labels}
+        self.keyword_labels: Dict[str, Dict[str, Set[str]]] = {}
+        for table, mapping in tables.items():
+            for label, keywords in mapping.items():
+                for keyword in keywords:
+                    keyword = normalize_keyword_text(keyword)
+                    self.keyword_labels.setdefault(keyword, {}).setdefault(table, set()).add(label)
+
+        # A match consumes its text, so a keyword also carries the labels of
+        # every keyword inside it ("decentralized finance" implies "decentralized")
+        for keyword, labels in self.keyword_labels.items():
+            for other, other_labels in self.keyword_labels.items():
+                if other != keyword and re.search(
+                    _BOUNDARY_START + re.escape(other) + _BOUNDARY_END, keyword
+                ):
+                    for table, table_labels in other_labels.items():
+                        labels.setdefault(table, set()).update(table_labels)
+
+        self.pattern = re.compile(
+            _BOUNDARY_START + '(' + _trie_pattern(self.keyword_labels) + ')' + _BOUNDARY_END
+        )
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Find every table's labels in one pass over the text
+
+        Args:
+            text: Free text (case and whitespace are normalized)
+
+        Returns:
+            Matched labels by table name (tables without matches omitted)
+        """
+        found: Dict[str, Set[str]] = {}
+        for match in self.pattern.finditer(normalize_keyword_text(text)):
+            for table, labels in self.keyword_labels[match.group(1)].items():
+                found.setdefault(table, set()).update(labels)
+        return found
+
+    def ordered(self, found: Dict[str, Set[str]], table: str) -> List[str]:
+        """Matched labels of one table, in the table's definition order"""
+        labels = found.get(table, set())
+        return [label for label in self.tables[table] if label in labels]
+
+
+# Built once from all keyword tables and shared by every caller
+GRANT_KEYWORDS = KeywordMatcher({
+    'grant_tags': GRANT_TAG_KEYWORDS,
+    'grant_signals': GRANT_SIGNAL_KEYWORDS,
+    'web3_tags': WEB3_TAG_KEYWORDS,
+    'networks': NETWORK_KEYWORDS,
+    'grant_types': GRANT_TYPE_KEYWORDS,
+})
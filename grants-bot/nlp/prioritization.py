@@ -9,24 +9,34 @@ Prioritizes eligible grants based on multiple factors:
 - Success probability
 """
 
+import bisect
+import heapq
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from .deadlines import deadline_ordinal, parse_deadline, urgency_scores
+from .feature_cache import FeatureCache, content_version
+
 
 class GrantPrioritizer:
     """Prioritize grants based on multiple factors"""
     
+    # Grant fields that feed the priority score
+    PRIORITY_FIELDS = ('match_score', 'amount', 'deadline', 'category', 'match_details')
+    
     def __init__(
         self,
-        weights: Optional[Dict[str, float]] = None
+        weights: Optional[Dict[str, float]] = None,
+        feature_cache: Optional[FeatureCache] = None
     ):
         """
         Initialize grant prioritizer
         
         Args:
             weights: Custom weights for prioritization factors
+            feature_cache: Shared feature cache (creates its own if omitted)
         """
         # Default weights (must sum to 1.0)
         self.weights = weights or {
@@ -45,6 +55,9 @@ class GrantPrioritizer:
             for key in self.weights:
                 self.weights[key] /= total_weight
         
+        self.cache = feature_cache or FeatureCache()
+        self.weights_version = content_version(self.weights)
+        
         logger.info("🎯 Initialized GrantPrioritizer")
     
     def prioritize_grants(self, grants: List[Dict]) -> List[Dict]:
@@ -59,10 +72,7 @@ class GrantPrioritizer:
         """
         logger.info(f"📊 Prioritizing {len(grants)} grants...")
         
-        # Calculate priority score for each grant
-        for grant in grants:
-            grant['priority_score'] = self._calculate_priority_score(grant)
-            grant['priority_breakdown'] = self._get_priority_breakdown(grant)
+        self.score_grants(grants)
         
         # Sort by priority score (descending)
         sorted_grants = sorted(
@@ -75,37 +85,65 @@ class GrantPrioritizer:
         
         return sorted_grants
     
-    def _calculate_priority_score(self, grant: Dict) -> float:
+    def score_grants(self, grants: List[Dict]) -> None:
+        """
+        Set priority_score and priority_breakdown on each grant, without sorting
+        
+        Args:
+            grants: List of eligible grants
+        """
+        # Deadline urgency depends on today's date, so it is part of the version
+        now = datetime.utcnow()
+        version = content_version(self.weights_version, now.date())
+        
+        # Urgency for the whole batch at once from the normalized deadlines
+        urgency = urgency_scores([deadline_ordinal(grant) for grant in grants], now)
+        
+        # Calculate each grant's breakdown once and derive its score from it
+        for grant, urgency_score in zip(grants, urgency):
+            key = self.cache.key(version, grant, self.PRIORITY_FIELDS)
+            score, breakdown = self.cache.get_or_compute(
+                'prioritizer',
+                key,
+                lambda: self._score_and_breakdown(grant, urgency_score)
+            )
+            grant['priority_score'] = score
+            grant['priority_breakdown'] = dict(breakdown)
+    
+    def _score_and_breakdown(self, grant: Dict, urgency_score: Optional[float] = None) -> Tuple[float, Dict]:
+        """Priority score and its component breakdown, computed once"""
+        breakdown = self._get_priority_breakdown(grant, urgency_score)
+        return self._score_from_breakdown(breakdown), breakdown
+    
+    def _calculate_priority_score(self, grant: Dict, urgency_score: Optional[float] = None) -> float:
         """
         Calculate overall priority score for a grant
         
         Args:
             grant: Grant opportunity dictionary
+            urgency_score: Precomputed deadline urgency (computed if omitted)
             
         Returns:
             Priority score between 0.0 and 1.0
         """
-        score = 0.0
-        
-        # Match score component
-        match_score = grant.get('match_score', 0.5)
-        score += match_score * self.weights['match_score']
-        
-        # Grant amount component
-        amount_score = self._score_grant_amount(grant.get('amount', 0))
-        score += amount_score * self.weights['grant_amount']
-        
-        # Deadline urgency component
-        urgency_score = self._score_deadline_urgency(grant.get('deadline', ''))
-        score += urgency_score * self.weights['deadline_urgency']
-        
-        # Strategic fit component
-        strategic_score = self._score_strategic_fit(grant)
-        score += strategic_score * self.weights['strategic_fit']
+        return self._score_from_breakdown(self._get_priority_breakdown(grant, urgency_score))
+    
+    def _score_from_breakdown(self, breakdown: Dict) -> float:
+        """
+        Weighted priority score from its components
         
-        # Success probability component
-        success_score = self._score_success_probability(grant)
-        score += success_score * self.weights['success_probability']
+        Args:
+            breakdown: Components from _get_priority_breakdown
+            
+        Returns:
+            Priority score between 0.0 and 1.0
+        """
+        score = 0.0
+        score += breakdown['match_score'] * self.weights['match_score']
+        score += breakdown['amount_score'] * self.weights['grant_amount']
+        score += breakdown['urgency_score'] * self.weights['deadline_urgency']
+        score += breakdown['strategic_score'] * self.weights['strategic_fit']
+        score += breakdown['success_score'] * self.weights['success_probability']
         
         return min(1.0, max(0.0, score))
     
@@ -145,46 +183,8 @@ class GrantPrioritizer:
         Returns:
             Score between 0.0 and 1.0
         """
-        if not deadline_str:
-            return 0.5  # No deadline gets middle score
-        
-        try:
-            # Parse deadline
-            for fmt in ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%m/%d/%Y']:
-                try:
-                    deadline = datetime.strptime(deadline_str.split('T')[0], fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                return 0.5  # Could not parse
-            
-            # Calculate days until deadline
-            days_until = (deadline - datetime.utcnow()).days
-            
-            # Scoring:
-            # < 7 days: 0.3 (too urgent)
-            # 7-14 days: 0.6 (tight but doable)
-            # 14-30 days: 0.8 (good window)
-            # 30-60 days: 1.0 (optimal)
-            # 60-90 days: 0.8 (still good)
-            # > 90 days: 0.6 (less urgent)
-            
-            if days_until < 7:
-                return 0.3
-            elif days_until < 14:
-                return 0.6
-            elif days_until < 30:
-                return 0.8
-            elif days_until <= 60:
-                return 1.0
-            elif days_until <= 90:
-                return 0.8
-            else:
-                return 0.6
-                
-        except Exception:
-            return 0.5
+        ordinal = parse_deadline(deadline_str) if isinstance(deadline_str, str) else None
+        return urgency_scores([ordinal])[0]
     
     def _score_strategic_fit(self, grant: Dict) -> float:
         """
@@ -242,12 +242,13 @@ class GrantPrioritizer:
         
         return probability
     
-    def _get_priority_breakdown(self, grant: Dict) -> Dict:
+    def _get_priority_breakdown(self, grant: Dict, urgency_score: Optional[float] = None) -> Dict:
         """
         Get detailed breakdown of priority score components
         
         Args:
             grant: Grant opportunity dictionary
+            urgency_score: Precomputed deadline urgency (computed if omitted)
             
         Returns:
             Dictionary with score components
@@ -255,7 +256,10 @@ class GrantPrioritizer:
         return {
             'match_score': grant.get('match_score', 0.5),
             'amount_score': self._score_grant_amount(grant.get('amount', 0)),
-            'urgency_score': self._score_deadline_urgency(grant.get('deadline', '')),
+            'urgency_score': (
+                urgency_score if urgency_score is not None
+                else urgency_scores([deadline_ordinal(grant)])[0]
+            ),
             'strategic_score': self._score_strategic_fit(grant),
             'success_score': self._score_success_probability(grant),
         }
@@ -271,8 +275,91 @@ class GrantPrioritizer:
         Returns:
             Top N grants sorted by priority
         """
-        prioritized = self.prioritize_grants(grants)
-        return prioritized[:count]
+        self.score_grants(grants)
+        
+        # Heap selection; same order as sorting everything and slicing
+        return heapq.nlargest(count, grants, key=lambda g: g['priority_score'])
+
+
+class IncrementalRanker:
+    """
+    Keeps grants ranked by priority as new ones arrive
+    
+    Only newly added grants are scored; they are inserted into the existing
+    order by binary search. Everything is rescored once when the date
+    changes, since deadline urgency depends on it.
+    """
+    
+    def __init__(self, prioritizer: GrantPrioritizer):
+        """
+        Initialize incremental ranker
+        
+        Args:
+            prioritizer: Prioritizer used to score grants
+        """
+        self.prioritizer = prioritizer
+        self._keys: List[Tuple[float, int]] = []
+        self._grants: List[Dict] = []
+        self._positions: Dict[str, Tuple[float, int]] = {}
+        self._sequence = 0
+        self._day = datetime.utcnow().date()
+        self.rescored = 0
+    
+    def _insert(self, grant: Dict) -> None:
+        # Ties keep arrival order, like a stable sort
+        key = (-grant['priority_score'], self._sequence)
+        self._sequence += 1
+        index = bisect.bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._grants.insert(index, grant)
+        if grant.get('grant_id'):
+            self._positions[grant['grant_id']] = key
+    
+    def _remove_key(self, key: Tuple[float, int]) -> None:
+        index = bisect.bisect_left(self._keys, key)
+        del self._keys[index]
+        del self._grants[index]
+    
+    def _rescore_if_new_day(self) -> None:
+        today = datetime.utcnow().date()
+        if today == self._day:
+            return
+        self._day = today
+        grants = self._grants
+        self._keys, self._grants, self._positions = [], [], {}
+        self.prioritizer.score_grants(grants)
+        self.rescored += len(grants)
+        for grant in grants:
+            self._insert(grant)
+    
+    def add(self, grants: List[Dict]) -> None:
+        """
+        Score and insert new grants; a grant whose id is already ranked replaces it
+        
+        Args:
+            grants: Newly arrived grants
+        """
+        self._rescore_if_new_day()
+        self.prioritizer.score_grants(grants)
+        for grant in grants:
+            self.remove(grant.get('grant_id'))
+            self._insert(grant)
+    
+    def remove(self, grant_id: Optional[str]) -> bool:
+        """Remove a ranked grant by id, returning whether it was present"""
+        key = self._positions.pop(grant_id, None) if grant_id else None
+        if key is None:
+            return False
+        self._remove_key(key)
+        return True
+    
+    def top(self, count: int = 10) -> List[Dict]:
+        """Highest-priority grants, best first"""
+        self._rescore_if_new_day()
+        return self._grants[:count]
+    
+    def __len__(self) -> int:
+        return len(self._grants)
 
 
 # Example usage
@@ -5,23 +5,75 @@ Matches organization profiles to grant opportunities using NLP and semantic simi
 Tags: web3, women, woman-owned, tech, nonprofit, blockchain, ai
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Sequence, Set
 
 from loguru import logger
 
+from .feature_cache import FeatureCache, content_version
+from .semantic_matcher import SemanticMatcher, profile_narrative
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .keyword_matcher import GRANT_KEYWORDS
+
 
 class ProfileMatcher:
     """Match organization profiles to grant eligibility criteria"""
     
-    def __init__(self, org_profile: Dict):
+    # Score weights: tag overlap 40%, category 30%, legal structure 15%, location 15%
+    TAG_WEIGHT = 0.4
+    CATEGORY_WEIGHT = 0.3
+    LEGAL_WEIGHT = 0.15
+    LOCATION_WEIGHT = 0.15
+    MAX_SCORE = TAG_WEIGHT + CATEGORY_WEIGHT + LEGAL_WEIGHT + LOCATION_WEIGHT
+    
+    # Embedding similarity, added on top of the keyword weights when enabled
+    SEMANTIC_WEIGHT = 0.25
+    
+    # Categories that match any organization
+    MATCHING_CATEGORIES = frozenset({
+        'web3', 'blockchain', 'crypto',
+        'tech', 'technology', 'digital',
+        'women', 'women_in_tech',
+        'nonprofit', 'social_impact'
+    })
+    
+    # Grant fields that feed extract_features
+    FEATURE_FIELDS = (
+        'title', 'description', 'tags', 'eligibility', 'category',
+        'legal_requirements', 'geographic_restrictions',
+    )
+    
+    def __init__(
+        self,
+        org_profile: Dict,
+        feature_cache: Optional[FeatureCache] = None,
+        semantic_matcher: Optional[SemanticMatcher] = None
+    ):
         """
         Initialize profile matcher
         
         Args:
             org_profile: Organization profile with tags and metadata
+            feature_cache: Shared feature cache (creates its own if omitted)
+            semantic_matcher: Shared embedding matcher; adds a semantic
+                similarity component to the score when given
         """
         self.org_profile = org_profile
         self.org_tags = set(org_profile.get('tags', []))
+        self.cache = feature_cache or FeatureCache()
+        self.semantic = semantic_matcher
+        self.max_score = self.MAX_SCORE + (self.SEMANTIC_WEIGHT if semantic_matcher else 0.0)
+        self._profile_vector = None
+        self.version = content_version(
+            sorted(self.org_tags),
+            org_profile.get('legal_structure', ''),
+            org_profile.get('location', ''),
+            [semantic_matcher.model_name, profile_narrative(org_profile)] if semantic_matcher else None
+        )
         
         logger.info(f"🎯 Initialized ProfileMatcher with tags: {self.org_tags}")
     
@@ -35,45 +87,128 @@ class ProfileMatcher:
         Returns:
             Match score between 0.0 and 1.0
         """
-        score = 0.0
-        max_score = 0.0
+        return self.score_features(self.extract_features(grant))
+    
+    def extract_features(self, grant: Dict) -> Dict:
+        """
+        Extract the scoring features of a grant (all text processing happens here)
+        
+        Results are cached by grant content and profile; treat them as read-only.
         
-        # Extract grant tags/keywords
+        Args:
+            grant: Grant opportunity dictionary
+            
+        Returns:
+            Grant tags, tag overlap with the organization and match flags
+        """
+        key = self.cache.key(self.version, grant, self.FEATURE_FIELDS)
+        return self.cache.get_or_compute('profile_matcher', key, lambda: self._compute_features(grant))
+    
+    def _compute_features(self, grant: Dict) -> Dict:
+        """Extract features without the cache"""
         grant_tags = self._extract_grant_tags(grant)
+        features = {
+            'grant_tags': grant_tags,
+            'tag_overlap': len(self.org_tags & grant_tags),
+            'category_match': self._category_matches(grant.get('category', '').lower()),
+            'legal_match': self._legal_structure_matches(grant),
+            'location_match': self._location_matches(grant),
+        }
+        if self.semantic is not None:
+            features['semantic_score'] = float(self.semantic.similarity(self.profile_vector, [grant])[0])
+        return features
+    
+    @property
+    def profile_vector(self):
+        """Embedding of the organization narrative (computed on first use)"""
+        if self._profile_vector is None:
+            self._profile_vector = self.semantic.embed_profile(self.org_profile)
+        return self._profile_vector
+    
+    def prepare(self, grants: List[Dict]) -> None:
+        """
+        Embed a batch of grants up front so per-grant feature extraction
+        finds their vectors in the index instead of calling the model one by one
+        
+        Args:
+            grants: Grants about to be scored
+        """
+        if self.semantic is not None:
+            self.semantic.embed_grants(grants)
+    
+    def semantic_top_k(self, k: int = 10) -> List[tuple]:
+        """
+        Indexed grants most similar to the organization narrative
+        
+        Args:
+            k: Number of results
+            
+        Returns:
+            (grant_id, cosine similarity) pairs, best first (empty without a semantic matcher)
+        """
+        if self.semantic is None:
+            return []
+        return self.semantic.top_k(self.profile_vector, k)
+    
+    def score_features(self, features: Dict) -> float:
+        """Weighted match score from extracted features"""
+        score = 0.0
+        
+        # Tag overlap score
+        if features['grant_tags']:
+            tag_score = features['tag_overlap'] / len(features['grant_tags'])
+            score += tag_score * self.TAG_WEIGHT
+        
+        # Category, legal structure and location matches
+        if features['category_match']:
+            score += self.CATEGORY_WEIGHT
+        if features['legal_match']:
+            score += self.LEGAL_WEIGHT
+        if features['location_match']:
+            score += self.LOCATION_WEIGHT
         
-        # Tag overlap score (40% weight)
-        tag_weight = 0.4
-        if grant_tags:
-            tag_overlap = len(self.org_tags & grant_tags)
-            tag_score = tag_overlap / len(grant_tags)
-            score += tag_score * tag_weight
-        max_score += tag_weight
-        
-        # Category match (30% weight)
-        category_weight = 0.3
-        category = grant.get('category', '').lower()
-        if self._category_matches(category):
-            score += category_weight
-        max_score += category_weight
-        
-        # Legal structure match (15% weight)
-        legal_weight = 0.15
-        if self._legal_structure_matches(grant):
-            score += legal_weight
-        max_score += legal_weight
-        
-        # Location match (15% weight)
-        location_weight = 0.15
-        if self._location_matches(grant):
-            score += location_weight
-        max_score += location_weight
+        # Semantic similarity (only present when a semantic matcher is set)
+        if 'semantic_score' in features:
+            score += features['semantic_score'] * self.SEMANTIC_WEIGHT
         
         # Normalize score
-        final_score = score / max_score if max_score > 0 else 0.0
+        return score / self.max_score
+    
+    def score_batch(self, features: List[Dict]) -> Sequence[float]:
+        """
+        Score many grants' features in one vectorized step
+        
+        Produces exactly the scores of score_features: the same float
+        operations run in the same order, only element-wise.
+        
+        Args:
+            features: Features from extract_features, one per grant
+            
+        Returns:
+            NumPy array of match scores (a list if NumPy is not installed)
+        """
+        if np is None:
+            return [self.score_features(f) for f in features]
+        
+        count = len(features)
+        overlap = np.fromiter((f['tag_overlap'] for f in features), dtype=np.float64, count=count)
+        tag_counts = np.fromiter((len(f['grant_tags']) for f in features), dtype=np.float64, count=count)
+        category = np.fromiter((f['category_match'] for f in features), dtype=bool, count=count)
+        legal = np.fromiter((f['legal_match'] for f in features), dtype=bool, count=count)
+        location = np.fromiter((f['location_match'] for f in features), dtype=bool, count=count)
         
-        return final_score
+        tag_score = np.divide(overlap, tag_counts, out=np.zeros(count), where=tag_counts > 0)
+        score = tag_score * self.TAG_WEIGHT
+        score += np.where(category, self.CATEGORY_WEIGHT, 0.0)
+        score += np.where(legal, self.LEGAL_WEIGHT, 0.0)
+        score += np.where(location, self.LOCATION_WEIGHT, 0.0)
+        if self.semantic is not None:
+            semantic = np.fromiter((f.get('semantic_score', 0.0) for f in features), dtype=np.float64, count=count)
+            score += semantic * self.SEMANTIC_WEIGHT
+        return score / self.max_score
     
-    def _extract_grant_tags(self, grant: Dict) -> Set[str]:
+    @staticmethod
+    def _extract_grant_tags(grant: Dict) -> Set[str]:
         """Extract and normalize tags from grant"""
         tags = set()
         
@@ -93,47 +228,29 @@ class ProfileMatcher:
         if 'category' in grant:
             tags.add(grant['category'].lower())
         
-        # Extract from title and description using keywords
-        text = (
-            grant.get('title', '') + ' ' +
-            grant.get('description', '')
-        ).lower()
-        
-        keyword_mappings = {
-            'web3': ['web3', 'web 3', 'decentralized'],
-            'women': ['women', 'woman', 'female', 'ladies'],
-            'woman-owned': ['woman-owned', 'women-owned', 'female-founded'],
-            'tech': ['tech', 'technology', 'digital'],
-            'nonprofit': ['nonprofit', 'non-profit', '501c3', 'ngo'],
-            'blockchain': ['blockchain', 'crypto', 'distributed ledger'],
-            'ai': ['ai', 'artificial intelligence', 'machine learning', 'ml'],
-        }
-        
-        for tag, keywords in keyword_mappings.items():
-            if any(keyword in text for keyword in keywords):
-                tags.add(tag)
+        # Extract from title and description in one keyword pass
+        text = grant.get('title', '') + ' ' + grant.get('description', '')
+        tags.update(GRANT_KEYWORDS.scan(text).get('grant_tags', ()))
         
         return tags
     
     def _category_matches(self, category: str) -> bool:
         """Check if grant category matches organization"""
-        matching_categories = {
-            'web3', 'blockchain', 'crypto',
-            'tech', 'technology', 'digital',
-            'women', 'women_in_tech',
-            'nonprofit', 'social_impact'
-        }
-        
         # Check if any org tag matches category
         if category in self.org_tags:
             return True
         
         # Check if category is in matching set
-        return category in matching_categories
+        return category in self.MATCHING_CATEGORIES
     
     def _legal_structure_matches(self, grant: Dict) -> bool:
         """Check if legal structure matches grant requirements"""
-        org_structure = self.org_profile.get('legal_structure', '').lower()
+        return self.legal_structure_matches(self.org_profile.get('legal_structure', ''), grant)
+    
+    @staticmethod
+    def legal_structure_matches(legal_structure: str, grant: Dict) -> bool:
+        """Check if an organization legal structure meets grant requirements"""
+        org_structure = legal_structure.lower()
         grant_requirements = grant.get('legal_requirements', [])
         
         if not grant_requirements:
@@ -157,7 +274,12 @@ class ProfileMatcher:
     
     def _location_matches(self, grant: Dict) -> bool:
         """Check if location matches grant geographic restrictions"""
-        org_location = self.org_profile.get('location', '').lower()
+        return self.location_matches(self.org_profile.get('location', ''), grant)
+    
+    @staticmethod
+    def location_matches(location: str, grant: Dict) -> bool:
+        """Check if an organization location meets grant geographic restrictions"""
+        org_location = location.lower()
         grant_locations = grant.get('geographic_restrictions', [])
         
         if not grant_locations:
@@ -198,19 +320,21 @@ class ProfileMatcher:
         Returns:
             Dictionary with match score and details
         """
-        score = self.calculate_match_score(grant)
-        grant_tags = self._extract_grant_tags(grant)
-        matching_tags = self.org_tags & grant_tags
-        
+        features = self.extract_features(grant)
+        return self.details_from_features(grant, features, self.score_features(features))
+    
+    def details_from_features(self, grant: Dict, features: Dict, score: float) -> Dict:
+        """Match details for a grant whose features were already extracted and scored"""
         return {
             'match_score': score,
             'is_eligible': score >= 0.3,
             'org_tags': list(self.org_tags),
-            'grant_tags': list(grant_tags),
-            'matching_tags': list(matching_tags),
+            'grant_tags': list(features['grant_tags']),
+            'matching_tags': list(self.org_tags & features['grant_tags']),
             'category_match': self._category_matches(grant.get('category', '')),
-            'legal_match': self._legal_structure_matches(grant),
-            'location_match': self._location_matches(grant),
+            'legal_match': features['legal_match'],
+            'location_match': features['location_match'],
+            'semantic_score': features.get('semantic_score'),
         }
 
 
@@ -0,0 +1,338 @@
+"""
+Semantic Grant Matcher
+
+Optional embedding-based matching beyond the hand-written keyword tables.
+Grant title + description and the organization's profile narrative are
+embedded with a small CPU-friendly sentence-transformers model. Grant
+vectors are cached by content hash in a bounded, local brute-force NumPy
+vector index that also serves top-K retrieval for a profile.
+"""
+
+import hashlib
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def grant_text(grant: Dict) -> str:
+    """Text embedded for a grant"""
+    return f"{grant.get('title', '')}\n{grant.get('description', '')}".strip()
+
+
+def profile_narrative(org_profile: Dict) -> str:
+    """Text embedded for an organization (its narrative, or one built from the profile)"""
+    if org_profile.get('narrative'):
+        return org_profile['narrative']
+    parts = [
+        org_profile.get('name', ''),
+        ', '.join(org_profile.get('tags', [])),
+        org_profile.get('legal_structure', ''),
+        org_profile.get('location', ''),
+    ]
+    return '. '.join(part for part in parts if part)
+
+
+class VectorIndex:
+    """
+    Bounded brute-force cosine index over unit vectors, keyed by content hash
+
+    Each vector is labelled with every grant id whose content it embeds.
+    Once max_size vectors are stored, the least recently used quarter is
+    evicted; retain() drops vectors for content no longer in use.
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024, max_size: int = 50000):
+        """
+        Initialize vector index
+
+        Args:
+            dim: Vector dimension
+            capacity: Initial rows allocated (grows by doubling up to max_size)
+            max_size: Most vectors kept
+        """
+        self.dim = dim
+        self.max_size = max(1, max_size)
+        capacity = min(capacity, self.max_size)
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._used = np.zeros(capacity, dtype=np.int64)
+        self._clock = 0
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._labels: List[Set[str]] = []
+        self._label_rows: Dict[str, int] = {}
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def _touch(self, row: int) -> None:
+        self._clock += 1
+        self._used[row] = self._clock
+
+    def get(self, key: str):
+        """Stored vector for a content hash (a view; copy it to keep it across adds)"""
+        row = self._rows[key]
+        self._touch(row)
+        return self._vectors[row]
+
+    def add(self, key: str, vector, label: Optional[str] = None) -> None:
+        """Store a unit vector under a content hash, optionally labelled with a grant id"""
+        row = self._rows.get(key)
+        if row is None:
+            if len(self._keys) >= self.max_size:
+                self._evict()
+            row = len(self._keys)
+            if row == len(self._vectors):
+                size = min(2 * len(self._vectors), self.max_size)
+                grown = np.zeros((size, self.dim), dtype=np.float32)
+                grown[:row] = self._vectors
+                self._vectors = grown
+                self._used = np.concatenate([self._used, np.zeros(size - row, dtype=np.int64)])
+            self._rows[key] = row
+            self._keys.append(key)
+            self._labels.append(set())
+            self._vectors[row] = vector
+        self._touch(row)
+        if label is not None:
+            self.label(key, label)
+
+    def label(self, key: str, label: str) -> None:
+        """Add a grant id to a vector's labels, moving it off the vector of its old content"""
+        row = self._rows[key]
+        previous = self._label_rows.get(label)
+        if previous is not None and previous != row:
+            self._labels[previous].discard(label)
+        self._labels[row].add(label)
+        self._label_rows[label] = row
+
+    def labels(self, key: str) -> Set[str]:
+        """Grant ids whose content a vector embeds"""
+        return set(self._labels[self._rows[key]])
+
+    def retain(self, keys: Iterable[str]) -> int:
+        """
+        Drop every vector whose content hash is not in keys
+
+        Args:
+            keys: Content hashes still in use (e.g. of the current grant set)
+
+        Returns:
+            Number of vectors dropped
+        """
+        wanted = set(keys)
+        keep = [row for row, key in enumerate(self._keys) if key in wanted]
+        dropped = len(self._keys) - len(keep)
+        if dropped:
+            self._compact(np.asarray(keep, dtype=np.int64))
+        return dropped
+
+    def _evict(self) -> None:
+        """Drop the least recently used quarter of the vectors"""
+        count = len(self._keys)
+        keep = np.argsort(-self._used[:count], kind='stable')[:count - max(1, count // 4)]
+        self._compact(np.sort(keep))
+        self.evicted += count - len(keep)
+
+    def _compact(self, keep) -> None:
+        """Keep only the given rows (ascending), renumbering them from 0"""
+        size = len(keep)
+        self._vectors[:size] = self._vectors[keep]
+        self._used[:size] = self._used[keep]
+        self._keys = [self._keys[row] for row in keep]
+        self._labels = [self._labels[row] for row in keep]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._label_rows = {label: row for row, labels in enumerate(self._labels) for label in labels}
+
+    def search(self, query, k: int = 10) -> List[Tuple[Optional[str], float]]:
+        """
+        Top-K most similar grants
+
+        Args:
+            query: Unit query vector
+            k: Number of results
+
+        Returns:
+            (grant id, cosine similarity) pairs, most similar first; grants
+            with identical content share a score, and unlabelled vectors
+            are returned with a None id
+        """
+        count = len(self._keys)
+        if count == 0 or k <= 0:
+            return []
+        scores = self._vectors[:count] @ np.asarray(query, dtype=np.float32)
+        rows = min(k, count)
+        top = np.argpartition(-scores, rows - 1)[:rows]
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        results = []
+        for row in top:
+            for label in sorted(self._labels[row]) or [None]:
+                results.append((label, float(scores[row])))
+        return results[:k]
+
+
+class SemanticMatcher:
+    """Embedding similarity between grants and organization profiles"""
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        encoder: Optional[Callable[[List[str]], Sequence]] = None,
+        batch_size: int = 32,
+        max_indexed: int = 50000
+    ):
+        """
+        Initialize semantic matcher
+
+        Args:
+            model_name: sentence-transformers model, loaded on first use
+            encoder: Custom function embedding a list of texts (replaces the model)
+            batch_size: Texts embedded per model call
+            max_indexed: Grant vectors kept in the index (least recently
+                used are evicted beyond this)
+        """
+        if np is None:
+            raise RuntimeError("numpy is not installed")
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_indexed = max_indexed
+        self._encoder = encoder
+        self.index: Optional[VectorIndex] = None
+        self.stats = {'embedded': 0, 'cache_hits': 0}
+
+    def _encode(self, texts: List[str]):
+        """Embed texts as unit vectors"""
+        if self._encoder is None:
+            # Imported on first use: it pulls in torch, which only semantic matching needs
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise RuntimeError("sentence-transformers is not installed")
+            model = SentenceTransformer(self.model_name, device="cpu")
+            logger.info(f"🧠 Loaded embedding model {self.model_name}")
+            self._encoder = lambda batch: model.encode(
+                batch, batch_size=self.batch_size, convert_to_numpy=True
+            )
+
+        vectors = np.asarray(self._encoder(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Index key for an embedded text"""
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def embed_grants(self, grants: List[Dict]):
+        """
+        Vectors for grants, embedding only content not seen before
+
+        New content is embedded in one batch and added to the index, and
+        each grant id is added to its vector's labels.
+
+        Args:
+            grants: Grant dictionaries
+
+        Returns:
+            Array of unit vectors, one row per grant
+        """
+        if not grants:
+            return np.zeros((0, self.index.dim if self.index else 0), dtype=np.float32)
+
+        keys = []
+        found: Dict[str, object] = {}
+        missing: Dict[str, str] = {}
+        for grant in grants:
+            text = grant_text(grant)
+            key = self.content_hash(text)
+            keys.append(key)
+            if key in found or key in missing:
+                continue
+            if self.index is not None and key in self.index:
+                # Copied now: adding new vectors below may evict or move rows
+                found[key] = self.index.get(key).copy()
+            else:
+                missing[key] = text
+
+        if missing:
+            vectors = self._encode(list(missing.values()))
+            if self.index is None:
+                self.index = VectorIndex(vectors.shape[1], max_size=self.max_indexed)
+            for key, vector in zip(missing, vectors):
+                self.index.add(key, vector)
+                found[key] = vector
+            self.stats['embedded'] += len(missing)
+        self.stats['cache_hits'] += len(grants) - len(missing)
+
+        for grant, key in zip(grants, keys):
+            if grant.get('grant_id') and key in self.index:
+                self.index.label(key, grant['grant_id'])
+        return np.stack([found[key] for key in keys])
+
+    def retain(self, grants: List[Dict]) -> int:
+        """
+        Drop indexed vectors for content none of the grants have
+
+        Args:
+            grants: Current grant set
+
+        Returns:
+            Number of vectors dropped
+        """
+        if self.index is None:
+            return 0
+        dropped = self.index.retain(self.content_hash(grant_text(grant)) for grant in grants)
+        if dropped:
+            logger.info(f"🧠 Dropped {dropped} vectors for grants no longer discovered")
+        return dropped
+
+    def embed_profile(self, org_profile: Dict):
+        """Unit vector for an organization profile narrative"""
+        return self._encode([profile_narrative(org_profile)])[0]
+
+    def similarity(self, profile_vector, grants: List[Dict]):
+        """
+        Semantic match scores between a profile and grants
+
+        Args:
+            profile_vector: Vector from embed_profile
+            grants: Grant dictionaries
+
+        Returns:
+            Array of scores in [0, 1] (negative cosine similarity clips to 0)
+        """
+        vectors = self.embed_grants(grants)
+        return np.clip(vectors @ profile_vector, 0.0, 1.0).astype(np.float64)
+
+    def top_k(self, profile_vector, k: int = 10) -> List[Tuple[Optional[str], float]]:
+        """
+        Grants in the index most similar to a profile
+
+        Args:
+            profile_vector: Vector from embed_profile
+            k: Number of results
+
+        Returns:
+            (grant_id, cosine similarity) pairs, best first
+        """
+        if self.index is None:
+            return []
+        return self.index.search(profile_vector, k)
+
+    def get_stats(self) -> Dict:
+        """Get embedding statistics"""
+        return dict(
+            self.stats,
+            model=self.model_name,
+            indexed=len(self.index) if self.index is not None else 0,
+            evicted=self.index.evicted if self.index is not None else 0
+        )
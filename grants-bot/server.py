@@ -4,10 +4,17 @@ SWARM Grant Bot - FastAPI Server
 Provides REST API endpoints for grant automation.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+import asyncio
+import hmac
+import ipaddress
+import json
+import socket
 import uvicorn
 
 from grants_bot import GrantBot
@@ -30,29 +37,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Grant Bot (single tenant for now)
+# Initialize Grant Bot; further tenants share its source layer
 bot = GrantBot(tenant_id=config.tenant.default_tenant_id)
 
 
 # Request/Response Models
 class DiscoverRequest(BaseModel):
     use_cache: bool = False
+    tenant_id: Optional[str] = None
 
 
 class FilterRequest(BaseModel):
     min_match_score: Optional[float] = 0.3
     categories: Optional[List[str]] = None
+    tenant_id: Optional[str] = None
 
 
 class DraftRequest(BaseModel):
     grant_id: str
     use_llm: bool = False
+    tenant_id: Optional[str] = None
 
 
 class SubmitRequest(BaseModel):
     grant_id: str
     application_id: str
     method: str = "api"
+    tenant_id: Optional[str] = None
+
+
+class TenantRequest(BaseModel):
+    tenant_id: str
+    org_profile: Optional[Dict] = None
+    rss_feeds: Optional[List[str]] = None
+    sources: Optional[List[str]] = None
+    categories: Optional[List[str]] = None
+    min_match_score: float = 0.3
+    weights: Optional[Dict[str, float]] = None
+
+
+def require_tenant(tenant_id: Optional[str]) -> None:
+    """Reject requests for tenants that are not registered"""
+    if tenant_id and tenant_id not in bot.tenants.tenants:
+        raise HTTPException(status_code=404, detail="Tenant not found")
+
+
+def require_admin(x_api_key: Optional[str] = Header(None)) -> None:
+    """Reject admin requests without the configured admin API key"""
+    if not config.api.admin_api_key:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (ADMIN_API_KEY is not set)")
+    if not x_api_key or not hmac.compare_digest(x_api_key, config.api.admin_api_key):
+        raise HTTPException(status_code=401, detail="Invalid API key")
+
+
+async def validate_feed_url(url: str) -> None:
+    """
+    Reject feed URLs the server should not fetch
+
+    Only http(s) URLs whose host resolves to public addresses are allowed,
+    so tenants cannot point the fetcher at internal services.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise HTTPException(status_code=400, detail=f"Feed URL must be http(s) with a host: {url}")
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(parts.hostname, parts.port or None)
+    except (socket.gaierror, ValueError):
+        raise HTTPException(status_code=400, detail=f"Feed host does not resolve: {parts.hostname}")
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split('%')[0])
+        if not address.is_global:
+            raise HTTPException(status_code=400, detail=f"Feed host is not a public address: {parts.hostname}")
+
+
+@app.on_event("startup")
+async def startup():
+    """Start background RSS feed polling"""
+    bot.source_manager.start_polling()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop feed polling and close pooled source connections"""
+    await bot.close()
 
 
 # API Endpoints
@@ -85,8 +152,9 @@ async def discover_grants(request: DiscoverRequest):
     
     Returns list of grant opportunities
     """
+    require_tenant(request.tenant_id)
     try:
-        grants = await bot.discover_grants(use_cache=request.use_cache)
+        grants = await bot.discover_grants(use_cache=request.use_cache, tenant_id=request.tenant_id)
         return {
             "success": True,
             "count": len(grants),
@@ -96,6 +164,35 @@ async def discover_grants(request: DiscoverRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/grants/discover/stream")
+async def stream_grants(format: str = "ndjson", tenant_id: Optional[str] = None):
+    """
+    Stream grants as each source finishes
+    
+    Emits one JSON grant per line (format=ndjson) or one `grant` event per
+    grant (format=sse), followed by a final `done` record with the count.
+    """
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    require_tenant(tenant_id)
+    
+    def encode(event: str, data: dict) -> str:
+        payload = json.dumps(data, default=str)
+        if format == "sse":
+            return f"event: {event}\ndata: {payload}\n\n"
+        return payload + "\n"
+    
+    async def events():
+        count = 0
+        async for grant in bot.stream_grants(tenant_id=tenant_id):
+            count += 1
+            yield encode("grant", grant)
+        yield encode("done", {"done": True, "count": count})
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type)
+
+
 @app.post("/api/grants/eligible")
 async def get_eligible_grants(request: FilterRequest):
     """
@@ -103,19 +200,20 @@ async def get_eligible_grants(request: FilterRequest):
     
     Returns filtered and prioritized grants
     """
+    require_tenant(request.tenant_id)
     try:
         # Discover grants
-        grants = await bot.discover_grants(use_cache=True)
-        
-        # Filter for eligibility
-        eligible = await bot.filter_eligible(grants)
+        grants = await bot.discover_grants(use_cache=True, tenant_id=request.tenant_id)
         
-        # Apply additional filters if specified
-        if request.categories:
-            eligible = [g for g in eligible if g.get('category') in request.categories]
+        # Filter for eligibility and any requested categories in one pass
+        eligible = await bot.filter_eligible(
+            grants,
+            tenant_id=request.tenant_id,
+            categories=request.categories or None
+        )
         
         # Prioritize
-        prioritized = await bot.prioritize_grants(eligible)
+        prioritized = await bot.prioritize_grants(eligible, tenant_id=request.tenant_id)
         
         return {
             "success": True,
@@ -127,12 +225,41 @@ async def get_eligible_grants(request: FilterRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/tenants", dependencies=[Depends(require_admin)])
+async def register_tenant(request: TenantRequest):
+    """Register a tenant on the shared source layer (admin API key required)"""
+    for feed_url in request.rss_feeds or ():
+        await validate_feed_url(feed_url)
+    tenant = bot.register_tenant(
+        request.tenant_id,
+        request.org_profile,
+        rss_feeds=request.rss_feeds,
+        sources=request.sources,
+        categories=request.categories,
+        min_match_score=request.min_match_score,
+        weights=request.weights
+    )
+    return {
+        "success": True,
+        "tenant": tenant.get_info()
+    }
+
+
+@app.get("/api/tenants")
+async def list_tenants():
+    """List registered tenants"""
+    return {
+        "success": True,
+        "tenants": [tenant.get_info() for tenant in bot.tenants.tenants.values()]
+    }
+
+
 @app.get("/api/grants/{grant_id}")
-async def get_grant(grant_id: str):
+async def get_grant(grant_id: str, tenant_id: Optional[str] = None):
     """Get details for a specific grant"""
+    require_tenant(tenant_id)
     try:
-        grants = await bot.discover_grants(use_cache=True)
-        grant = next((g for g in grants if g.get('grant_id') == grant_id), None)
+        grant = await bot.get_grant(grant_id, tenant_id=tenant_id)
         
         if not grant:
             raise HTTPException(status_code=404, detail="Grant not found")
@@ -154,10 +281,10 @@ async def draft_application(request: DraftRequest):
     
     Returns drafted application content
     """
+    require_tenant(request.tenant_id)
     try:
         # Get grant
-        grants = await bot.discover_grants(use_cache=True)
-        grant = next((g for g in grants if g.get('grant_id') == request.grant_id), None)
+        grant = await bot.get_grant(request.grant_id, tenant_id=request.tenant_id)
         
         if not grant:
             raise HTTPException(status_code=404, detail="Grant not found")
@@ -182,10 +309,10 @@ async def submit_application(request: SubmitRequest):
     
     Returns submission confirmation
     """
+    require_tenant(request.tenant_id)
     try:
         # Get grant
-        grants = await bot.discover_grants(use_cache=True)
-        grant = next((g for g in grants if g.get('grant_id') == request.grant_id), None)
+        grant = await bot.get_grant(request.grant_id, tenant_id=request.tenant_id)
         
         if not grant:
             raise HTTPException(status_code=404, detail="Grant not found")
@@ -6,10 +6,31 @@ from .rss_discovery import RSSDiscovery
 from .api_integrations import APIIntegrations
 from .swarm_feed import SwarmFeed
 from .source_manager import SourceManager
+from .http_client import HTTPClientPool
+from .feed_scheduler import FeedScheduler
+from .feed_crawler import FeedCrawler, FeedLinkParser
+from .parse_pool import FeedParsePool
+from .dedup_index import DuplicateIndex
+from .resilience import CircuitBreaker, CircuitOpenError
+from .grants_gov_sync import GrantsGovSync
+from .grant_store import GrantStore, SQLiteGrantStore, MongoGrantStore, create_grant_store
 
 __all__ = [
     "RSSDiscovery",
     "APIIntegrations", 
+    "GrantsGovSync",
     "SwarmFeed",
     "SourceManager",
+    "HTTPClientPool",
+    "FeedScheduler",
+    "FeedCrawler",
+    "FeedLinkParser",
+    "FeedParsePool",
+    "DuplicateIndex",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "GrantStore",
+    "SQLiteGrantStore",
+    "MongoGrantStore",
+    "create_grant_store",
 ]
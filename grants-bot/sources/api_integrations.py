@@ -11,87 +11,74 @@ Connectors for various grant database APIs including:
 
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-import httpx
 from loguru import logger
 
+from .http_client import HTTPClientPool
+from .grant_store import GrantStore
+from .grants_gov_sync import GrantsGovSync
+
 
 class APIIntegrations:
     """API integrations for grant database platforms"""
     
-    def __init__(self, api_keys: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        api_keys: Optional[Dict[str, str]] = None,
+        http_client: Optional[HTTPClientPool] = None,
+        grant_store: Optional[GrantStore] = None,
+        tenant_id: str = "default",
+        grants_gov_page_size: int = 100,
+        grants_gov_concurrency: int = 4
+    ):
         """
         Initialize API integrations
         
         Args:
             api_keys: Dictionary of API keys by source name
+            http_client: Shared HTTP client pool (creates its own if omitted)
+            grant_store: Store for sync checkpoints (in-memory only if omitted)
+            tenant_id: Tenant the sync checkpoints belong to
+            grants_gov_page_size: Opportunities per Grants.gov page
+            grants_gov_concurrency: Grants.gov pages fetched concurrently
         """
         self.api_keys = api_keys or {}
+        self.http = http_client or HTTPClientPool()
+        self.grants_gov = GrantsGovSync(
+            self.http,
+            page_size=grants_gov_page_size,
+            max_concurrency=grants_gov_concurrency,
+            grant_store=grant_store,
+            tenant_id=tenant_id
+        )
         
     async def fetch_grants_gov(self, api_key: Optional[str] = None) -> List[Dict]:
         """
         Fetch grants from Grants.gov API
         
+        Runs an incremental sync: only opportunities modified since the
+        persisted cursor are fetched, merged into the synced set.
+        
         Args:
             api_key: Grants.gov API key
             
         Returns:
-            List of grant opportunities
+            List of open Grants.gov opportunities
         """
-        grants = []
         key = api_key or self.api_keys.get('grants_gov')
         
         if not key:
             logger.warning("⚠️ Grants.gov API key not configured")
-            return grants
+            return []
         
         try:
-            # Grants.gov API endpoint (stub - real implementation needed)
-            url = "https://www.grants.gov/grantsws/rest/opportunities/search"
-            
-            params = {
-                'oppStatus': 'forecasted|posted',
-                'rows': 100,
-                'oppNum': '',
-            }
-            
-            headers = {
-                'Authorization': f'Bearer {key}',
-                'Accept': 'application/json'
-            }
-            
-            async with httpx.AsyncClient(timeout=30) as client:
-                logger.info("📡 Fetching grants from Grants.gov")
-                response = await client.get(url, params=params, headers=headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Parse response (structure depends on actual API)
-                    for item in data.get('opportunities', []):
-                        grant = {
-                            'source': 'grants_gov',
-                            'source_name': 'Grants.gov',
-                            'category': 'government',
-                            'grant_id': item.get('opportunityID', ''),
-                            'title': item.get('opportunityTitle', ''),
-                            'description': item.get('description', ''),
-                            'agency': item.get('agencyName', ''),
-                            'amount': item.get('awardCeiling', 0),
-                            'deadline': item.get('closeDate', ''),
-                            'link': item.get('opportunityURL', ''),
-                            'eligibility': item.get('eligibility', []),
-                            'discovered_at': datetime.utcnow().isoformat(),
-                        }
-                        grants.append(grant)
-                    
-                    logger.info(f"✅ Fetched {len(grants)} grants from Grants.gov")
-                else:
-                    logger.error(f"❌ Grants.gov API error: {response.status_code}")
-                    
+            grants = await self.grants_gov.sync(key)
+            logger.info(f"✅ Fetched {len(grants)} grants from Grants.gov")
         except Exception as e:
-            logger.error(f"❌ Error fetching Grants.gov: {e}")
+            # Serve the last synced opportunities; the cursor was not advanced
+            logger.error(f"❌ Error syncing Grants.gov: {e}")
+            grants = self.grants_gov.get_grants()
             
         return grants
     
@@ -244,6 +231,31 @@ class APIIntegrations:
         logger.info(f"🎯 Total grants from APIs: {len(all_grants)}")
         return all_grants
     
+    def source_calls(self) -> List[Tuple[str, Callable[[], Awaitable[List[Dict]]]]]:
+        """
+        Name and fetch function of every configured API source
+        
+        Unlike fetch_all_sources, each source is separate and raises on
+        failure, so callers can track (and circuit-break) them one by one.
+        
+        Returns:
+            List of (source name, zero-argument coroutine function) pairs
+        """
+        calls = [
+            ('api:web3', self.fetch_web3_grants),
+            ('api:women_tech', self.fetch_women_tech_grants),
+            ('api:nonprofit', self.fetch_nonprofit_grants),
+        ]
+        if self.api_keys.get('grants_gov'):
+            calls.append(('api:grants_gov', self._sync_grants_gov))
+        return calls
+    
+    async def _sync_grants_gov(self) -> List[Dict]:
+        """Run an incremental Grants.gov sync, raising on failure"""
+        grants = await self.grants_gov.sync(self.api_keys['grants_gov'])
+        logger.info(f"✅ Fetched {len(grants)} grants from Grants.gov")
+        return grants
+    
     def add_api_key(self, source: str, key: str) -> None:
         """Add API key for a source"""
         self.api_keys[source] = key
@@ -0,0 +1,253 @@
+"""
+Near-Duplicate Grant Index
+
+Detects the same opportunity arriving from several sources (Grants.gov,
+RSS aggregators, SWARM) under slightly different titles. Exact matches are
+found through normalized link/title keys; near-duplicates through MinHash
+signatures over title+description shingles, bucketed with LSH banding so
+each grant is only compared against a handful of candidates.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+# Mersenne prime used by the MinHash universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_BRACKET_TAG = re.compile(r'\[[^\]]*\]')
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+# Query parameters that never identify an opportunity
+_TRACKING_PARAMS = ('utm_', 'ref', 'fbclid', 'gclid')
+
+# Fields copied onto source references when duplicates are merged
+_REFERENCE_FIELDS = ('source', 'source_name', 'feed_url', 'link', 'grant_id')
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop [bracketed] tags and collapse punctuation to spaces"""
+    text = _BRACKET_TAG.sub(' ', (text or '').lower())
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def normalize_link(link: str) -> str:
+    """
+    Canonical form of a grant URL
+
+    Drops scheme, leading www., trailing slashes, fragments and tracking
+    query parameters so http/https and campaign-tagged links compare equal.
+    """
+    if not link:
+        return ''
+    parsed = urlparse(link.strip().lower())
+    host = parsed.netloc[4:] if parsed.netloc.startswith('www.') else parsed.netloc
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query)
+        if not key.startswith(_TRACKING_PARAMS)
+    ))
+    path = parsed.path.rstrip('/')
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def source_reference(grant: Dict) -> Dict:
+    """Identifying fields of one source's copy of a grant"""
+    return {field: grant[field] for field in _REFERENCE_FIELDS if grant.get(field)}
+
+
+class DuplicateIndex:
+    """Normalized-key plus MinHash/LSH index for merging duplicate grants"""
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.6,
+        shingle_size: int = 4,
+        min_shingles: int = 12,
+        description_chars: int = 500,
+        seed: int = 1
+    ):
+        """
+        Initialize duplicate index
+
+        Args:
+            num_perm: MinHash signature length (must be divisible by bands)
+            bands: LSH bands; more bands catch lower similarities
+            threshold: Estimated Jaccard similarity at which grants merge
+            shingle_size: Character shingle length
+            min_shingles: Grants with fewer shingles (e.g. a bare short title)
+                only merge on exact keys, since tiny texts look alike
+            description_chars: Description prefix included in the signature
+            seed: Seed for the MinHash hash family
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+        self.description_chars = description_chars
+
+        # a*x + b mod p permutations, derived deterministically from the seed
+        self._perms: List[Tuple[int, int]] = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'little') % (_MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'little') % _MERSENNE_PRIME
+            self._perms.append((a, b))
+
+        self.canonical: List[Dict] = []
+        self._signatures: List[Optional[Tuple[int, ...]]] = []
+        self._keys: Dict[str, int] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+        self.added = 0
+        self.exact_merges = 0
+        self.near_merges = 0
+        self.comparisons = 0
+
+    def _shingles(self, grant: Dict) -> Set[int]:
+        """Hashed character shingles of normalized title + description prefix"""
+        text = normalize_text(
+            f"{grant.get('title', '')} {(grant.get('description') or '')[:self.description_chars]}"
+        )
+        k = self.shingle_size
+        if len(text) <= k:
+            grams = {text} if text else set()
+        else:
+            grams = {text[i:i + k] for i in range(len(text) - k + 1)}
+        return {
+            int.from_bytes(hashlib.blake2b(gram.encode(), digest_size=4).digest(), 'little')
+            for gram in grams
+        }
+
+    def signature(self, grant: Dict) -> Optional[Tuple[int, ...]]:
+        """
+        MinHash signature of a grant
+
+        Args:
+            grant: Grant dictionary
+
+        Returns:
+            Tuple of num_perm minimum hash values, or None when the grant has
+            too little text for near-duplicate matching
+        """
+        shingles = self._shingles(grant)
+        if len(shingles) < self.min_shingles:
+            return None
+        return tuple(
+            min((a * x + b) % _MERSENNE_PRIME for x in shingles) & _MAX_HASH
+            for a, b in self._perms
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """LSH bucket keys, one per band"""
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity from two MinHash signatures"""
+        return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+    def _exact_keys(self, grant: Dict) -> List[str]:
+        """Normalized link and title keys for exact matching"""
+        keys = []
+        link = normalize_link(grant.get('link', ''))
+        if link:
+            keys.append(f"link:{link}")
+        title = normalize_text(grant.get('title', ''))
+        if title:
+            keys.append(f"title:{title}")
+        return keys
+
+    def find(self, grant: Dict) -> Optional[int]:
+        """
+        Find the canonical grant a grant duplicates
+
+        Args:
+            grant: Grant dictionary
+
+        Returns:
+            Index into self.canonical, or None if the grant is new
+        """
+        return self._match(grant, self.signature(grant))
+
+    def _match(self, grant: Dict, signature: Optional[Tuple[int, ...]]) -> Optional[int]:
+        """Exact-key lookup, then LSH candidates verified by signature similarity"""
+        for key in self._exact_keys(grant):
+            if key in self._keys:
+                return self._keys[key]
+
+        if signature is None:
+            return None
+
+        best, best_score = None, self.threshold
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        for candidate in candidates:
+            self.comparisons += 1
+            score = self.similarity(signature, self._signatures[candidate])
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+    def add(self, grant: Dict) -> Dict:
+        """
+        Add a grant, merging it into an existing canonical grant if duplicated
+
+        The canonical grant keeps its own fields, fills empty ones from the
+        duplicate, and records every source in 'sources'.
+
+        Args:
+            grant: Grant dictionary
+
+        Returns:
+            The canonical grant (the grant itself if it is new)
+        """
+        self.added += 1
+        exact = any(key in self._keys for key in self._exact_keys(grant))
+        signature = self.signature(grant)
+        match = self._match(grant, signature)
+
+        if match is None:
+            grant['sources'] = [source_reference(grant)]
+            match = len(self.canonical)
+            self.canonical.append(grant)
+            self._signatures.append(signature)
+            if signature is not None:
+                for band_key in self._band_keys(signature):
+                    self._buckets.setdefault(band_key, []).append(match)
+        else:
+            canonical = self.canonical[match]
+            canonical['sources'].append(source_reference(grant))
+            for field, value in grant.items():
+                if field != 'sources' and value and not canonical.get(field):
+                    canonical[field] = value
+            if exact:
+                self.exact_merges += 1
+            else:
+                self.near_merges += 1
+
+        for key in self._exact_keys(grant):
+            self._keys.setdefault(key, match)
+        return self.canonical[match]
+
+    def get_stats(self) -> Dict:
+        """Get deduplication statistics"""
+        return {
+            'added': self.added,
+            'canonical': len(self.canonical),
+            'exact_merges': self.exact_merges,
+            'near_merges': self.near_merges,
+            'comparisons': self.comparisons,
+        }
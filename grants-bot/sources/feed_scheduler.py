@@ -0,0 +1,254 @@
+"""
+Adaptive Feed Polling Scheduler
+
+Polls each RSS feed in the background at its own learned cadence.
+Intervals are estimated from observed item timestamps, unchanged polls
+back off, conditional GET validators (ETag / Last-Modified) avoid
+re-downloading unchanged feeds, and jitter spreads polls over time.
+Discovery is served from the freshest local state.
+"""
+
+import asyncio
+import calendar
+import random
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from .rss_discovery import RSSDiscovery
+
+
+class FeedScheduler:
+    """Per-feed adaptive polling for RSS grant sources"""
+
+    def __init__(
+        self,
+        rss_discovery: RSSDiscovery,
+        min_interval: float = 300,
+        max_interval: float = 86400,
+        default_interval: float = 3600,
+        jitter: float = 0.1,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize feed scheduler
+
+        Args:
+            rss_discovery: RSS discovery module used to fetch feeds
+            min_interval: Shortest polling interval in seconds
+            max_interval: Longest polling interval in seconds
+            default_interval: Interval for feeds with no history yet
+            jitter: Random +/- fraction applied to each interval
+            clock: Time source returning epoch seconds
+        """
+        self.rss_discovery = rss_discovery
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.jitter = jitter
+        self.clock = clock
+
+        self.feed_state: Dict[str, Dict] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+        logger.info("⏱️ Initialized FeedScheduler")
+
+    def _sync_feeds(self) -> None:
+        """Track newly added feeds and drop removed ones"""
+        feeds = self.rss_discovery.get_all_feeds()
+        for feed_url in feeds:
+            if feed_url not in self.feed_state:
+                self.feed_state[feed_url] = {
+                    'feed_url': feed_url,
+                    'etag': None,
+                    'last_modified': None,
+                    'interval': self.default_interval,
+                    'next_poll': 0.0,
+                    'last_polled': None,
+                    'last_changed': None,
+                    'grants': [],
+                    'polls': 0,
+                    'not_modified': 0,
+                    'errors': 0,
+                }
+        for feed_url in list(self.feed_state):
+            if feed_url not in feeds:
+                del self.feed_state[feed_url]
+
+    def _learn_interval(self, state: Dict, grants: Optional[List[Dict]], changed: bool) -> float:
+        """
+        Estimate a feed's polling interval
+
+        Uses half the median gap between recent item timestamps when the
+        feed provides them; otherwise halves the interval when the feed
+        changed and backs off by 1.5x when it did not.
+        """
+        timestamps = sorted({
+            calendar.timegm(grant['published_parsed'])
+            for grant in (grants or [])
+            if grant.get('published_parsed')
+        })
+
+        if len(timestamps) >= 2:
+            recent = timestamps[-20:]
+            gaps = [b - a for a, b in zip(recent, recent[1:]) if b > a]
+            interval = statistics.median(gaps) / 2 if gaps else state['interval']
+        elif changed:
+            interval = state['interval'] / 2
+        else:
+            interval = state['interval'] * 1.5
+
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _schedule(self, state: Dict, now: float) -> None:
+        """Set the next poll time with jitter"""
+        spread = random.uniform(1 - self.jitter, 1 + self.jitter)
+        state['next_poll'] = now + state['interval'] * spread
+
+    async def poll_feed(self, feed_url: str) -> Dict:
+        """
+        Poll one feed with conditional GET and update its schedule
+
+        Args:
+            feed_url: RSS feed URL
+
+        Returns:
+            Updated feed state
+        """
+        state = self.feed_state[feed_url]
+        now = self.clock()
+        state['polls'] += 1
+        state['last_polled'] = now
+
+        try:
+            result = await self.rss_discovery.fetch_feed(
+                feed_url,
+                etag=state['etag'],
+                last_modified=state['last_modified']
+            )
+            state['etag'] = result['etag']
+            state['last_modified'] = result['last_modified']
+
+            if result['status'] == 304:
+                state['not_modified'] += 1
+                state['interval'] = self._learn_interval(state, None, changed=False)
+            else:
+                grants = result['grants']
+                changed = (
+                    [g.get('link') or g.get('title') for g in grants] !=
+                    [g.get('link') or g.get('title') for g in state['grants']]
+                )
+                if changed:
+                    state['last_changed'] = now
+                state['grants'] = grants
+                state['interval'] = self._learn_interval(state, grants, changed)
+        except Exception as e:
+            state['errors'] += 1
+            state['interval'] = min(self.max_interval, state['interval'] * 2)
+            logger.error(f"❌ Scheduled poll failed for {feed_url}: {e}")
+
+        self._schedule(state, now)
+        return state
+
+    async def poll_due(self) -> int:
+        """
+        Poll every feed whose next poll time has passed
+
+        Returns:
+            Number of feeds polled
+        """
+        self._sync_feeds()
+        now = self.clock()
+        due = [url for url, state in self.feed_state.items() if state['next_poll'] <= now]
+        if due:
+            await asyncio.gather(*(self.poll_feed(url) for url in due))
+        return len(due)
+
+    async def get_grants(self) -> List[Dict]:
+        """
+        Get grants from the freshest local state
+
+        Feeds that have never been polled are fetched first so the initial
+        call is not empty; everything else is served without network I/O.
+
+        Returns:
+            Copies of the grants from all scheduled feeds
+        """
+        self._sync_feeds()
+        unpolled = [url for url, state in self.feed_state.items() if state['last_polled'] is None]
+        if unpolled:
+            await asyncio.gather(*(self.poll_feed(url) for url in unpolled))
+
+        # Copies: discovery normalizes and merges grants in place
+        grants = []
+        for state in self.feed_state.values():
+            grants.extend(dict(grant) for grant in state['grants'])
+        return grants
+
+    async def run(self, check_interval: float = 60) -> None:
+        """
+        Background polling loop
+
+        Args:
+            check_interval: Maximum sleep between schedule checks in seconds
+        """
+        logger.info("⏱️ Feed scheduler running")
+        while True:
+            await self.poll_due()
+
+            next_polls = [state['next_poll'] for state in self.feed_state.values()]
+            delay = check_interval
+            if next_polls:
+                delay = max(0.0, min(check_interval, min(next_polls) - self.clock()))
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start background polling on the running event loop"""
+        if self.is_running():
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    def wake(self) -> None:
+        """Re-check the schedule now (e.g. after adding a feed)"""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Stop background polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("⏱️ Feed scheduler stopped")
+
+    def is_running(self) -> bool:
+        """Check whether background polling is active"""
+        return self._task is not None and not self._task.done()
+
+    def get_stats(self) -> Dict:
+        """Get per-feed scheduling statistics"""
+        now = self.clock()
+        return {
+            'running': self.is_running(),
+            'feeds': {
+                url: {
+                    'interval_seconds': round(state['interval'], 1),
+                    'next_poll_in_seconds': round(max(0.0, state['next_poll'] - now), 1),
+                    'polls': state['polls'],
+                    'not_modified': state['not_modified'],
+                    'errors': state['errors'],
+                    'grants': len(state['grants']),
+                }
+                for url, state in self.feed_state.items()
+            },
+        }
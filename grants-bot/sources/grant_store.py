@@ -0,0 +1,425 @@
+"""
+Persistent Grant Store
+
+Repository for discovered grants so the discovery cache survives restarts.
+SQLite is used locally; MongoDB (the configured tenant_database_url) in
+production. Both index grant_id, source, category and deadline, and keep
+named checkpoints for incremental API syncs. Deadlines are indexed as ISO
+dates (whatever format the source used), so they compare and sort as
+dates, and grants past their deadline can be pruned.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from ..nlp.deadlines import deadline_ordinal, parse_deadline
+from .dedup_index import normalize_link, normalize_text
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo import ASCENDING, ReplaceOne
+except ImportError:
+    AsyncIOMotorClient = None
+
+
+def ensure_grant_id(grant: Dict) -> str:
+    """
+    Give a grant a stable id if its source did not provide one
+
+    RSS and SWARM entries have no native id, so one is derived from the
+    normalized link (or title) and source.
+
+    Args:
+        grant: Grant dictionary (updated in place)
+
+    Returns:
+        The grant's id
+    """
+    if not grant.get('grant_id'):
+        key = normalize_link(grant.get('link', '')) or normalize_text(grant.get('title', ''))
+        digest = hashlib.sha1(f"{grant.get('source', '')}:{key}".encode()).hexdigest()
+        grant['grant_id'] = f"{grant.get('source', 'grant')}-{digest[:16]}"
+    return grant['grant_id']
+
+
+def deadline_key(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a deadline string (ISO, timestamp or MM/DD/YYYY) to YYYY-MM-DD
+
+    Args:
+        value: Deadline as given by a source or caller
+
+    Returns:
+        ISO date, or None if it cannot be parsed
+    """
+    ordinal = parse_deadline(value) if isinstance(value, str) else None
+    return date.fromordinal(ordinal).isoformat() if ordinal is not None else None
+
+
+def grant_deadline_key(grant: Dict) -> Optional[str]:
+    """A grant's deadline as an ISO date for indexing"""
+    ordinal = deadline_ordinal(grant)
+    return date.fromordinal(ordinal).isoformat() if ordinal is not None else None
+
+
+def today_key() -> str:
+    """Today's UTC date as an ISO date"""
+    return datetime.utcnow().date().isoformat()
+
+
+class GrantStore(ABC):
+    """Interface for grant repositories"""
+
+    @abstractmethod
+    async def save_grants(self, tenant_id: str, grants: List[Dict]) -> int:
+        """Upsert grants for a tenant, returning the number written"""
+
+    @abstractmethod
+    async def get_grant(self, tenant_id: str, grant_id: str) -> Optional[Dict]:
+        """Get one grant by id"""
+
+    @abstractmethod
+    async def load_grants(self, tenant_id: str) -> List[Dict]:
+        """Load every stored grant for a tenant"""
+
+    @abstractmethod
+    async def query(
+        self,
+        tenant_id: str,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        deadline_before: Optional[str] = None
+    ) -> List[Dict]:
+        """Find grants by indexed fields"""
+
+    @abstractmethod
+    async def delete_grants(self, tenant_id: str, grant_ids: List[str]) -> int:
+        """Delete grants by id, returning the number removed"""
+
+    @abstractmethod
+    async def delete_expired(self, tenant_id: str, before: Optional[str] = None) -> int:
+        """Delete grants whose deadline is before a date (today by default)"""
+
+    @abstractmethod
+    async def get_checkpoint(self, tenant_id: str, name: str) -> Optional[Dict]:
+        """Get a named sync checkpoint (e.g. an incremental API cursor)"""
+
+    @abstractmethod
+    async def save_checkpoint(self, tenant_id: str, name: str, checkpoint: Dict) -> None:
+        """Persist a named sync checkpoint"""
+
+    async def close(self) -> None:
+        """Release the underlying connection"""
+
+
+class SQLiteGrantStore(GrantStore):
+    """SQLite grant repository for local use"""
+
+    def __init__(self, path: str = "grants.db"):
+        """
+        Initialize SQLite store
+
+        Args:
+            path: Database file path (':memory:' for tests)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS grants (
+                tenant_id TEXT NOT NULL,
+                grant_id TEXT NOT NULL,
+                source TEXT,
+                category TEXT,
+                deadline TEXT,
+                updated_at TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (tenant_id, grant_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_grants_source ON grants (tenant_id, source);
+            CREATE INDEX IF NOT EXISTS idx_grants_category ON grants (tenant_id, category);
+            CREATE INDEX IF NOT EXISTS idx_grants_deadline ON grants (tenant_id, deadline);
+            CREATE TABLE IF NOT EXISTS sync_checkpoints (
+                tenant_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (tenant_id, name)
+            );
+        """)
+        self._normalize_deadlines()
+        logger.info(f"🗄️ Opened SQLite grant store: {path}")
+
+    def _normalize_deadlines(self) -> None:
+        """Rewrite deadlines stored in source formats by older versions as ISO dates"""
+        rows = self._conn.execute(
+            "SELECT rowid, deadline FROM grants WHERE deadline IS NOT NULL"
+        ).fetchall()
+        updates = [
+            (deadline_key(deadline), rowid)
+            for rowid, deadline in rows
+            if deadline_key(deadline) != deadline
+        ]
+        if updates:
+            with self._conn:
+                self._conn.executemany("UPDATE grants SET deadline = ? WHERE rowid = ?", updates)
+
+    async def _run(self, fn, *args):
+        """Run a blocking database call off the event loop, one at a time"""
+        async with self._lock:
+            return await asyncio.to_thread(fn, *args)
+
+    def _save(self, tenant_id: str, grants: List[Dict]) -> int:
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (
+                tenant_id,
+                ensure_grant_id(grant),
+                grant.get('source'),
+                grant.get('category'),
+                grant_deadline_key(grant),
+                now,
+                json.dumps(grant, default=str),
+            )
+            for grant in grants
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO grants "
+                "(tenant_id, grant_id, source, category, deadline, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def _select(self, sql: str, params: tuple) -> List[Dict]:
+        return [json.loads(row[0]) for row in self._conn.execute(sql, params)]
+
+    async def save_grants(self, tenant_id: str, grants: List[Dict]) -> int:
+        return await self._run(self._save, tenant_id, grants)
+
+    async def get_grant(self, tenant_id: str, grant_id: str) -> Optional[Dict]:
+        rows = await self._run(
+            self._select,
+            "SELECT data FROM grants WHERE tenant_id = ? AND grant_id = ?",
+            (tenant_id, grant_id)
+        )
+        return rows[0] if rows else None
+
+    async def load_grants(self, tenant_id: str) -> List[Dict]:
+        return await self._run(
+            self._select,
+            "SELECT data FROM grants WHERE tenant_id = ? ORDER BY rowid",
+            (tenant_id,)
+        )
+
+    async def query(
+        self,
+        tenant_id: str,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        deadline_before: Optional[str] = None
+    ) -> List[Dict]:
+        clauses, params = ["tenant_id = ?"], [tenant_id]
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if deadline_before:
+            clauses.append("deadline IS NOT NULL AND deadline < ?")
+            params.append(deadline_key(deadline_before) or deadline_before)
+        sql = f"SELECT data FROM grants WHERE {' AND '.join(clauses)} ORDER BY deadline"
+        return await self._run(self._select, sql, tuple(params))
+
+    def _delete(self, tenant_id: str, grant_ids: List[str]) -> int:
+        with self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM grants WHERE tenant_id = ? AND grant_id = ?",
+                [(tenant_id, grant_id) for grant_id in grant_ids]
+            )
+        return cursor.rowcount
+
+    async def delete_grants(self, tenant_id: str, grant_ids: List[str]) -> int:
+        if not grant_ids:
+            return 0
+        return await self._run(self._delete, tenant_id, grant_ids)
+
+    def _delete_expired(self, tenant_id: str, before: str) -> int:
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM grants WHERE tenant_id = ? AND deadline IS NOT NULL AND deadline < ?",
+                (tenant_id, before)
+            )
+        return cursor.rowcount
+
+    async def delete_expired(self, tenant_id: str, before: Optional[str] = None) -> int:
+        before = deadline_key(before) if before else today_key()
+        return await self._run(self._delete_expired, tenant_id, before)
+
+    def _save_checkpoint(self, tenant_id: str, name: str, checkpoint: Dict) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_checkpoints (tenant_id, name, updated_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                (tenant_id, name, datetime.utcnow().isoformat(), json.dumps(checkpoint, default=str))
+            )
+
+    async def get_checkpoint(self, tenant_id: str, name: str) -> Optional[Dict]:
+        rows = await self._run(
+            self._select,
+            "SELECT data FROM sync_checkpoints WHERE tenant_id = ? AND name = ?",
+            (tenant_id, name)
+        )
+        return rows[0] if rows else None
+
+    async def save_checkpoint(self, tenant_id: str, name: str, checkpoint: Dict) -> None:
+        await self._run(self._save_checkpoint, tenant_id, name, checkpoint)
+
+    async def close(self) -> None:
+        self._conn.close()
+
+
+class MongoGrantStore(GrantStore):
+    """MongoDB grant repository for production (requires motor)"""
+
+    # Internal fields left out of returned grants
+    PROJECTION = {'_id': 0, 'deadline_date': 0}
+
+    def __init__(self, database_url: str, collection: str = "grants"):
+        """
+        Initialize MongoDB store
+
+        Args:
+            database_url: MongoDB URL including the database name
+            collection: Collection holding grants
+        """
+        if AsyncIOMotorClient is None:
+            raise RuntimeError("motor is not installed")
+
+        self.client = AsyncIOMotorClient(database_url)
+        database = self.client.get_default_database(default="grants_bot")
+        self.collection = database[collection]
+        self.checkpoints = database["sync_checkpoints"]
+        self._indexed = False
+        logger.info(f"🗄️ Using MongoDB grant store: {database.name}.{collection}")
+
+    async def _ensure_indexes(self) -> None:
+        if self._indexed:
+            return
+        await self.collection.create_index(
+            [("tenant_id", ASCENDING), ("grant_id", ASCENDING)], unique=True
+        )
+        for field in ("source", "category", "deadline_date"):
+            await self.collection.create_index([("tenant_id", ASCENDING), (field, ASCENDING)])
+        self._indexed = True
+
+    async def save_grants(self, tenant_id: str, grants: List[Dict]) -> int:
+        await self._ensure_indexes()
+        if not grants:
+            return 0
+        now = datetime.utcnow().isoformat()
+        operations = []
+        for grant in grants:
+            document = json.loads(json.dumps(grant, default=str))
+            document['tenant_id'] = tenant_id
+            document['grant_id'] = ensure_grant_id(grant)
+            document['deadline_date'] = grant_deadline_key(grant)
+            document['updated_at'] = now
+            operations.append(ReplaceOne(
+                {'tenant_id': tenant_id, 'grant_id': document['grant_id']},
+                document,
+                upsert=True
+            ))
+        await self.collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    async def get_grant(self, tenant_id: str, grant_id: str) -> Optional[Dict]:
+        await self._ensure_indexes()
+        return await self.collection.find_one(
+            {'tenant_id': tenant_id, 'grant_id': grant_id}, self.PROJECTION
+        )
+
+    async def load_grants(self, tenant_id: str) -> List[Dict]:
+        await self._ensure_indexes()
+        cursor = self.collection.find({'tenant_id': tenant_id}, self.PROJECTION)
+        return await cursor.to_list(length=None)
+
+    async def query(
+        self,
+        tenant_id: str,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        deadline_before: Optional[str] = None
+    ) -> List[Dict]:
+        await self._ensure_indexes()
+        filters: Dict = {'tenant_id': tenant_id}
+        if source:
+            filters['source'] = source
+        if category:
+            filters['category'] = category
+        if deadline_before:
+            filters['deadline_date'] = {'$lt': deadline_key(deadline_before) or deadline_before, '$ne': None}
+        cursor = self.collection.find(filters, self.PROJECTION).sort('deadline_date', ASCENDING)
+        return await cursor.to_list(length=None)
+
+    async def delete_grants(self, tenant_id: str, grant_ids: List[str]) -> int:
+        if not grant_ids:
+            return 0
+        result = await self.collection.delete_many(
+            {'tenant_id': tenant_id, 'grant_id': {'$in': list(grant_ids)}}
+        )
+        return result.deleted_count
+
+    async def delete_expired(self, tenant_id: str, before: Optional[str] = None) -> int:
+        before = deadline_key(before) if before else today_key()
+        result = await self.collection.delete_many(
+            {'tenant_id': tenant_id, 'deadline_date': {'$lt': before, '$ne': None}}
+        )
+        return result.deleted_count
+
+    async def get_checkpoint(self, tenant_id: str, name: str) -> Optional[Dict]:
+        document = await self.checkpoints.find_one({'tenant_id': tenant_id, 'name': name}, {'_id': 0})
+        return document['data'] if document else None
+
+    async def save_checkpoint(self, tenant_id: str, name: str, checkpoint: Dict) -> None:
+        await self.checkpoints.replace_one(
+            {'tenant_id': tenant_id, 'name': name},
+            {
+                'tenant_id': tenant_id,
+                'name': name,
+                'updated_at': datetime.utcnow().isoformat(),
+                'data': json.loads(json.dumps(checkpoint, default=str)),
+            },
+            upsert=True
+        )
+
+    async def close(self) -> None:
+        self.client.close()
+
+
+def create_grant_store(backend: str, sqlite_path: str, database_url: str) -> GrantStore:
+    """
+    Create the configured grant store
+
+    Args:
+        backend: 'sqlite' or 'mongo'
+        sqlite_path: SQLite database file for the sqlite backend
+        database_url: MongoDB URL for the mongo backend
+
+    Returns:
+        Grant store instance
+    """
+    if backend == "mongo":
+        return MongoGrantStore(database_url)
+    if backend == "sqlite":
+        return SQLiteGrantStore(sqlite_path)
+    raise ValueError(f"Unknown grant store backend: {backend}")
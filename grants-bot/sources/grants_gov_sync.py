@@ -0,0 +1,251 @@
+"""
+Incremental Grants.gov Sync
+
+Pages through Grants.gov search results newest-modified first, fetching
+pages concurrently in bounded windows, and stops as soon as it reaches
+opportunities older than the persisted cursor. Only changed opportunities
+are fetched and written; the full set of open opportunities is kept
+locally and restored from the grant store on restart. Incremental syncs
+also ask for closed and archived opportunities so they can be removed,
+and opportunities whose close date has passed are pruned.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from ..nlp.deadlines import parse_deadline
+from .grant_store import GrantStore
+from .http_client import HTTPClientPool
+
+
+class GrantsGovSync:
+    """Paginated, checkpointed sync of Grants.gov opportunities"""
+
+    URL = "https://www.grants.gov/grantsws/rest/opportunities/search"
+    CHECKPOINT = "grants_gov"
+    OPEN_STATUSES = 'forecasted|posted'
+    CLOSED_STATUSES = {'closed', 'archived'}
+
+    def __init__(
+        self,
+        http_client: HTTPClientPool,
+        url: str = URL,
+        page_size: int = 100,
+        max_concurrency: int = 4,
+        grant_store: Optional[GrantStore] = None,
+        tenant_id: str = "default"
+    ):
+        """
+        Initialize Grants.gov sync
+
+        Args:
+            http_client: Shared HTTP client pool
+            url: Search endpoint URL
+            page_size: Opportunities requested per page
+            max_concurrency: Pages fetched concurrently
+            grant_store: Store for the cursor and synced opportunities
+                (in-memory only if omitted)
+            tenant_id: Tenant the checkpoint and grants belong to
+        """
+        self.http = http_client
+        self.url = url
+        self.page_size = page_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.store = grant_store
+        self.tenant_id = tenant_id
+
+        self.opportunities: Dict[str, Dict] = {}
+        self.cursor: Optional[datetime] = None
+        self._loaded = grant_store is None
+        self._lock = asyncio.Lock()
+
+        self.stats = {
+            'syncs': 0,
+            'full_syncs': 0,
+            'pages_fetched': 0,
+            'last_changed': 0,
+            'last_removed': 0,
+            'last_sync': None,
+        }
+
+    @staticmethod
+    def parse_date(value: Optional[str]) -> Optional[datetime]:
+        """Parse a Grants.gov date (ISO or MM/DD/YYYY) as naive UTC"""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                parsed = datetime.strptime(value, '%m/%d/%Y')
+            except ValueError:
+                return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+
+    @staticmethod
+    def parse_opportunity(item: Dict) -> Dict:
+        """Convert a Grants.gov opportunity to a grant dictionary"""
+        return {
+            'source': 'grants_gov',
+            'source_name': 'Grants.gov',
+            'category': 'government',
+            'grant_id': str(item.get('opportunityID', '')),
+            'title': item.get('opportunityTitle', ''),
+            'description': item.get('description', ''),
+            'agency': item.get('agencyName', ''),
+            'amount': item.get('awardCeiling', 0),
+            'deadline': item.get('closeDate', ''),
+            'link': item.get('opportunityURL', ''),
+            'eligibility': item.get('eligibility', []),
+            'updated_at': item.get('lastUpdatedDate', ''),
+            'discovered_at': datetime.utcnow().isoformat(),
+        }
+
+    async def _load(self) -> None:
+        """Restore the cursor and synced opportunities from the store once"""
+        if self._loaded:
+            return
+        self._loaded = True
+        checkpoint = await self.store.get_checkpoint(self.tenant_id, self.CHECKPOINT)
+        if not checkpoint:
+            return
+        self.cursor = self.parse_date(checkpoint.get('cursor'))
+        for grant in await self.store.query(self.tenant_id, source='grants_gov'):
+            self.opportunities[grant['grant_id']] = grant
+        logger.info(f"🗄️ Restored {len(self.opportunities)} Grants.gov opportunities (cursor {self.cursor})")
+
+    async def _fetch_page(self, start: int, headers: Dict) -> Dict:
+        """Fetch one page of opportunities sorted by last modification"""
+        # A full sync only needs open opportunities; incremental syncs also
+        # need the ones that closed since the cursor, to drop them
+        statuses = self.OPEN_STATUSES
+        if self.cursor is not None:
+            statuses = '|'.join([self.OPEN_STATUSES, *sorted(self.CLOSED_STATUSES)])
+        params = {
+            'oppStatuses': statuses,
+            'sortBy': 'lastUpdatedDate|desc',
+            'rows': self.page_size,
+            'startRecordNum': start,
+        }
+        response = await self.http.get(self.url, params=params, headers=headers)
+        response.raise_for_status()
+        self.stats['pages_fetched'] += 1
+        return response.json()
+
+    def _reached_cursor(self, page: Dict) -> bool:
+        """Check whether a page ends at or before the cursor (or the last result)"""
+        items = page.get('opportunities', [])
+        if len(items) < self.page_size:
+            return True
+        if self.cursor is None:
+            return False
+        oldest = self.parse_date(items[-1].get('lastUpdatedDate'))
+        return oldest is not None and oldest < self.cursor
+
+    async def sync(self, api_key: str) -> List[Dict]:
+        """
+        Fetch opportunities modified since the last sync
+
+        Pages are fetched max_concurrency at a time until one reaches the
+        cursor. The cursor only advances once every page has been fetched,
+        so a failed sync is retried in full next time.
+
+        Args:
+            api_key: Grants.gov API key
+
+        Returns:
+            Every open opportunity known after the sync
+        """
+        async with self._lock:
+            await self._load()
+            headers = {
+                'Authorization': f'Bearer {api_key}',
+                'Accept': 'application/json'
+            }
+
+            logger.info(f"📡 Syncing Grants.gov (modified since {self.cursor or 'ever'})")
+            first = await self._fetch_page(0, headers)
+            pages = [first]
+            total = int(first.get('hitCount', 0))
+            offsets = list(range(self.page_size, total, self.page_size))
+            while offsets and not self._reached_cursor(pages[-1]):
+                window, offsets = offsets[:self.max_concurrency], offsets[self.max_concurrency:]
+                pages.extend(await asyncio.gather(*(self._fetch_page(start, headers) for start in window)))
+
+            # Opportunities modified exactly at the cursor are re-read, since
+            # updates within the same timestamp may have landed after the last sync
+            changed = []
+            removed = []
+            newest = self.cursor
+            for page in pages:
+                for item in page.get('opportunities', []):
+                    updated = self.parse_date(item.get('lastUpdatedDate'))
+                    if self.cursor is not None and updated is not None and updated < self.cursor:
+                        continue
+                    if updated is not None and (newest is None or updated > newest):
+                        newest = updated
+
+                    grant = self.parse_opportunity(item)
+                    if str(item.get('oppStatus', '')).lower() in self.CLOSED_STATUSES:
+                        if self.opportunities.pop(grant['grant_id'], None) is not None:
+                            removed.append(grant['grant_id'])
+                        continue
+                    previous = self.opportunities.get(grant['grant_id'])
+                    if previous is not None:
+                        grant['discovered_at'] = previous.get('discovered_at', grant['discovered_at'])
+                    self.opportunities[grant['grant_id']] = grant
+                    changed.append(grant)
+
+            expired = self._prune_expired()
+            if expired:
+                removed.extend(expired)
+                changed = [grant for grant in changed if grant['grant_id'] in self.opportunities]
+            
+            if self.cursor is None:
+                self.stats['full_syncs'] += 1
+            self.cursor = newest
+            self.stats['syncs'] += 1
+            self.stats['last_changed'] = len(changed)
+            self.stats['last_removed'] = len(removed)
+            self.stats['last_sync'] = datetime.utcnow().isoformat()
+
+            if self.store is not None:
+                await self.store.save_grants(self.tenant_id, changed)
+                await self.store.delete_grants(self.tenant_id, removed)
+                await self.store.save_checkpoint(self.tenant_id, self.CHECKPOINT, {
+                    'cursor': newest.isoformat() if newest else None,
+                    'synced_at': self.stats['last_sync'],
+                    'hit_count': total,
+                })
+
+            logger.info(f"✅ Grants.gov sync: {len(changed)} changed, {len(removed)} removed "
+                        f"in {len(pages)} pages, {len(self.opportunities)} open")
+            return self.get_grants()
+
+    def _prune_expired(self) -> List[str]:
+        """Drop opportunities whose close date has passed, returning their ids"""
+        today = datetime.utcnow().toordinal()
+        expired = []
+        for grant_id, grant in list(self.opportunities.items()):
+            close = parse_deadline(grant.get('deadline') or '')
+            if close is not None and close < today:
+                del self.opportunities[grant_id]
+                expired.append(grant_id)
+        return expired
+
+    def get_grants(self) -> List[Dict]:
+        """Get every synced open opportunity"""
+        return list(self.opportunities.values())
+
+    def get_stats(self) -> Dict:
+        """Get sync statistics"""
+        return dict(
+            self.stats,
+            opportunities=len(self.opportunities),
+            cursor=self.cursor.isoformat() if self.cursor else None
+        )
@@ -0,0 +1,171 @@
+"""
+Shared HTTP Client Pool
+
+One long-lived httpx.AsyncClient shared by every grant source, with
+keep-alive, optional HTTP/2, per-host connection limits and unified timeouts.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+from loguru import logger
+
+from .resilience import hedged
+
+
+def _h2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPClientPool:
+    """Long-lived pooled HTTP client shared across grant sources"""
+
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_connections_per_host: int = 6,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize HTTP client pool
+
+        Args:
+            timeout: Timeout in seconds applied to every request
+            max_connections: Total connection limit across all hosts
+            max_keepalive_connections: Idle connections kept open for reuse
+            max_connections_per_host: Concurrent requests allowed per host
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Enable HTTP/2 (requires the h2 package)
+            transport: Custom transport (e.g. httpx.MockTransport in tests)
+        """
+        if http2 and not _h2_available():
+            logger.warning("⚠️ HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+            http2 = False
+
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.request_count = 0
+        self.hedged_requests = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Underlying httpx client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                follow_redirects=True,
+                transport=self._transport,
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a URL's host"""
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a GET request through the shared client
+
+        Args:
+            url: Request URL
+            **kwargs: Passed through to httpx.AsyncClient.get
+
+        Returns:
+            HTTP response
+        """
+        async with self._host_semaphore(url):
+            self.request_count += 1
+            return await self.client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Send a streaming GET request through the shared client
+
+        The body is read incrementally by the caller; leaving the context
+        early closes the connection without downloading the rest.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed through to httpx.AsyncClient.stream
+
+        Yields:
+            HTTP response with an unread body
+        """
+        async with self._host_semaphore(url):
+            self.request_count += 1
+            async with self.client.stream("GET", url, **kwargs) as response:
+                yield response
+
+    async def _get_ok(self, url: str, **kwargs) -> httpx.Response:
+        """GET that raises on 4xx/5xx so hedging moves on to another mirror"""
+        response = await self.get(url, **kwargs)
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return response
+
+    async def get_hedged(self, urls: List[str], hedge_delay: float = 1.0, **kwargs) -> httpx.Response:
+        """
+        GET the same resource from a primary URL and its mirrors
+
+        The primary is requested first; each mirror is only tried if no
+        successful response has arrived after another hedge_delay seconds.
+
+        Args:
+            urls: Primary URL followed by mirror URLs
+            hedge_delay: Seconds before hedging to the next mirror
+            **kwargs: Passed through to httpx.AsyncClient.get
+
+        Returns:
+            First successful HTTP response
+        """
+        self.hedged_requests += 1
+        return await hedged(
+            [lambda url=url: self._get_ok(url, **kwargs) for url in urls],
+            hedge_delay
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying client and its pooled connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("🔌 Closed shared HTTP client pool")
+
+    def get_stats(self) -> Dict:
+        """Get client pool statistics"""
+        return {
+            'requests': self.request_count,
+            'hedged_requests': self.hedged_requests,
+            'hosts': len(self._host_semaphores),
+            'http2': self.http2,
+            'timeout': self.timeout,
+            'max_connections_per_host': self.max_connections_per_host,
+        }
@@ -0,0 +1,193 @@
+"""
+Source Resilience Helpers
+
+Circuit breakers that stop calling sources which keep failing (with
+half-open probing to detect recovery), per-source latency tracking, and
+hedged requests that race a slow primary against its mirrors.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the source's breaker is open"""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one grant source"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Source name for logs and stats
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a probe
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.total_latency = 0.0
+        self.last_latency: Optional[float] = None
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed
+
+        An open breaker admits a single probe once reset_timeout has passed.
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            logger.info(f"🟡 Circuit half-open for {self.name}, probing")
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call and close the breaker"""
+        self.calls += 1
+        self.total_latency += latency
+        self.last_latency = latency
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != self.CLOSED:
+            logger.info(f"🟢 Circuit closed for {self.name}")
+        self.state = self.CLOSED
+
+    def record_failure(self, latency: Optional[float] = None) -> None:
+        """Record a failed call, opening the breaker at the threshold"""
+        self.calls += 1
+        self.failures += 1
+        self.last_latency = latency
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"🔴 Circuit open for {self.name} after {self.consecutive_failures} failures")
+            self.state = self.OPEN
+            self.opened_at = self.clock()
+
+    async def call(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call through the breaker, timing it
+
+        Args:
+            func: Zero-argument coroutine function
+
+        Returns:
+            The call's result
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit open for {self.name}")
+        return await self.run(func)
+
+    async def run(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call already admitted by allow(), recording its outcome
+
+        Args:
+            func: Zero-argument coroutine function
+
+        Returns:
+            The call's result
+        """
+        started = self.clock()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # Not the source's fault by itself; callers enforcing a deadline
+            # record the timeout with record_failure
+            self._probe_in_flight = False
+            raise
+        except Exception:
+            self.record_failure(self.clock() - started)
+            raise
+        self.record_success(self.clock() - started)
+        return result
+
+    def get_stats(self) -> Dict:
+        """Get breaker state and latency statistics"""
+        successes = self.calls - self.failures
+        return {
+            'state': self.state,
+            'calls': self.calls,
+            'failures': self.failures,
+            'rejected': self.rejected,
+            'avg_latency_ms': round(1000 * self.total_latency / successes, 1) if successes else None,
+            'last_latency_ms': round(1000 * self.last_latency, 1) if self.last_latency is not None else None,
+        }
+
+
+async def hedged(factories: List[Callable[[], Awaitable[Any]]], delay: float) -> Any:
+    """
+    Race equivalent requests, starting each extra one only if the previous is slow
+
+    The first attempt starts immediately; every `delay` seconds without a
+    successful result another attempt starts. The first success wins and
+    the remaining attempts are cancelled.
+
+    Args:
+        factories: Zero-argument coroutine functions, primary first
+        delay: Seconds to wait before hedging to the next attempt
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        The last error if every attempt fails
+    """
+    pending = set()
+    remaining = list(factories)
+    last_error: Optional[BaseException] = None
+
+    try:
+        while remaining or pending:
+            if remaining:
+                pending.add(asyncio.ensure_future(remaining.pop(0)()))
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=delay if remaining else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise last_error
@@ -8,31 +8,54 @@ Supports standard RSS 2.0 and Atom feeds.
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional
-from urllib.parse import urlparse
+from urllib.parse import urljoin
 
 import feedparser
-import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
 
+from .feed_crawler import FeedLinkParser
+from .http_client import HTTPClientPool
+from .parse_pool import FeedParsePool
+
 
 class RSSDiscovery:
     """RSS feed discovery and parsing for grant opportunities"""
     
-    def __init__(self, feeds: Optional[List[str]] = None):
+    # Give up on pages whose <head> has not ended after this many characters
+    MAX_HEAD_CHARS = 256 * 1024
+    
+    def __init__(
+        self,
+        feeds: Optional[List[str]] = None,
+        http_client: Optional[HTTPClientPool] = None,
+        parse_pool: Optional[FeedParsePool] = None,
+        mirrors: Optional[Dict[str, List[str]]] = None,
+        hedge_delay: float = 1.0
+    ):
         """
         Initialize RSS discovery
         
         Args:
             feeds: List of RSS feed URLs to monitor
+            http_client: Shared HTTP client pool (creates its own if omitted)
+            parse_pool: Shared feed parse pool (creates its own if omitted)
+            mirrors: Mirror URLs by feed URL, raced against slow primaries
+            hedge_delay: Seconds before a slow feed is hedged to a mirror
         """
         self.feeds = feeds or []
+        self.http = http_client or HTTPClientPool()
+        self.parser = parse_pool or FeedParsePool()
+        self.mirrors = mirrors or {}
+        self.hedge_delay = hedge_delay
         self.discovered_feeds: List[str] = []
         
     async def discover_feeds_from_url(self, url: str) -> List[str]:
         """
         Auto-discover RSS feeds from a webpage
         
+        Only the page's <head> is read (feed <link> tags live there), parsed
+        incrementally as it streams in.
+        
         Args:
             url: Website URL to scan for RSS feeds
             
@@ -42,34 +65,32 @@ class RSSDiscovery:
         discovered = []
         
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url)
+            # Stream the page and stop once <head> is over; the body is
+            # never downloaded
+            parser = FeedLinkParser()
+            read = 0
+            async with self.http.stream(url) as response:
                 response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for RSS/Atom feed links in HTML head
-                feed_links = soup.find_all('link', type=[
-                    'application/rss+xml',
-                    'application/atom+xml',
-                    'application/rdf+xml'
-                ])
-                
-                for link in feed_links:
-                    feed_url = link.get('href')
-                    if feed_url:
-                        # Make absolute URL if relative
-                        if not feed_url.startswith('http'):
-                            parsed = urlparse(url)
-                            base_url = f"{parsed.scheme}://{parsed.netloc}"
-                            feed_url = base_url + feed_url
-                        
-                        discovered.append(feed_url)
-                        logger.info(f"📡 Discovered RSS feed: {feed_url}")
-                
-                # Store discovered feeds
-                self.discovered_feeds.extend(discovered)
-                
+                base_url = str(response.url)
+                async for chunk in response.aiter_text():
+                    parser.feed(chunk)
+                    read += len(chunk)
+                    if parser.done or read >= self.MAX_HEAD_CHARS:
+                        break
+            
+            base_url = urljoin(base_url, parser.base or '')
+            for href in parser.links:
+                # Make absolute URL if relative
+                feed_url = urljoin(base_url, href)
+                if feed_url not in discovered:
+                    discovered.append(feed_url)
+                    logger.info(f"📡 Discovered RSS feed: {feed_url}")
+            
+            # Store discovered feeds
+            self.discovered_feeds.extend(
+                feed_url for feed_url in discovered if feed_url not in self.discovered_feeds
+            )
+            
         except Exception as e:
             logger.error(f"❌ Error discovering feeds from {url}: {e}")
             
@@ -88,44 +109,107 @@ class RSSDiscovery:
         grants = []
         
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                response = await client.get(feed_url)
-                response.raise_for_status()
-                
-                # Parse feed
-                feed = feedparser.parse(response.content)
-                
-                if feed.bozo:
-                    logger.warning(f"⚠️ Feed parsing issues for {feed_url}")
-                
-                # Extract entries
-                for entry in feed.entries:
-                    grant = {
-                        'source': 'rss',
-                        'feed_url': feed_url,
-                        'title': entry.get('title', 'Untitled'),
-                        'description': entry.get('summary', entry.get('description', '')),
-                        'link': entry.get('link', ''),
-                        'published': entry.get('published', entry.get('updated', '')),
-                        'published_parsed': entry.get('published_parsed'),
-                        'tags': [tag.term for tag in entry.get('tags', [])],
-                        'author': entry.get('author', ''),
-                        'discovered_at': datetime.utcnow().isoformat(),
-                    }
-                    
-                    # Extract additional metadata
-                    if hasattr(entry, 'content'):
-                        grant['content'] = entry.content[0].value if entry.content else ''
-                    
-                    grants.append(grant)
-                    
-                logger.info(f"✅ Parsed {len(grants)} opportunities from {feed_url}")
-                
+            result = await self.fetch_feed(feed_url)
+            grants = result['grants']
+            logger.info(f"✅ Parsed {len(grants)} opportunities from {feed_url}")
+            
         except Exception as e:
             logger.error(f"❌ Error parsing feed {feed_url}: {e}")
             
         return grants
     
+    async def fetch_feed(
+        self,
+        feed_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Dict:
+        """
+        Fetch a feed with an optional conditional GET
+        
+        Args:
+            feed_url: RSS feed URL
+            etag: ETag validator from the previous fetch
+            last_modified: Last-Modified validator from the previous fetch
+            
+        Returns:
+            Dictionary with 'status', 'grants' (None when 304 Not Modified),
+            and the 'etag'/'last_modified' validators to send next time
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        if self.mirrors.get(feed_url):
+            urls = [feed_url] + self.mirrors[feed_url]
+            response = await self.http.get_hedged(urls, self.hedge_delay, headers=headers)
+        else:
+            response = await self.http.get(feed_url, headers=headers)
+        
+        if response.status_code == 304:
+            return {
+                'status': 304,
+                'grants': None,
+                'etag': etag,
+                'last_modified': last_modified,
+            }
+        
+        response.raise_for_status()
+        
+        return {
+            'status': response.status_code,
+            'grants': await self.parser.run(self.parse_entries, feed_url, response.content),
+            'etag': response.headers.get('ETag', etag),
+            'last_modified': response.headers.get('Last-Modified', last_modified),
+        }
+    
+    @staticmethod
+    def parse_entries(feed_url: str, content: bytes) -> List[Dict]:
+        """
+        Parse raw feed content into grant opportunities
+        
+        CPU-bound; runs in the parse pool rather than on the event loop.
+        
+        Args:
+            feed_url: RSS feed URL the content came from
+            content: Raw feed bytes
+            
+        Returns:
+            List of grant opportunity dictionaries
+        """
+        grants = []
+        
+        # Parse feed
+        feed = feedparser.parse(content)
+        
+        if feed.bozo:
+            logger.warning(f"⚠️ Feed parsing issues for {feed_url}")
+        
+        # Extract entries
+        for entry in feed.entries:
+            grant = {
+                'source': 'rss',
+                'feed_url': feed_url,
+                'title': entry.get('title', 'Untitled'),
+                'description': entry.get('summary', entry.get('description', '')),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', entry.get('updated', '')),
+                'published_parsed': entry.get('published_parsed'),
+                'tags': [tag.term for tag in entry.get('tags', [])],
+                'author': entry.get('author', ''),
+                'discovered_at': datetime.utcnow().isoformat(),
+            }
+            
+            # Extract additional metadata
+            if hasattr(entry, 'content'):
+                grant['content'] = entry.content[0].value if entry.content else ''
+            
+            grants.append(grant)
+        
+        return grants
+    
     async def fetch_all_feeds(self) -> List[Dict]:
         """
         Fetch and parse all configured feeds
@@ -136,7 +220,7 @@ class RSSDiscovery:
         all_grants = []
         
         # Combine configured and discovered feeds
-        all_feeds = list(set(self.feeds + self.discovered_feeds))
+        all_feeds = self.get_all_feeds()
         
         if not all_feeds:
             logger.warning("⚠️ No RSS feeds configured")
@@ -171,6 +255,10 @@ class RSSDiscovery:
     def get_feeds(self) -> List[str]:
         """Get all configured feeds"""
         return self.feeds.copy()
+    
+    def get_all_feeds(self) -> List[str]:
+        """Get configured and auto-discovered feeds, deduplicated"""
+        return list(dict.fromkeys(self.feeds + self.discovered_feeds))
 
 
 # Example usage
@@ -6,14 +6,23 @@ unified interface for grant discovery with per-tenant configuration.
 """
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from .rss_discovery import RSSDiscovery
 from .api_integrations import APIIntegrations
 from .swarm_feed import SwarmFeed
+from .http_client import HTTPClientPool
+from .feed_scheduler import FeedScheduler
+from .feed_crawler import FeedCrawler
+from .parse_pool import FeedParsePool
+from .dedup_index import DuplicateIndex
+from .grant_store import GrantStore, ensure_grant_id
+from ..nlp.deadlines import deadline_ordinal, normalize_deadline, parse_deadline
+from .resilience import CircuitBreaker
 
 
 class SourceManager:
@@ -24,7 +33,24 @@ class SourceManager:
         rss_feeds: Optional[List[str]] = None,
         api_keys: Optional[Dict[str, str]] = None,
         swarm_feed_url: Optional[str] = None,
-        tenant_id: Optional[str] = None
+        tenant_id: Optional[str] = None,
+        http_client: Optional[HTTPClientPool] = None,
+        parse_pool: Optional[FeedParsePool] = None,
+        feed_scheduler: bool = False,
+        poll_min_interval: float = 300,
+        poll_max_interval: float = 86400,
+        grant_store: Optional[GrantStore] = None,
+        cache_ttl: float = 900,
+        stale_ttl: float = 86400,
+        discovery_deadline: float = 20.0,
+        breaker_failure_threshold: int = 3,
+        breaker_reset_timeout: float = 300.0,
+        rss_mirrors: Optional[Dict[str, List[str]]] = None,
+        hedge_delay: float = 1.0,
+        grants_gov_page_size: int = 100,
+        grants_gov_concurrency: int = 4,
+        crawl_concurrency: int = 50,
+        crawl_domain_delay: float = 1.0
     ):
         """
         Initialize source manager
@@ -34,66 +60,202 @@ class SourceManager:
             api_keys: Dictionary of API keys by source
             swarm_feed_url: X SWARM RSS feed URL
             tenant_id: Tenant identifier for configuration
+            http_client: Shared HTTP client pool (creates one if omitted)
+            parse_pool: Shared feed parse pool (creates one if omitted)
+            feed_scheduler: Poll RSS feeds adaptively instead of on every discovery
+            poll_min_interval: Shortest per-feed polling interval in seconds
+            poll_max_interval: Longest per-feed polling interval in seconds
+            grant_store: Persistent grant repository (in-memory only if omitted)
+            cache_ttl: Seconds cached grants are served as fresh
+            stale_ttl: Seconds stale grants may be served while a background
+                refresh runs; older caches block on a refresh
+            discovery_deadline: Seconds a discovery run waits for sources
+                before falling back to late sources' previous results
+            breaker_failure_threshold: Consecutive failures that trip a
+                source's circuit breaker
+            breaker_reset_timeout: Seconds before a tripped source is probed again
+            rss_mirrors: Mirror URLs by RSS feed URL for hedged requests
+            hedge_delay: Seconds before a slow feed is hedged to a mirror
+            grants_gov_page_size: Opportunities per Grants.gov page
+            grants_gov_concurrency: Grants.gov pages fetched concurrently
+            crawl_concurrency: Sites scanned concurrently when crawling for feeds
+            crawl_domain_delay: Minimum seconds between crawl requests to one domain
         """
         self.tenant_id = tenant_id or "default"
         
+        # One long-lived connection pool shared by every source
+        self.http = http_client or HTTPClientPool()
+        
+        # Feed parsing runs off the event loop, tuned separately from fetching
+        self.parser = parse_pool or FeedParsePool()
+        
         # Initialize source modules
-        self.rss_discovery = RSSDiscovery(feeds=rss_feeds or [])
-        self.api_integrations = APIIntegrations(api_keys=api_keys or {})
-        self.swarm_feed = SwarmFeed(feed_url=swarm_feed_url)
+        self.rss_discovery = RSSDiscovery(
+            feeds=rss_feeds or [],
+            http_client=self.http,
+            parse_pool=self.parser,
+            mirrors=rss_mirrors,
+            hedge_delay=hedge_delay
+        )
+        self.api_integrations = APIIntegrations(
+            api_keys=api_keys or {},
+            http_client=self.http,
+            grant_store=grant_store,
+            tenant_id=self.tenant_id,
+            grants_gov_page_size=grants_gov_page_size,
+            grants_gov_concurrency=grants_gov_concurrency
+        )
+        self.swarm_feed = SwarmFeed(
+            feed_url=swarm_feed_url,
+            http_client=self.http,
+            parse_pool=self.parser
+        )
+        
+        # Polite feed auto-discovery across many funder sites
+        self.crawler = FeedCrawler(
+            self.rss_discovery.discover_feeds_from_url,
+            max_concurrency=crawl_concurrency,
+            per_domain_delay=crawl_domain_delay
+        )
+        
+        # Adaptive RSS polling (serves discovery from the freshest feed state)
+        self.feed_scheduler: Optional[FeedScheduler] = None
+        if feed_scheduler:
+            self.feed_scheduler = FeedScheduler(
+                self.rss_discovery,
+                min_interval=poll_min_interval,
+                max_interval=poll_max_interval
+            )
         
         # Discovery cache
         self.last_discovery: Optional[datetime] = None
         self.cached_grants: List[Dict] = []
+        self.grants_by_id: Dict[str, Dict] = {}
+        self.dedup_stats: Dict = {}
+        
+        # TTL cache with stale-while-revalidate and single-flight refreshes
+        self.cache_ttl = cache_ttl
+        self.stale_ttl = stale_ttl
+        self._refreshed_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.cache_stats = {
+            'fresh_hits': 0,
+            'stale_hits': 0,
+            'refreshes': 0,
+            'coalesced': 0,
+        }
+        
+        # Global deadline and per-source circuit breakers
+        self.discovery_deadline = discovery_deadline
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        
+        # Each source's last successful result (unmodified copies), served
+        # again when the source fails, misses the deadline or is circuit-open
+        self._last_results: Dict[str, List[Dict]] = {}
+        
+        # Persistent store; the cache is restored from it on first use
+        self.store = grant_store
+        self._store_loaded = grant_store is None
         
     async def discover_all_grants(self, use_cache: bool = False) -> List[Dict]:
         """
         Discover grants from all sources
         
+        With use_cache, grants younger than cache_ttl are returned directly;
+        older grants (up to stale_ttl, or restored from the store) are
+        returned immediately while one background refresh revalidates them.
+        Concurrent callers that need a refresh share a single discovery run.
+        
         Args:
             use_cache: Return cached grants if available
             
         Returns:
             Combined list of all discovered grants
         """
+        await self._load_from_store()
+        
         if use_cache and self.cached_grants:
-            logger.info(f"📦 Returning {len(self.cached_grants)} cached grants")
-            return self.cached_grants
+            age = self.cache_age()
+            if age is not None and age < self.cache_ttl:
+                self.cache_stats['fresh_hits'] += 1
+                logger.info(f"📦 Returning {len(self.cached_grants)} cached grants")
+                return self.cached_grants
+            
+            if age is None or age < self.stale_ttl:
+                self.cache_stats['stale_hits'] += 1
+                self._start_refresh()
+                logger.info(f"📦 Returning {len(self.cached_grants)} stale grants, revalidating")
+                return self.cached_grants
         
+        return await self._refresh()
+    
+    def cache_age(self) -> Optional[float]:
+        """Seconds since the last discovery run, or None if never run in this process"""
+        if self._refreshed_at is None:
+            return None
+        return time.monotonic() - self._refreshed_at
+    
+    def _start_refresh(self) -> asyncio.Task:
+        """Start a discovery run unless one is already in flight"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self.cache_stats['coalesced'] += 1
+            return self._refresh_task
+        
+        self.cache_stats['refreshes'] += 1
+        self._refresh_task = asyncio.ensure_future(self._discover())
+        self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+    
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        """Surface errors from refreshes nobody awaited"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"❌ Background discovery failed: {task.exception()}")
+    
+    async def _refresh(self) -> List[Dict]:
+        """Wait for the in-flight discovery run, starting one if needed"""
+        # Shield so one caller's cancellation doesn't cancel the shared run
+        return await asyncio.shield(self._start_refresh())
+    
+    async def _discover(self) -> List[Dict]:
+        """Fan out to every source, merge duplicates and update the cache"""
         all_grants = []
         
         logger.info(f"🔍 Discovering grants for tenant: {self.tenant_id}")
         
-        # Fetch from all sources concurrently
-        tasks = [
-            self.rss_discovery.fetch_all_feeds(),
-            self.api_integrations.fetch_all_sources(),
-            self.swarm_feed.fetch_swarm_grants(),
-        ]
+        tasks = self._start_sources()
+        if tasks:
+            done, pending = await asyncio.wait(
+                [task for _, task in tasks], timeout=self.discovery_deadline
+            )
+            await self._expire_sources(tasks, pending)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Collect results in source order, merging near-duplicates across sources
+        index = DuplicateIndex()
         
-        # Collect and deduplicate results
-        seen_titles = set()
+        fresh = {}
+        for name, task in tasks:
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                logger.error(f"❌ Source discovery failed ({name}): {task.exception()}")
+                continue
+            fresh[name] = self._remember(name, task.result())
         
-        for result in results:
-            if isinstance(result, list):
-                for grant in result:
-                    # Simple deduplication by title
-                    title = grant.get('title', '')
-                    if title and title not in seen_titles:
-                        seen_titles.add(title)
-                        # Add tenant metadata
-                        grant['tenant_id'] = self.tenant_id
-                        all_grants.append(grant)
-            elif isinstance(result, Exception):
-                logger.error(f"❌ Source discovery failed: {result}")
+        results = list(fresh.values()) + self._previous_results(fresh)
+        for grants in results:
+            for grant in grants:
+                if self._accept_grant(grant, index):
+                    all_grants.append(grant)
         
-        # Update cache
-        self.cached_grants = all_grants
-        self.last_discovery = datetime.utcnow()
+        await self._update_cache(all_grants, index)
         
-        logger.info(f"✅ Discovered {len(all_grants)} total grants (deduplicated)")
+        logger.info(
+            f"✅ Discovered {len(all_grants)} total grants "
+            f"({self.dedup_stats['exact_merges']} exact, {self.dedup_stats['near_merges']} near duplicates merged)"
+        )
         
         # Log breakdown by source
         sources = {}
@@ -107,11 +269,290 @@ class SourceManager:
         
         return all_grants
     
+    def _source_calls(self) -> List[Tuple[str, Callable[[], Awaitable[List[Dict]]]]]:
+        """
+        Name and fetch function of every source
+        
+        Each RSS feed is its own source, so a slow or failing feed neither
+        holds back nor trips the breaker for the others. Fetches raise on
+        failure so breakers can count it.
+        
+        Returns:
+            List of (source name, zero-argument coroutine function) pairs
+        """
+        # RSS comes from the scheduler's local state when it is enabled
+        if self.feed_scheduler is not None:
+            calls = [('rss', self.feed_scheduler.get_grants)]
+        else:
+            calls = [
+                (f"rss:{feed}", lambda feed=feed: self._fetch_rss(feed))
+                for feed in self.rss_discovery.get_all_feeds()
+            ]
+        
+        return calls + self.api_integrations.source_calls() + [
+            ('swarm', self.swarm_feed.fetch),
+        ]
+    
+    def _remember(self, name: str, grants: List[Dict]) -> List[Dict]:
+        """Keep copies of a source's result before deduplication modifies it"""
+        self._last_results[name] = [dict(grant) for grant in grants]
+        return grants
+    
+    def _previous_results(self, fresh: Dict[str, List[Dict]]) -> List[List[Dict]]:
+        """
+        Last successful results of configured sources missing from this run
+        
+        Keeps a failed, late or circuit-open source from dropping its grants
+        out of the cache (and a removed source's grants are forgotten).
+        
+        Args:
+            fresh: Results fetched in this run, by source name
+            
+        Returns:
+            Copies of the previous results, in source order
+        """
+        configured = [name for name, _ in self._source_calls()]
+        self._last_results = {
+            name: self._last_results[name] for name in configured if name in self._last_results
+        }
+        previous = []
+        for name, grants in self._last_results.items():
+            if name not in fresh:
+                logger.info(f"♻️ Reusing {len(grants)} previous grants from {name}")
+                previous.append([dict(grant) for grant in grants])
+        return previous
+    
+    @staticmethod
+    async def _named(name: str, task: asyncio.Task) -> Tuple[str, List[Dict]]:
+        """Await a source task, returning its name with the result"""
+        return name, await task
+    
+    async def _fetch_rss(self, feed_url: str) -> List[Dict]:
+        """Fetch one RSS feed, raising on failure"""
+        result = await self.rss_discovery.fetch_feed(feed_url)
+        logger.info(f"✅ Parsed {len(result['grants'])} opportunities from {feed_url}")
+        return result['grants']
+    
+    def _breaker(self, name: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for a source"""
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=self.breaker_failure_threshold,
+                reset_timeout=self.breaker_reset_timeout
+            )
+            self.breakers[name] = breaker
+        return breaker
+    
+    def _start_sources(self) -> List[Tuple[str, asyncio.Task]]:
+        """Start every source whose circuit breaker admits a call"""
+        tasks = []
+        for name, fetch in self._source_calls():
+            breaker = self._breaker(name)
+            if not breaker.allow():
+                logger.warning(f"⏭️ Skipping {name}: circuit open")
+                continue
+            tasks.append((name, asyncio.ensure_future(breaker.run(fetch))))
+        return tasks
+    
+    async def _expire_sources(self, tasks: List[Tuple[str, asyncio.Task]], pending) -> None:
+        """Cancel sources that missed the deadline and count them as failures"""
+        if not pending:
+            return
+        for name, task in tasks:
+            if task in pending:
+                task.cancel()
+                self._breaker(name).record_failure(self.discovery_deadline)
+                logger.warning(f"⏱️ {name} missed the {self.discovery_deadline}s discovery deadline")
+        await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _accept_grant(self, grant: Dict, index: DuplicateIndex) -> bool:
+        """
+        Add a grant to the duplicate index; new grants get the tenant, an id
+        and a parsed deadline
+        
+        Returns:
+            True if the grant is new, False if it was merged into an existing one
+        """
+        if not grant.get('title'):
+            return False
+        canonical = index.add(grant)
+        if canonical is not grant:
+            # The merge may have filled in the canonical grant's deadline
+            normalize_deadline(canonical)
+            return False
+        grant['tenant_id'] = self.tenant_id
+        ensure_grant_id(grant)
+        normalize_deadline(grant)
+        return True
+    
+    async def _update_cache(self, grants: List[Dict], index: DuplicateIndex) -> None:
+        """Replace the cache and id map, and persist grants to the store"""
+        self.cached_grants = grants
+        self.grants_by_id = {grant['grant_id']: grant for grant in grants}
+        self.last_discovery = datetime.utcnow()
+        self._refreshed_at = time.monotonic()
+        self.dedup_stats = index.get_stats()
+        
+        if self.store is not None:
+            try:
+                saved = await self.store.save_grants(self.tenant_id, grants)
+                expired = await self.store.delete_expired(self.tenant_id)
+                logger.info(f"💾 Persisted {saved} grants for tenant {self.tenant_id} ({expired} expired pruned)")
+            except Exception as e:
+                logger.error(f"❌ Failed to persist grants: {e}")
+    
+    async def _load_from_store(self) -> None:
+        """Restore the cache from the persistent store once per process"""
+        if self._store_loaded:
+            return
+        self._store_loaded = True
+        try:
+            await self.store.delete_expired(self.tenant_id)
+            grants = await self.store.load_grants(self.tenant_id)
+        except Exception as e:
+            logger.error(f"❌ Failed to load stored grants: {e}")
+            return
+        if grants and not self.cached_grants:
+            self.cached_grants = grants
+            self.grants_by_id = {grant['grant_id']: grant for grant in grants}
+            logger.info(f"💾 Restored {len(grants)} stored grants for tenant {self.tenant_id}")
+    
+    async def get_grant(self, grant_id: str) -> Optional[Dict]:
+        """
+        Look up a grant by id
+        
+        Uses the in-memory id map, then the persistent store; runs a
+        discovery only when nothing has been cached yet.
+        
+        Args:
+            grant_id: Grant identifier
+            
+        Returns:
+            Grant dictionary or None if not found
+        """
+        await self._load_from_store()
+        if not self.cached_grants:
+            await self.discover_all_grants()
+        
+        grant = self.grants_by_id.get(grant_id)
+        if grant is None and self.store is not None:
+            grant = await self.store.get_grant(self.tenant_id, grant_id)
+        return grant
+    
+    async def query_grants(
+        self,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        deadline_before: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Find stored grants by indexed fields
+        
+        Args:
+            source: Source name (e.g. 'rss', 'grants_gov')
+            category: Grant category
+            deadline_before: Only grants with a deadline before this date
+            
+        Returns:
+            Matching grants
+        """
+        if self.store is not None:
+            return await self.store.query(self.tenant_id, source, category, deadline_before)
+        
+        # Compare parsed dates, since sources format deadlines differently
+        before = parse_deadline(deadline_before) if deadline_before else None
+        matches = [
+            grant for grant in self.cached_grants
+            if (not source or grant.get('source') == source)
+            and (not category or grant.get('category') == category)
+            and (not deadline_before or (
+                before is not None
+                and deadline_ordinal(grant) is not None
+                and deadline_ordinal(grant) < before
+            ))
+        ]
+        if deadline_before:
+            matches.sort(key=deadline_ordinal)
+        return matches
+    
+    async def stream_all_grants(self) -> AsyncIterator[Dict]:
+        """
+        Discover grants from all sources, yielding each as its source finishes
+        
+        Grants are deduplicated across sources as they arrive; duplicates
+        arriving later are merged into the already-yielded grant's 'sources'
+        (visible in the cache) rather than yielded again. The cache is
+        updated once every source has finished; if the consumer stops early,
+        the remaining source fetches are cancelled. Sources still running at
+        the discovery deadline are cancelled; their previous results (like
+        those of failed or circuit-open sources) are yielded last.
+        
+        Yields:
+            Deduplicated grant dictionaries
+        """
+        logger.info(f"🌊 Streaming grant discovery for tenant: {self.tenant_id}")
+        
+        tasks = self._start_sources()
+        names = {task: name for name, task in tasks}
+        index = DuplicateIndex()
+        all_grants = []
+        fresh = {}
+        
+        try:
+            named = [self._named(name, task) for name, task in tasks]
+            for next_done in asyncio.as_completed(named, timeout=self.discovery_deadline):
+                try:
+                    name, result = await next_done
+                except asyncio.TimeoutError:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ Source discovery failed: {e}")
+                    continue
+                
+                fresh[name] = self._remember(name, result)
+                for grant in result:
+                    if self._accept_grant(grant, index):
+                        all_grants.append(grant)
+                        yield grant
+        except asyncio.TimeoutError:
+            await self._expire_sources(tasks, {task for task in names if not task.done()})
+        finally:
+            for task in names:
+                task.cancel()
+        
+        for grants in self._previous_results(fresh):
+            for grant in grants:
+                if self._accept_grant(grant, index):
+                    all_grants.append(grant)
+                    yield grant
+        
+        await self._update_cache(all_grants, index)
+        logger.info(f"✅ Streamed {len(all_grants)} total grants (deduplicated)")
+    
     def add_rss_feed(self, feed_url: str) -> None:
         """Add RSS feed to tenant configuration"""
         self.rss_discovery.add_feed(feed_url)
+        if self.feed_scheduler is not None:
+            self.feed_scheduler.wake()
         logger.info(f"➕ Added RSS feed for tenant {self.tenant_id}: {feed_url}")
     
+    async def crawl_sites(self, urls: List[str]) -> Dict[str, List[str]]:
+        """
+        Auto-discover feeds on many sites and start monitoring them
+        
+        Args:
+            urls: Funder website URLs
+            
+        Returns:
+            Discovered feed URLs by site URL
+        """
+        found = await self.crawler.crawl(urls)
+        if found and self.feed_scheduler is not None:
+            self.feed_scheduler.wake()
+        return found
+    
     def add_api_key(self, source: str, key: str) -> None:
         """Add API key for tenant configuration"""
         self.api_integrations.add_api_key(source, key)
@@ -125,15 +566,40 @@ class SourceManager:
         """Get timestamp of last discovery"""
         return self.last_discovery
     
+    def start_polling(self) -> None:
+        """Start background RSS polling if the feed scheduler is enabled"""
+        if self.feed_scheduler is not None:
+            self.feed_scheduler.start()
+    
+    async def aclose(self) -> None:
+        """Stop background polling and close the HTTP pool, parse pool and store"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self.feed_scheduler is not None:
+            await self.feed_scheduler.stop()
+        await self.http.aclose()
+        self.parser.shutdown()
+        if self.store is not None:
+            await self.store.close()
+    
     def get_source_stats(self) -> Dict:
         """Get statistics about configured sources"""
         return {
             'tenant_id': self.tenant_id,
             'rss_feeds': len(self.rss_discovery.get_feeds()),
             'api_keys': len(self.api_integrations.api_keys),
+            'grants_gov_sync': self.api_integrations.grants_gov.get_stats(),
             'swarm_feed_enabled': bool(self.swarm_feed.feed_url),
             'last_discovery': self.last_discovery.isoformat() if self.last_discovery else None,
             'cached_grants': len(self.cached_grants),
+            'dedup': self.dedup_stats,
+            'cache': dict(self.cache_stats, age_seconds=self.cache_age()),
+            'sources': {name: breaker.get_stats() for name, breaker in self.breakers.items()},
+            'store': type(self.store).__name__ if self.store else None,
+            'http': self.http.get_stats(),
+            'parser': self.parser.get_stats(),
+            'feed_scheduler': self.feed_scheduler.get_stats() if self.feed_scheduler else None,
+            'crawler': self.crawler.get_stats(),
         }
 
 
@@ -7,24 +7,36 @@ Includes enhanced parsing for Web3-specific metadata.
 
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 import feedparser
-import httpx
 from loguru import logger
 
+from ..nlp.keyword_matcher import GRANT_KEYWORDS
+from .http_client import HTTPClientPool
+from .parse_pool import FeedParsePool
+
 
 class SwarmFeed:
     """X SWARM RSS feed integration for Web3 grants"""
     
-    def __init__(self, feed_url: Optional[str] = None):
+    def __init__(
+        self,
+        feed_url: Optional[str] = None,
+        http_client: Optional[HTTPClientPool] = None,
+        parse_pool: Optional[FeedParsePool] = None
+    ):
         """
         Initialize SWARM feed integration
         
         Args:
             feed_url: X SWARM RSS feed URL (defaults to configured value)
+            http_client: Shared HTTP client pool (creates its own if omitted)
+            parse_pool: Shared feed parse pool (creates its own if omitted)
         """
         self.feed_url = feed_url or "https://twitter.com/swarm/rss"
+        self.http = http_client or HTTPClientPool()
+        self.parser = parse_pool or FeedParsePool()
         self.last_fetch: Optional[datetime] = None
         self.cache: List[Dict] = []
         
@@ -38,160 +50,151 @@ class SwarmFeed:
         grants = []
         
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                logger.info(f"📡 Fetching SWARM RSS feed from {self.feed_url}")
-                response = await client.get(self.feed_url)
-                response.raise_for_status()
-                
-                # Parse feed
-                feed = feedparser.parse(response.content)
-                
-                if feed.bozo:
-                    logger.warning(f"⚠️ Feed parsing issues for SWARM feed")
-                
-                # Extract grant opportunities
-                for entry in feed.entries:
-                    # Check if entry is grant-related
-                    if self._is_grant_opportunity(entry):
-                        grant = {
-                            'source': 'swarm_rss',
-                            'source_name': 'X SWARM',
-                            'category': 'web3',
-                            'feed_url': self.feed_url,
-                            'title': entry.get('title', 'Untitled'),
-                            'description': entry.get('summary', entry.get('description', '')),
-                            'link': entry.get('link', ''),
-                            'published': entry.get('published', entry.get('updated', '')),
-                            'published_parsed': entry.get('published_parsed'),
-                            'tags': self._extract_tags(entry),
-                            'web3_metadata': self._extract_web3_metadata(entry),
-                            'discovered_at': datetime.utcnow().isoformat(),
-                        }
-                        
-                        grants.append(grant)
-                
-                self.cache = grants
-                self.last_fetch = datetime.utcnow()
-                
-                logger.info(f"✅ Fetched {len(grants)} Web3 grants from SWARM feed")
-                
+            grants = await self.fetch()
         except Exception as e:
             logger.error(f"❌ Error fetching SWARM feed: {e}")
             
         return grants
     
-    def _is_grant_opportunity(self, entry: Dict) -> bool:
+    async def fetch(self) -> List[Dict]:
         """
-        Determine if feed entry is a grant opportunity
+        Fetch and parse the SWARM feed, raising on failure
+        
+        Returns:
+            List of Web3 grant opportunities
+        """
+        logger.info(f"📡 Fetching SWARM RSS feed from {self.feed_url}")
+        response = await self.http.get(self.feed_url)
+        response.raise_for_status()
+        
+        # Parse in the pool so large feeds don't block the event loop
+        grants = await self.parser.run(self.parse_entries, self.feed_url, response.content)
+        
+        self.cache = grants
+        self.last_fetch = datetime.utcnow()
+        
+        logger.info(f"✅ Fetched {len(grants)} Web3 grants from SWARM feed")
+        return grants
+    
+    @staticmethod
+    def parse_entries(feed_url: str, content: bytes) -> List[Dict]:
+        """
+        Parse raw SWARM feed content into Web3 grant opportunities
+        
+        CPU-bound; runs in the parse pool rather than on the event loop.
         
         Args:
-            entry: Feed entry dictionary
+            feed_url: Feed URL the content came from
+            content: Raw feed bytes
             
         Returns:
-            True if entry appears to be a grant opportunity
+            List of Web3 grant opportunities
         """
-        # Keywords that indicate grant opportunities
-        grant_keywords = [
-            'grant', 'funding', 'rfp', 'proposal',
-            'application', 'opportunity', 'award',
-            'bounty', 'prize', 'competition'
-        ]
-        
-        # Check title and description
+        grants = []
+        
+        # Parse feed
+        feed = feedparser.parse(content)
+        
+        if feed.bozo:
+            logger.warning(f"⚠️ Feed parsing issues for SWARM feed")
+        
+        # Extract grant opportunities
+        for entry in feed.entries:
+            # One keyword pass serves the grant check, tags and metadata
+            found = SwarmFeed._scan(entry)
+            
+            # Check if entry is grant-related
+            if SwarmFeed._is_grant_opportunity(entry, found):
+                grant = {
+                    'source': 'swarm_rss',
+                    'source_name': 'X SWARM',
+                    'category': 'web3',
+                    'feed_url': feed_url,
+                    'title': entry.get('title', 'Untitled'),
+                    'description': entry.get('summary', entry.get('description', '')),
+                    'link': entry.get('link', ''),
+                    'published': entry.get('published', entry.get('updated', '')),
+                    'published_parsed': entry.get('published_parsed'),
+                    'tags': SwarmFeed._extract_tags(entry, found),
+                    'web3_metadata': SwarmFeed._extract_web3_metadata(entry, found),
+                    'discovered_at': datetime.utcnow().isoformat(),
+                }
+                
+                grants.append(grant)
+        
+        return grants
+    
+    @staticmethod
+    def _scan(entry: Dict) -> Dict[str, Set[str]]:
+        """Match every keyword table against an entry's text in one pass"""
         text = (
             entry.get('title', '') + ' ' +
             entry.get('summary', '') + ' ' +
             entry.get('description', '')
-        ).lower()
+        )
+        return GRANT_KEYWORDS.scan(text)
+    
+    @staticmethod
+    def _is_grant_opportunity(entry: Dict, found: Optional[Dict[str, Set[str]]] = None) -> bool:
+        """
+        Determine if feed entry is a grant opportunity
         
-        return any(keyword in text for keyword in grant_keywords)
+        Args:
+            entry: Feed entry dictionary
+            found: Keyword matches from _scan (scanned here if omitted)
+            
+        Returns:
+            True if entry appears to be a grant opportunity
+        """
+        if found is None:
+            found = SwarmFeed._scan(entry)
+        return 'grant_signals' in found
     
-    def _extract_tags(self, entry: Dict) -> List[str]:
+    @staticmethod
+    def _extract_tags(entry: Dict, found: Optional[Dict[str, Set[str]]] = None) -> List[str]:
         """
         Extract and enhance tags from entry
         
         Args:
             entry: Feed entry dictionary
+            found: Keyword matches from _scan (scanned here if omitted)
             
         Returns:
             List of tags
         """
         tags = [tag.term for tag in entry.get('tags', [])]
+        if found is None:
+            found = SwarmFeed._scan(entry)
         
         # Add Web3-specific tags based on content
-        text = (
-            entry.get('title', '') + ' ' +
-            entry.get('summary', '') + ' ' +
-            entry.get('description', '')
-        ).lower()
-        
-        web3_tags = {
-            'web3': ['web3', 'web 3'],
-            'blockchain': ['blockchain', 'chain'],
-            'defi': ['defi', 'decentralized finance'],
-            'nft': ['nft', 'non-fungible'],
-            'dao': ['dao', 'decentralized autonomous'],
-            'smart-contract': ['smart contract', 'solidity'],
-            'ethereum': ['ethereum', 'eth'],
-            'crypto': ['crypto', 'cryptocurrency'],
-        }
-        
-        for tag, keywords in web3_tags.items():
-            if any(keyword in text for keyword in keywords):
-                if tag not in tags:
-                    tags.append(tag)
+        for tag in GRANT_KEYWORDS.ordered(found, 'web3_tags'):
+            if tag not in tags:
+                tags.append(tag)
         
         return tags
     
-    def _extract_web3_metadata(self, entry: Dict) -> Dict:
+    @staticmethod
+    def _extract_web3_metadata(entry: Dict, found: Optional[Dict[str, Set[str]]] = None) -> Dict:
         """
         Extract Web3-specific metadata from entry
         
         Args:
             entry: Feed entry dictionary
+            found: Keyword matches from _scan (scanned here if omitted)
             
         Returns:
             Dictionary of Web3 metadata
         """
-        metadata = {
-            'blockchain_networks': [],
-            'grant_type': 'unknown',
+        if found is None:
+            found = SwarmFeed._scan(entry)
+        
+        grant_types = GRANT_KEYWORDS.ordered(found, 'grant_types')
+        return {
+            'blockchain_networks': GRANT_KEYWORDS.ordered(found, 'networks'),
+            'grant_type': grant_types[0] if grant_types else 'unknown',
             'estimated_amount': None,
             'application_deadline': None,
         }
-        
-        text = (
-            entry.get('title', '') + ' ' +
-            entry.get('summary', '') + ' ' +
-            entry.get('description', '')
-        ).lower()
-        
-        # Detect blockchain networks
-        networks = {
-            'ethereum': ['ethereum', 'eth', 'evm'],
-            'solana': ['solana', 'sol'],
-            'polygon': ['polygon', 'matic'],
-            'arbitrum': ['arbitrum'],
-            'optimism': ['optimism'],
-            'avalanche': ['avalanche', 'avax'],
-            'cardano': ['cardano', 'ada'],
-        }
-        
-        for network, keywords in networks.items():
-            if any(keyword in text for keyword in keywords):
-                metadata['blockchain_networks'].append(network)
-        
-        # Detect grant type
-        if 'research' in text:
-            metadata['grant_type'] = 'research'
-        elif 'development' in text or 'builder' in text:
-            metadata['grant_type'] = 'development'
-        elif 'community' in text:
-            metadata['grant_type'] = 'community'
-        elif 'ecosystem' in text:
-            metadata['grant_type'] = 'ecosystem'
-        
-        return metadata
     
     def get_cached_grants(self) -> List[Dict]:
         """Get cached grants from last fetch"""
@@ -0,0 +1,262 @@
+"""
+SWARM Grant Bot - Multi-Tenant Registry
+
+Lightweight per-tenant state (profile, feed subscriptions, filters and
+prioritization weights) on top of one shared SourceManager. Every feed is
+fetched once per discovery run, however many tenants subscribe to it, and
+the results are fanned out to each subscribing tenant.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from .nlp import EligibilityFilter, FeatureCache, GrantPrioritizer, MatchMatrix, SemanticMatcher
+from .sources import SourceManager
+
+
+class TenantProfile:
+    """Per-tenant matching state; holds no connections or caches of its own"""
+
+    def __init__(
+        self,
+        tenant_id: str,
+        org_profile: Dict,
+        rss_feeds: Optional[List[str]] = None,
+        sources: Optional[Set[str]] = None,
+        categories: Optional[List[str]] = None,
+        min_match_score: float = 0.3,
+        weights: Optional[Dict[str, float]] = None,
+        feature_cache: Optional[FeatureCache] = None,
+        semantic_matcher: Optional[SemanticMatcher] = None,
+        tenant_feeds: Optional[Set[str]] = None
+    ):
+        """
+        Initialize tenant profile
+
+        Args:
+            tenant_id: Tenant identifier
+            org_profile: Organization profile with tags and metadata
+            rss_feeds: RSS feeds this tenant subscribes to; None for the
+                globally configured feeds
+            sources: Non-RSS sources to include (e.g. {'grants_gov'}); None for all
+            categories: Only keep grants in these categories; None for all
+            min_match_score: Eligibility threshold
+            weights: Prioritization weights
+            feature_cache: NLP feature cache shared across tenants
+            semantic_matcher: Embedding matcher and vector index shared across tenants
+            tenant_feeds: Feeds added to the shared layer for specific tenants,
+                which tenants without a feed list do not see (kept live by
+                the registry)
+        """
+        self.tenant_id = tenant_id
+        self.org_profile = org_profile
+        self.rss_feeds = set(rss_feeds) if rss_feeds is not None else None
+        self.tenant_feeds = tenant_feeds if tenant_feeds is not None else set()
+        self.sources = set(sources) if sources is not None else None
+        self.categories = set(categories) if categories else None
+        self.eligibility_filter = EligibilityFilter(
+            org_profile,
+            min_match_score=min_match_score,
+            feature_cache=feature_cache,
+            semantic_matcher=semantic_matcher
+        )
+        self.prioritizer = GrantPrioritizer(weights=weights, feature_cache=feature_cache)
+
+    def subscribes_to(self, grant: Dict) -> bool:
+        """Check whether a shared grant belongs in this tenant's view"""
+        if self.categories is not None and grant.get('category') not in self.categories:
+            return False
+
+        refs = grant.get('sources') or [grant]
+        for ref in refs:
+            source = ref.get('source')
+            if source == 'rss':
+                feed_url = ref.get('feed_url')
+                if self.rss_feeds is None:
+                    if feed_url not in self.tenant_feeds:
+                        return True
+                elif feed_url in self.rss_feeds:
+                    return True
+            elif self.sources is None or source in self.sources:
+                return True
+        return False
+
+    def get_info(self) -> Dict:
+        """Get tenant settings"""
+        return {
+            'tenant_id': self.tenant_id,
+            'rss_feeds': sorted(self.rss_feeds) if self.rss_feeds is not None else None,
+            'sources': sorted(self.sources) if self.sources is not None else None,
+            'categories': sorted(self.categories) if self.categories is not None else None,
+            'min_match_score': self.eligibility_filter.min_match_score,
+        }
+
+
+class TenantRegistry:
+    """Tenant-keyed registry sharing one source-fetch layer"""
+
+    def __init__(
+        self,
+        source_manager: SourceManager,
+        feature_cache: Optional[FeatureCache] = None,
+        semantic_matcher: Optional[SemanticMatcher] = None
+    ):
+        """
+        Initialize tenant registry
+
+        Args:
+            source_manager: Shared source manager that fetches for all tenants
+            feature_cache: NLP feature cache shared by every tenant (created if omitted)
+            semantic_matcher: Embedding matcher shared by every tenant (semantic
+                scoring is off if omitted)
+        """
+        self.source_manager = source_manager
+        self.feature_cache = feature_cache or FeatureCache()
+        self.semantic_matcher = semantic_matcher
+        self.tenants: Dict[str, TenantProfile] = {}
+
+        # Feeds this registry added to the shared layer for specific tenants.
+        # Every other shared feed is globally configured: it is what tenants
+        # without a feed list see, and it is never removed when tenants go away
+        self._added_feeds: Set[str] = set()
+
+        # Per-tenant views, reused until the shared grant list is replaced
+        self._views: Dict[str, tuple] = {}
+        self._indexed_grants: Optional[List[Dict]] = None
+
+    def register(self, tenant_id: str, org_profile: Dict, **settings) -> TenantProfile:
+        """
+        Register or replace a tenant
+
+        The tenant's feeds are added to the shared source layer, which
+        fetches each distinct feed once. Replacing a tenant releases the
+        feeds only its previous settings used.
+
+        Args:
+            tenant_id: Tenant identifier
+            org_profile: Organization profile
+            **settings: TenantProfile options (rss_feeds, sources, categories,
+                min_match_score, weights)
+
+        Returns:
+            The registered tenant profile
+        """
+        settings.setdefault('feature_cache', self.feature_cache)
+        settings.setdefault('semantic_matcher', self.semantic_matcher)
+        settings['tenant_feeds'] = self._added_feeds
+        tenant = TenantProfile(tenant_id, org_profile, **settings)
+        for feed_url in tenant.rss_feeds or ():
+            if feed_url not in self.source_manager.rss_discovery.get_feeds():
+                self.source_manager.add_rss_feed(feed_url)
+                self._added_feeds.add(feed_url)
+
+        previous = self.tenants.get(tenant_id)
+        self.tenants[tenant_id] = tenant
+        self._views.pop(tenant_id, None)
+        if previous is not None:
+            self._release_feeds(previous)
+        logger.info(f"🏢 Registered tenant {tenant_id}")
+        return tenant
+
+    def unregister(self, tenant_id: str) -> None:
+        """Remove a tenant; feeds nobody else subscribes to stop being fetched"""
+        tenant = self.tenants.pop(tenant_id, None)
+        self._views.pop(tenant_id, None)
+        if tenant is None:
+            return
+        self._release_feeds(tenant)
+        logger.info(f"🏢 Unregistered tenant {tenant_id}")
+
+    def _release_feeds(self, tenant: TenantProfile) -> None:
+        """Stop fetching feeds the registry added that no current tenant uses"""
+        if not tenant.rss_feeds:
+            return
+        # Tenants without a feed list only use globally configured feeds
+        still_used = set().union(*(t.rss_feeds or () for t in self.tenants.values()))
+        for feed_url in sorted(self._added_feeds - still_used):
+            self.source_manager.rss_discovery.remove_feed(feed_url)
+            self._added_feeds.discard(feed_url)
+
+    def get(self, tenant_id: str) -> TenantProfile:
+        """
+        Get a tenant profile
+
+        Raises:
+            KeyError: If the tenant is not registered
+        """
+        return self.tenants[tenant_id]
+
+    def view(self, tenant_id: str, grants: List[Dict]) -> List[Dict]:
+        """
+        A tenant's slice of the shared grants
+
+        Grants are shallow-copied so per-tenant scoring fields never leak
+        between tenants. The view is cached until the shared list changes.
+
+        Args:
+            tenant_id: Tenant identifier
+            grants: Shared grant list from the source manager
+
+        Returns:
+            Grants this tenant subscribes to, tagged with its tenant id
+        """
+        cached = self._views.get(tenant_id)
+        if cached is not None and cached[0] is grants:
+            return cached[1]
+
+        tenant = self.get(tenant_id)
+        view = [
+            dict(grant, tenant_id=tenant_id)
+            for grant in grants
+            if tenant.subscribes_to(grant)
+        ]
+        self._views[tenant_id] = (grants, view)
+        return view
+
+    def match_matrix(self, grants: List[Dict]) -> Tuple[List[str], object]:
+        """
+        Keyword match scores of every tenant against the same grants at once
+
+        Scores equal each tenant's ProfileMatcher score without the optional
+        semantic component.
+
+        Args:
+            grants: Grants to score
+
+        Returns:
+            Tenant ids (matrix rows) and a (tenants x grants) score array
+        """
+        tenant_ids = list(self.tenants)
+        matrix = MatchMatrix(
+            [self.tenants[tenant_id].org_profile for tenant_id in tenant_ids],
+            feature_cache=self.feature_cache
+        )
+        return tenant_ids, matrix.score(grants)
+
+    async def discover(self, tenant_id: str, use_cache: bool = True) -> List[Dict]:
+        """
+        Discover grants for one tenant through the shared source layer
+
+        Args:
+            tenant_id: Tenant identifier
+            use_cache: Serve from the shared cache when fresh
+
+        Returns:
+            The tenant's grants
+        """
+        grants = await self.source_manager.discover_all_grants(use_cache=use_cache)
+        if self.semantic_matcher is not None and grants is not self._indexed_grants:
+            # Rebuild the shared vector index around the new grant set
+            self.semantic_matcher.retain(grants)
+            self._indexed_grants = grants
+        return self.view(tenant_id, grants)
+
+    def get_stats(self) -> Dict:
+        """Get registry statistics"""
+        subscriptions = sum(len(t.rss_feeds or ()) for t in self.tenants.values())
+        return {
+            'tenants': len(self.tenants),
+            'feed_subscriptions': subscriptions,
+            'shared_feeds': len(self.source_manager.rss_discovery.get_feeds()),
+        }
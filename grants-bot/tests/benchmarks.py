@@ -0,0 +1,288 @@
+"""
+Benchmark Suite for Grant Bot - NLP Pipeline
+
+Times ProfileMatcher, EligibilityFilter and GrantPrioritizer over
+synthetic grant sets and reports grants/sec, the functions with the most
+cumulative time (cProfile) and peak traced memory as JSON. A saved report
+can be passed back as a baseline to fail on throughput regressions.
+
+Usage:
+    python -m grants_bot.tests.benchmarks --sizes 1000 10000 100000 --output baseline.json
+    python -m grants_bot.tests.benchmarks --baseline baseline.json
+"""
+
+import argparse
+import cProfile
+import json
+import platform
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from grants_bot.nlp import EligibilityFilter, FeatureCache, GrantPrioritizer, ProfileMatcher
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (1000, 10000, 100000)
+TOP_FUNCTIONS = 15
+
+ORG_PROFILE = {
+    'name': 'Benchmark Org',
+    'tags': ['web3', 'women', 'woman-owned', 'tech', 'nonprofit', 'blockchain', 'ai'],
+    'legal_structure': 'LLC',
+    'location': 'United States',
+}
+EXCLUDE_KEYWORDS = ['loan', 'equity', 'debt financing']
+
+# Filler vocabulary plus words the keyword tables react to
+WORDS = (
+    'program support project community research development applicants organizations '
+    'funding award impact innovation education health climate energy rural urban small '
+    'business capacity training infrastructure open source public goods ecosystem builders '
+    'technology digital decentralized blockchain crypto women founders nonprofit machine '
+    'learning artificial intelligence ethereum solana smart contract proposal deadline '
+    'eligible budget milestone outcomes evaluation partnership local regional national'
+).split()
+CATEGORIES = ['web3', 'tech', 'women_in_tech', 'nonprofit', 'health', 'arts', 'education', 'manufacturing']
+TAGS = ['web3', 'women', 'tech', 'ai', 'blockchain', 'health', 'education', 'climate', 'arts']
+
+
+def synthetic_grants(count: int, seed: int = 42) -> List[Dict]:
+    """
+    Deterministic synthetic grants with realistic description lengths
+
+    Descriptions run 80-400 words, like typical RSS and Grants.gov synopses.
+
+    Args:
+        count: Number of grants
+        seed: Random seed
+
+    Returns:
+        Grant dictionaries
+    """
+    rng = random.Random(seed)
+    today = datetime.utcnow()
+    grants = []
+    for i in range(count):
+        description = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(80, 400)))
+        grants.append({
+            'grant_id': f'bench-{i}',
+            'title': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 9))).title() + ' Grant',
+            'description': description,
+            'category': rng.choice(CATEGORIES),
+            'tags': rng.sample(TAGS, rng.randint(0, 4)),
+            'amount': rng.choice([0, 5000, 25000, 100000, 500000, 2000000]),
+            'deadline': (today + timedelta(days=rng.randint(-10, 200))).strftime('%Y-%m-%d')
+            if rng.random() < 0.9 else None,
+            'legal_requirements': rng.choice([[], [], ['llc'], ['501c3']]),
+            'geographic_restrictions': rng.choice([[], [], ['united states'], ['canada'], ['global']]),
+        })
+    return grants
+
+
+def bench_profile_matcher(grants: List[Dict]) -> Callable[[], object]:
+    """Feature extraction and batch scoring with a cold cache"""
+    matcher = ProfileMatcher(ORG_PROFILE, feature_cache=FeatureCache(max_entries=len(grants)))
+    return lambda: matcher.score_batch([matcher.extract_features(grant) for grant in grants])
+
+
+def bench_eligibility_filter(grants: List[Dict]) -> Callable[[], object]:
+    """Full filter chain (exclusions, amount, deadline, match score) with a cold cache"""
+    filter_obj = EligibilityFilter(
+        ORG_PROFILE,
+        exclude_keywords=EXCLUDE_KEYWORDS,
+        feature_cache=FeatureCache(max_entries=len(grants))
+    )
+    copies = [dict(grant) for grant in grants]
+    return lambda: filter_obj.filter_grants(copies, min_amount=1000, days_minimum=7)
+
+
+def bench_prioritizer(grants: List[Dict]) -> Callable[[], object]:
+    """Priority scoring and sorting of already-matched grants with a cold cache"""
+    matcher = ProfileMatcher(ORG_PROFILE)
+    copies = []
+    for grant in grants:
+        copy = dict(grant)
+        copy['match_details'] = matcher.get_match_details(grant)
+        copy['match_score'] = copy['match_details']['match_score']
+        copies.append(copy)
+    prioritizer = GrantPrioritizer(feature_cache=FeatureCache(max_entries=len(grants)))
+    return lambda: prioritizer.prioritize_grants(copies)
+
+
+BENCHMARKS = {
+    'profile_matcher': bench_profile_matcher,
+    'eligibility_filter': bench_eligibility_filter,
+    'prioritizer': bench_prioritizer,
+}
+
+
+def _top_functions(profile: cProfile.Profile, limit: int) -> List[Dict]:
+    """Functions with the most cumulative time, as plain data"""
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, name), (_, calls, _, cumulative, _) in stats.stats.items():
+        rows.append({
+            'function': f"{filename.replace(chr(92), '/').split('/')[-1]}:{line}({name})",
+            'calls': calls,
+            'cumulative_seconds': round(cumulative, 6),
+        })
+    rows.sort(key=lambda row: (-row['cumulative_seconds'], row['function']))
+    return rows[:limit]
+
+
+def run_benchmark(name: str, grants: List[Dict], profile: bool = True) -> Dict:
+    """
+    Measure one component over a grant set
+
+    Timing, profiling and memory tracing each get their own cold run so
+    the profiler and tracemalloc overhead never skews grants/sec.
+
+    Args:
+        name: Key in BENCHMARKS
+        grants: Synthetic grants
+        profile: Also collect cProfile and peak memory figures
+
+    Returns:
+        Result record
+    """
+    setup = BENCHMARKS[name]
+
+    run = setup(grants)
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    result = {
+        'component': name,
+        'grants': len(grants),
+        'seconds': round(seconds, 6),
+        'grants_per_sec': round(len(grants) / seconds, 1) if seconds > 0 else None,
+        'peak_memory_bytes': None,
+        'top_functions': [],
+    }
+    if not profile:
+        return result
+
+    run = setup(grants)
+    profiler = cProfile.Profile()
+    profiler.runcall(run)
+    result['top_functions'] = _top_functions(profiler, TOP_FUNCTIONS)
+
+    run = setup(grants)
+    tracemalloc.start()
+    try:
+        run()
+        result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return result
+
+
+def run_suite(
+    sizes=DEFAULT_SIZES,
+    components: Optional[List[str]] = None,
+    profile: bool = True,
+    seed: int = 42
+) -> Dict:
+    """
+    Run every benchmark at every size
+
+    Args:
+        sizes: Grant set sizes
+        components: Benchmarks to run (all by default)
+        profile: Collect cProfile and memory figures
+        seed: Synthetic data seed
+
+    Returns:
+        Report with environment details and one result per component and size
+    """
+    results = []
+    for size in sizes:
+        grants = synthetic_grants(size, seed=seed)
+        for name in components or BENCHMARKS:
+            results.append(run_benchmark(name, grants, profile=profile))
+
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'numpy': numpy_version,
+        'platform': platform.platform(),
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float = 0.25) -> List[str]:
+    """
+    Find throughput regressions against a baseline report
+
+    Args:
+        report: Current report from run_suite
+        baseline: Earlier report
+        tolerance: Allowed fractional drop in grants/sec
+
+    Returns:
+        One message per component and size that got slower than allowed
+    """
+    previous = {
+        (result['component'], result['grants']): result['grants_per_sec']
+        for result in baseline.get('results', [])
+    }
+    regressions = []
+    for result in report['results']:
+        before = previous.get((result['component'], result['grants']))
+        after = result['grants_per_sec']
+        if before and after is not None and after < before * (1 - tolerance):
+            regressions.append(
+                f"{result['component']} @ {result['grants']}: "
+                f"{after:.0f} grants/sec vs baseline {before:.0f} ({after / before - 1:+.0%})"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the grants-bot NLP pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--components', nargs='+', choices=sorted(BENCHMARKS))
+    parser.add_argument('--no-profile', action='store_true', help="Only measure grants/sec")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="Write the JSON report here (stdout by default)")
+    parser.add_argument('--baseline', help="Earlier JSON report to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed grants/sec drop")
+    args = parser.parse_args(argv)
+
+    # Keep pipeline logging out of the measurements
+    from loguru import logger
+    logger.remove()
+
+    report = run_suite(args.sizes, args.components, profile=not args.no_profile, seed=args.seed)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        for message in regressions:
+            print(f"❌ Regression: {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
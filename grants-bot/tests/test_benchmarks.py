@@ -0,0 +1,56 @@
+"""
+Test Suite for Grant Bot - Benchmark Suite
+
+Runs the NLP benchmarks at a small size to keep the report format and the
+regression check working.
+"""
+
+import json
+
+import pytest
+
+from .benchmarks import BENCHMARKS, compare, run_suite, synthetic_grants
+
+
+class TestBenchmarks:
+    """Tests for the NLP benchmark suite"""
+
+    def test_synthetic_grants_deterministic(self):
+        """Test the same seed produces the same grants"""
+        first = synthetic_grants(50, seed=7)
+        assert first == synthetic_grants(50, seed=7)
+        assert all(80 <= len(g['description'].split()) <= 400 for g in first)
+
+    def test_report_format(self):
+        """Test every component reports throughput, hot functions and peak memory"""
+        report = run_suite(sizes=[200])
+
+        assert report['schema_version'] == 1
+        assert [r['component'] for r in report['results']] == list(BENCHMARKS)
+        for result in report['results']:
+            assert result['grants'] == 200
+            assert result['grants_per_sec'] > 0
+            assert result['peak_memory_bytes'] > 0
+            assert result['top_functions'][0]['cumulative_seconds'] > 0
+        assert json.loads(json.dumps(report)) == report
+
+    def test_compare_flags_regressions(self):
+        """Test only drops beyond the tolerance are reported"""
+        baseline = {'results': [
+            {'component': 'prioritizer', 'grants': 1000, 'grants_per_sec': 1000.0},
+            {'component': 'profile_matcher', 'grants': 1000, 'grants_per_sec': 1000.0},
+        ]}
+        report = {'results': [
+            {'component': 'prioritizer', 'grants': 1000, 'grants_per_sec': 800.0},
+            {'component': 'profile_matcher', 'grants': 1000, 'grants_per_sec': 500.0},
+            {'component': 'eligibility_filter', 'grants': 1000, 'grants_per_sec': 10.0},
+        ]}
+
+        regressions = compare(report, baseline, tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith('profile_matcher @ 1000')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,8 +4,14 @@ Test Suite for Grant Bot - NLP Modules
 Tests for profile matching, eligibility filtering, and prioritization.
 """
 
+from datetime import datetime, timedelta
+
+import numpy as np
 import pytest
-from grants_bot.nlp import ProfileMatcher, EligibilityFilter, GrantPrioritizer
+from grants_bot.nlp.deadlines import parse_deadline, normalize_deadline, urgency_scores, days_until
+from grants_bot.nlp import ProfileMatcher, EligibilityFilter, GrantPrioritizer, IncrementalRanker, KeywordMatcher, GRANT_KEYWORDS, FeatureCache, SemanticMatcher, MatchMatrix
+from grants_bot.nlp.semantic_matcher import grant_text
+from grants_bot.sources import SwarmFeed
 
 
 class TestProfileMatcher:
@@ -106,6 +112,68 @@ class TestEligibilityFilter:
         stats = filter_obj.get_filter_stats(original, filtered)
         assert stats['total_grants'] == 2
         assert stats['eligible_grants'] == 1
+    
+    def test_batch_scores_match_scalar_scores(self):
+        """Test vectorized batch scoring gives exactly the per-grant scores"""
+        org_profile = {
+            'tags': ['web3', 'women', 'tech', 'ai'],
+            'legal_structure': 'LLC',
+            'location': 'United States'
+        }
+        matcher = ProfileMatcher(org_profile)
+        grants = [
+            {'title': 'Web3 Grant', 'category': 'web3', 'tags': ['web3', 'tech']},
+            {'title': 'AI research', 'description': 'Machine learning for NGOs', 'category': 'research'},
+            {'title': 'Local Grant', 'geographic_restrictions': ['Canada'], 'legal_requirements': ['501c3']},
+            {'title': 'Manufacturing Grant', 'category': 'manufacturing', 'tags': ['manufacturing']},
+            {},
+        ] * 50
+        
+        features = [matcher.extract_features(grant) for grant in grants]
+        batch = matcher.score_batch(features)
+        
+        assert [float(score) for score in batch] == [matcher.calculate_match_score(g) for g in grants]
+        
+        eligible = EligibilityFilter(org_profile, min_match_score=0.3).filter_grants([dict(g) for g in grants])
+        assert len(eligible) == 200  # Only the Canadian 501(c)(3) grant falls short
+        assert eligible[0]['match_details'] == matcher.get_match_details(grants[0])
+    
+    def test_single_pass_chain_matches_separate_filters(self):
+        """Test the fused filter chain keeps exactly what the separate passes keep"""
+        org_profile = {'tags': ['web3', 'tech'], 'legal_structure': 'LLC', 'location': 'United States'}
+        filter_obj = EligibilityFilter(org_profile, exclude_keywords=['loan', 'Equity'])
+        today = datetime.utcnow()
+        grants = [
+            {
+                'title': f"{['Web3', 'Tech', 'Equity'][i % 3]} Grant {i}",
+                'description': 'Small business loan' if i % 7 == 0 else 'For builders',
+                'category': ['web3', 'Tech', 'arts'][i % 3],
+                'tags': ['web3'],
+                'amount': [0, 5000, 50000, 500000][i % 4],
+                'deadline': (today + timedelta(days=i % 40)).strftime('%Y-%m-%d') if i % 5 else None,
+            }
+            for i in range(120)
+        ]
+        
+        separate = filter_obj.filter_by_category(grants, ['web3', 'tech'])
+        separate = filter_obj.filter_by_amount(separate, min_amount=1000, max_amount=100000)
+        separate = filter_obj.filter_by_deadline(separate, days_minimum=14)
+        separate = filter_obj.filter_grants([dict(g) for g in separate])
+        
+        fused = filter_obj.filter_grants(
+            [dict(g) for g in grants],
+            min_amount=1000,
+            max_amount=100000,
+            days_minimum=14,
+            categories=['web3', 'tech']
+        )
+        
+        assert [g['title'] for g in fused] == [g['title'] for g in separate]
+        assert fused
+        rejections = filter_obj.last_rejections
+        assert list(rejections) == ['category', 'amount', 'deadline', 'excluded', 'match_score']
+        assert rejections['category'] == 40
+        assert sum(rejections.values()) == len(grants) - len(fused)
 
 
 class TestGrantPrioritizer:
@@ -155,6 +223,298 @@ class TestGrantPrioritizer:
         
         top_5 = prioritizer.get_top_grants(grants, count=5)
         assert len(top_5) == 5
+    
+    def test_top_grants_match_full_sort(self):
+        """Test heap top-K returns the head of the full prioritized order"""
+        prioritizer = GrantPrioritizer()
+        grants = [
+            {'title': f'Grant {i}', 'match_score': (i % 7) / 7, 'amount': 5000 * (i % 5), 'category': 'web3' if i % 3 else 'ai'}
+            for i in range(100)
+        ]
+        
+        expected = [g['title'] for g in prioritizer.prioritize_grants([dict(g) for g in grants])[:10]]
+        assert [g['title'] for g in prioritizer.get_top_grants([dict(g) for g in grants], count=10)] == expected
+        
+        grant = grants[0]
+        breakdown = prioritizer._get_priority_breakdown(grant)
+        assert prioritizer._calculate_priority_score(grant) == prioritizer._score_from_breakdown(breakdown)
+    
+    def test_incremental_ranker(self):
+        """Test the ranker scores only new grants and keeps the full order"""
+        prioritizer = GrantPrioritizer()
+        ranker = IncrementalRanker(prioritizer)
+        grants = [
+            {'grant_id': str(i), 'title': f'Grant {i}', 'match_score': (i * 37 % 100) / 100, 'amount': 1000 * i}
+            for i in range(60)
+        ]
+        
+        ranker.add(grants[:40])
+        ranker.add(grants[40:])
+        lookups = prioritizer.cache.get_stats()['components']['prioritizer']['misses']
+        expected = [g['grant_id'] for g in prioritizer.prioritize_grants([dict(g) for g in grants])]
+        
+        assert lookups == 60
+        assert [g['grant_id'] for g in ranker.top(60)] == expected
+        
+        ranker.add([dict(grants[0], match_score=1.0, amount=200000)])
+        assert len(ranker) == 60
+        assert ranker.top(1)[0]['grant_id'] == '0'
+        assert ranker.remove('0') and not ranker.remove('0')
+        assert len(ranker) == 59
+
+
+class TestDeadlines:
+    """Tests for parse-once deadlines and batch urgency"""
+    
+    def test_parse_formats(self):
+        """Test ISO, timestamp and US formats parse to the same ordinal"""
+        expected = datetime(2024, 12, 31).toordinal()
+        assert parse_deadline('2024-12-31') == expected
+        assert parse_deadline('2024-12-31T23:59:59') == expected
+        assert parse_deadline('12/31/2024') == expected
+        assert parse_deadline('2024-1-5') == datetime(2024, 1, 5).toordinal()
+        assert parse_deadline('rolling') is None
+        
+        grant = {'deadline': '12/31/2024'}
+        assert normalize_deadline(grant) == expected
+        assert grant['deadline_ordinal'] == expected
+    
+    def test_batch_urgency_matches_timedelta_days(self):
+        """Test vectorized days-until and buckets agree with datetime arithmetic"""
+        now = datetime(2024, 6, 1, 15, 30)
+        offsets = list(range(-3, 120))
+        ordinals = [(now + timedelta(days=d)).toordinal() for d in offsets] + [None]
+        
+        days = days_until(ordinals, now)
+        expected_days = [(datetime.fromordinal(o) - now).days for o in ordinals[:-1]]
+        assert days[:-1].tolist() == expected_days
+        
+        def bucket(d):
+            if d < 7:
+                return 0.3
+            if d < 14:
+                return 0.6
+            if d < 30:
+                return 0.8
+            if d <= 60:
+                return 1.0
+            if d <= 90:
+                return 0.8
+            return 0.6
+        
+        assert urgency_scores(ordinals, now) == [bucket(d) for d in expected_days] + [0.5]
+    
+    def test_filter_by_deadline(self):
+        """Test deadline filtering keeps far and unknown deadlines"""
+        filter_obj = EligibilityFilter({'tags': []})
+        soon = (datetime.utcnow() + timedelta(days=3)).strftime('%m/%d/%Y')
+        later = (datetime.utcnow() + timedelta(days=40)).strftime('%Y-%m-%d')
+        grants = [{'deadline': soon}, {'deadline': later}, {'deadline': ''}, {'deadline': 'TBD'}]
+        
+        kept = filter_obj.filter_by_deadline(grants, days_minimum=14)
+        assert [g['deadline'] for g in kept] == [later, '', 'TBD']
+
+
+class TestFeatureCache:
+    """Tests for the shared grant feature cache"""
+    
+    def test_repeat_calls_hit_cache(self):
+        """Test unchanged grants reuse features, exclusions and priorities"""
+        cache = FeatureCache()
+        org_profile = {'tags': ['web3', 'tech'], 'legal_structure': 'LLC', 'location': 'United States'}
+        filter_obj = EligibilityFilter(org_profile, exclude_keywords=['loan'], feature_cache=cache)
+        prioritizer = GrantPrioritizer(feature_cache=cache)
+        grants = [
+            {'title': f'Web3 Grant {i}', 'category': 'web3', 'tags': ['web3'], 'amount': 1000 * i}
+            for i in range(10)
+        ]
+        
+        first = prioritizer.prioritize_grants(filter_obj.filter_grants([dict(g) for g in grants]))
+        second = prioritizer.prioritize_grants(filter_obj.filter_grants([dict(g) for g in grants]))
+        stats = cache.get_stats()['components']
+        
+        assert [g['priority_score'] for g in first] == [g['priority_score'] for g in second]
+        for component in ('profile_matcher', 'eligibility_filter', 'prioritizer'):
+            assert stats[component] == {'hits': 10, 'misses': 10, 'hit_rate': 0.5}
+    
+    def test_content_and_profile_changes_miss(self):
+        """Test edited grants and other profiles never see stale features"""
+        cache = FeatureCache()
+        web3 = ProfileMatcher({'tags': ['web3']}, feature_cache=cache)
+        ai = ProfileMatcher({'tags': ['ai']}, feature_cache=cache)
+        grant = {'title': 'Web3 Grant', 'category': 'web3'}
+        
+        assert web3.extract_features(grant)['tag_overlap'] == 1
+        assert ai.extract_features(grant)['tag_overlap'] == 0
+        grant['title'] = 'AI Grant'
+        assert ai.extract_features(grant)['tag_overlap'] == 1
+        assert cache.get_stats()['components']['profile_matcher']['hits'] == 0
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        cache = FeatureCache(max_entries=2)
+        cache.get_or_compute('test', 'a', lambda: 1)
+        cache.get_or_compute('test', 'b', lambda: 2)
+        cache.get_or_compute('test', 'a', lambda: 1)
+        cache.get_or_compute('test', 'c', lambda: 3)
+        
+        assert cache.get_or_compute('test', 'a', lambda: None) == 1
+        assert cache.get_or_compute('test', 'b', lambda: None) is None
+        assert cache.get_stats()['evictions'] == 2
+
+
+class TestKeywordMatcher:
+    """Tests for the compiled keyword matcher"""
+    
+    def test_word_boundaries(self):
+        """Test keywords no longer match inside other words"""
+        found = GRANT_KEYWORDS.scan("A new method for the solution, said the paid panel")
+        assert 'networks' not in found
+        assert 'ai' not in found.get('grant_tags', set())
+    
+    def test_plurals_and_nested_keywords(self):
+        """Test plurals match and nested keywords keep their own labels"""
+        found = GRANT_KEYWORDS.scan("Grants for women-owned\nDecentralized  Finance builders")
+        assert found['grant_signals'] == {'grant'}
+        assert {'women', 'woman-owned', 'web3'} <= found['grant_tags']
+        assert 'defi' in found['web3_tags']
+        assert GRANT_KEYWORDS.ordered(found, 'grant_types') == ['development']
+    
+    def test_custom_tables(self):
+        """Test one matcher serves several tables in one scan"""
+        matcher = KeywordMatcher({
+            'colors': {'red': ['red', 'crimson']},
+            'shapes': {'circle': ['circle', 'red circle']},
+        })
+        assert matcher.scan("A crimson square and a Red Circle") == {
+            'colors': {'red'},
+            'shapes': {'circle'},
+        }
+    
+    def test_swarm_metadata_uses_boundaries(self):
+        """Test SWARM metadata ignores 'eth' and 'sol' inside words"""
+        entry = {'title': 'Research grant', 'summary': 'A method to find a solution on Solana'}
+        metadata = SwarmFeed._extract_web3_metadata(entry)
+        assert metadata['blockchain_networks'] == ['solana']
+        assert metadata['grant_type'] == 'research'
+        assert SwarmFeed._is_grant_opportunity(entry)
+
+
+class TestSemanticMatcher:
+    """Tests for embedding-based semantic matching"""
+    
+    VOCABULARY = ['climate', 'solar', 'energy', 'women', 'founders', 'music', 'art']
+    
+    def make_encoder(self, calls):
+        """Bag-of-words encoder standing in for the sentence-transformers model"""
+        def encode(texts):
+            calls.append(list(texts))
+            return [[text.lower().count(word) for word in self.VOCABULARY] for text in texts]
+        return encode
+    
+    def test_vectors_cached_by_content(self):
+        """Test each distinct grant text is embedded once and indexed for top-K"""
+        calls = []
+        semantic = SemanticMatcher(encoder=self.make_encoder(calls))
+        grants = [
+            {'grant_id': 'solar', 'title': 'Solar energy', 'description': 'Climate energy grant'},
+            {'grant_id': 'art', 'title': 'Art fund', 'description': 'Music and art'},
+            {'grant_id': 'solar-copy', 'title': 'Solar energy', 'description': 'Climate energy grant'},
+        ]
+        
+        semantic.embed_grants(grants)
+        semantic.embed_grants(grants[:2])
+        profile = semantic.embed_profile({'narrative': 'Climate and solar energy founders'})
+        
+        assert calls[0] == ['Solar energy\nClimate energy grant', 'Art fund\nMusic and art']
+        assert len(calls) == 2  # grants batch + profile
+        assert semantic.get_stats()['indexed'] == 2
+        assert semantic.top_k(profile, k=1)[0][0] == 'solar'
+        assert [gid for gid, _ in semantic.top_k(profile, k=2)] == ['solar', 'solar-copy']
+    
+    def test_index_is_bounded_and_rebuilt(self):
+        """Test least recently used vectors are evicted and retain() drops stale content"""
+        semantic = SemanticMatcher(encoder=self.make_encoder([]), max_indexed=4)
+        grants = [
+            {'grant_id': str(i), 'title': ' '.join(self.VOCABULARY[:i + 1])}
+            for i in range(6)
+        ]
+        
+        semantic.embed_grants(grants[:4])
+        semantic.embed_grants(grants[:1])
+        vectors = semantic.embed_grants(grants[4:])
+        
+        # Grant 0 was used again, so grants 1 and 2 were the ones evicted
+        assert len(semantic.index) == 4
+        assert semantic.get_stats()['evicted'] == 2
+        assert semantic.content_hash(grant_text(grants[1])) not in semantic.index
+        assert np.allclose(vectors, semantic.embed_grants(grants[4:]))
+        assert semantic.index.labels(semantic.content_hash(grant_text(grants[0]))) == {'0'}
+        
+        # A grant whose content changed moves to its new vector
+        semantic.embed_grants([dict(grants[5], grant_id='0')])
+        assert semantic.index.labels(semantic.content_hash(grant_text(grants[0]))) == set()
+        
+        assert semantic.retain(grants[5:]) == 3
+        assert semantic.index.labels(semantic.content_hash(grant_text(grants[5]))) == {'0', '5'}
+    
+    def test_profile_matcher_component(self):
+        """Test the semantic score is an extra weighted component, batch == scalar"""
+        semantic = SemanticMatcher(encoder=self.make_encoder([]))
+        org_profile = {'tags': ['women'], 'narrative': 'Solar energy for climate', 'location': 'United States'}
+        plain = ProfileMatcher(org_profile)
+        matcher = ProfileMatcher(org_profile, semantic_matcher=semantic)
+        grants = [
+            {'title': 'Solar energy grant', 'description': 'Climate projects', 'category': 'energy'},
+            {'title': 'Music grant', 'description': 'For art', 'category': 'arts'},
+        ]
+        
+        matcher.prepare(grants)
+        features = [matcher.extract_features(g) for g in grants]
+        batch = matcher.score_batch(features)
+        
+        assert list(batch) == [matcher.score_features(f) for f in features]
+        assert features[0]['semantic_score'] > 0.9
+        assert features[1]['semantic_score'] == 0.0
+        assert batch[0] > plain.calculate_match_score(grants[0]) > batch[1]
+        assert matcher.semantic_top_k(1)[0][1] > 0.9
+        assert 'semantic_score' not in plain.extract_features(grants[0])
+
+
+class TestMatchMatrix:
+    """Tests for the bitset profile x grant match matrix"""
+    
+    def test_matches_profile_matcher(self):
+        """Test every cell equals the ProfileMatcher score for that pair"""
+        tags = ['web3', 'women', 'tech', 'ai', 'nonprofit', 'blockchain', 'health', 'Climate']
+        profiles = [
+            {
+                'tags': tags[i % 5:i % 5 + 1 + i % 4],
+                'legal_structure': ['LLC', 'nonprofit', 'corp'][i % 3],
+                'location': ['United States', 'Canada'][i % 2],
+            }
+            for i in range(12)
+        ]
+        profiles.append({'tags': []})
+        grants = [
+            {
+                'title': ['Web3 grant', 'AI for health', 'Women in tech fund', 'Arts'][j % 4],
+                'description': 'Blockchain research' if j % 3 == 0 else '',
+                'category': ['web3', 'health', 'climate', 'Other', ''][j % 5],
+                'tags': tags[j % 8:j % 8 + 2],
+                'legal_requirements': [[], ['llc'], ['501c3']][j % 3],
+                'geographic_restrictions': [[], ['canada'], ['global']][j % 3],
+            }
+            for j in range(40)
+        ]
+        
+        matrix = MatchMatrix(profiles).score(grants)
+        
+        assert matrix.shape == (13, 40)
+        for row, profile in enumerate(profiles):
+            matcher = ProfileMatcher(profile)
+            expected = matcher.score_batch([matcher.extract_features(g) for g in grants])
+            assert list(matrix[row]) == list(expected)
 
 
 if __name__ == "__main__":
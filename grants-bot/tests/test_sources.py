@@ -4,8 +4,27 @@ Test Suite for Grant Bot - Source Discovery
 Tests for RSS discovery, API integrations, SWARM feed, and source manager.
 """
 
+import asyncio
+import threading
+from datetime import date
+
+import httpx
 import pytest
-from grants_bot.sources import RSSDiscovery, APIIntegrations, SwarmFeed, SourceManager
+from grants_bot.sources import RSSDiscovery, APIIntegrations, SwarmFeed, SourceManager, HTTPClientPool, FeedScheduler, FeedParsePool, DuplicateIndex, SQLiteGrantStore, CircuitBreaker, GrantsGovSync, FeedCrawler
+
+
+SAMPLE_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Grants</title>
+<item><title>Web3 Builder Grant</title><link>https://example.com/g1</link>
+<description>Funding for Ethereum builders</description></item>
+</channel></rss>"""
+
+DATED_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Grants</title>
+<item><title>Grant A</title><link>https://example.com/a</link><pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>
+<item><title>Grant B</title><link>https://example.com/b</link><pubDate>Mon, 01 Jan 2024 04:00:00 GMT</pubDate></item>
+<item><title>Grant C</title><link>https://example.com/c</link><pubDate>Mon, 01 Jan 2024 08:00:00 GMT</pubDate></item>
+</channel></rss>"""
 
 
 class TestRSSDiscovery:
@@ -31,6 +50,52 @@ class TestRSSDiscovery:
         # In real test, would use mock feed data
         # For now, just ensure it doesn't crash
         pass
+    
+    @pytest.mark.asyncio
+    async def test_discover_feeds_reads_head_only(self):
+        """Test auto-discovery stops downloading at </head>"""
+        served = []
+        
+        async def page():
+            served.append("head")
+            yield (b'<html><head><base href="https://example.com/news/">'
+                   b'<link rel="alternate" type="application/rss+xml" href="grants.rss">'
+                   b'<link rel="alternate" type="application/atom+xml" href="/atom.xml">')
+            served.append("head-end")
+            yield b'<link rel="stylesheet" href="a.css"></head>'
+            served.append("body")
+            yield b'<body><link type="application/rss+xml" href="/ignored.rss"></body></html>'
+        
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=page()))
+        discovery = RSSDiscovery(http_client=HTTPClientPool(transport=transport))
+        
+        feeds = await discovery.discover_feeds_from_url("https://example.com/")
+        
+        assert feeds == ["https://example.com/news/grants.rss", "https://example.com/atom.xml"]
+        assert served == ["head", "head-end"]
+        assert discovery.get_all_feeds() == feeds
+        await discovery.http.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_crawl_is_polite_per_domain(self):
+        """Test crawling runs domains concurrently but spaces requests within one"""
+        started = {}
+        
+        async def discover(url):
+            started[url] = asyncio.get_running_loop().time()
+            await asyncio.sleep(0.01)
+            return [url + "feed.rss"] if "a.example" in url else []
+        
+        crawler = FeedCrawler(discover, max_concurrency=10, per_domain_delay=0.1)
+        found = await crawler.crawl([
+            "https://a.example/1/", "https://a.example/2/", "https://b.example/", "https://c.example/"
+        ])
+        
+        assert sorted(found) == ["https://a.example/1/", "https://a.example/2/"]
+        assert started["https://a.example/2/"] - started["https://a.example/1/"] >= 0.09
+        assert abs(started["https://b.example/"] - started["https://a.example/1/"]) < 0.05
+        assert crawler.get_stats()['politeness_waits'] == 1
+        assert crawler.get_stats()['domains'] == 3
 
 
 class TestAPIIntegrations:
@@ -97,6 +162,562 @@ class TestSourceManager:
         stats = manager.get_source_stats()
         assert 'tenant_id' in stats
         assert stats['tenant_id'] == "test"
+    
+    @pytest.mark.asyncio
+    async def test_stream_yields_as_sources_finish(self):
+        """Test streaming yields fast-source grants before slow sources finish"""
+        async def handler(request):
+            if request.url.path == "/slow.rss":
+                await asyncio.sleep(0.2)
+                return httpx.Response(200, content=DATED_RSS)
+            return httpx.Response(200, content=SAMPLE_RSS)
+        
+        pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+        manager = SourceManager(
+            rss_feeds=["https://example.com/slow.rss", "https://example.com/fast.rss"],
+            swarm_feed_url="https://example.com/fast.rss",
+            tenant_id="test",
+            http_client=pool
+        )
+        
+        titles = [grant['title'] async for grant in manager.stream_all_grants()]
+        
+        # Slow feed arrives last; SWARM repeats the fast feed's title and is deduplicated
+        assert 'Web3 Builder Grant' in titles[:-3]
+        assert titles[-3:] == ['Grant A', 'Grant B', 'Grant C']
+        assert titles.count('Web3 Builder Grant') == 1
+        assert len(manager.get_cached_grants()) == len(titles)
+        assert all(grant['tenant_id'] == "test" for grant in manager.get_cached_grants())
+        await manager.aclose()
+
+
+class TestHTTPClientPool:
+    """Tests for the shared HTTP client pool"""
+    
+    @pytest.mark.asyncio
+    async def test_sources_share_pool(self):
+        """Test source manager injects one pool into every source"""
+        manager = SourceManager(tenant_id="test")
+        assert manager.rss_discovery.http is manager.http
+        assert manager.api_integrations.http is manager.http
+        assert manager.swarm_feed.http is manager.http
+        await manager.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_parse_feed_reuses_client(self):
+        """Test feeds are fetched through one long-lived client"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=SAMPLE_RSS))
+        pool = HTTPClientPool(transport=transport)
+        discovery = RSSDiscovery(http_client=pool)
+        
+        first = await discovery.parse_feed("https://example.com/a.rss")
+        client = pool.client
+        second = await discovery.parse_feed("https://example.com/b.rss")
+        
+        assert first[0]['title'] == 'Web3 Builder Grant'
+        assert len(second) == 1
+        assert pool.client is client
+        assert pool.get_stats()['requests'] == 2
+        await pool.aclose()
+
+
+class TestFeedScheduler:
+    """Tests for adaptive feed polling"""
+    
+    @pytest.mark.asyncio
+    async def test_conditional_get_and_backoff(self):
+        """Test ETag revalidation returns cached grants and backs off"""
+        seen_etags = []
+        
+        def handler(request):
+            seen_etags.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=SAMPLE_RSS, headers={'ETag': '"v1"'})
+        
+        pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+        discovery = RSSDiscovery(feeds=["https://example.com/a.rss"], http_client=pool)
+        scheduler = FeedScheduler(discovery, jitter=0.0)
+        
+        grants = await scheduler.get_grants()
+        interval = scheduler.feed_state["https://example.com/a.rss"]['interval']
+        await scheduler.poll_feed("https://example.com/a.rss")
+        state = scheduler.feed_state["https://example.com/a.rss"]
+        
+        assert seen_etags == [None, '"v1"']
+        assert state['not_modified'] == 1
+        assert state['interval'] > interval
+        assert await scheduler.get_grants() == grants
+        assert pool.get_stats()['requests'] == 2
+        await pool.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_discovery_does_not_modify_scheduler_state(self):
+        """Test discovery normalizes copies, leaving the scheduler's stored grants as parsed"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=SAMPLE_RSS))
+        manager = SourceManager(
+            rss_feeds=["https://example.com/a.rss"],
+            swarm_feed_url="https://example.com/a.rss",
+            http_client=HTTPClientPool(transport=transport),
+            feed_scheduler=True
+        )
+        
+        await manager.discover_all_grants()
+        second = await manager.discover_all_grants()
+        stored = manager.feed_scheduler.feed_state["https://example.com/a.rss"]['grants']
+        
+        assert 'sources' not in stored[0] and 'grant_id' not in stored[0]
+        rss_grant = next(g for g in second if g['title'] == 'Web3 Builder Grant')
+        assert [ref['source'] for ref in rss_grant['sources']] == ['rss', 'swarm_rss']
+        await manager.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_interval_learned_from_timestamps(self):
+        """Test polling interval follows the feed's publishing cadence"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=DATED_RSS))
+        pool = HTTPClientPool(transport=transport)
+        discovery = RSSDiscovery(feeds=["https://example.com/a.rss"], http_client=pool)
+        clock = lambda: 1000.0
+        scheduler = FeedScheduler(discovery, jitter=0.0, clock=clock)
+        
+        assert await scheduler.poll_due() == 1
+        state = scheduler.feed_state["https://example.com/a.rss"]
+        
+        # Items every 4 hours -> poll every 2 hours
+        assert state['interval'] == 2 * 3600
+        assert state['next_poll'] == 1000.0 + 2 * 3600
+        assert await scheduler.poll_due() == 0
+        await pool.aclose()
+
+
+class TestFeedParsePool:
+    """Tests for off-loop feed parsing"""
+    
+    @pytest.mark.asyncio
+    async def test_parse_in_worker_process(self):
+        """Test RSS and SWARM feeds parse in a process pool"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=SAMPLE_RSS))
+        pool = HTTPClientPool(transport=transport)
+        parser = FeedParsePool(max_workers=1, use_processes=True)
+        discovery = RSSDiscovery(http_client=pool, parse_pool=parser)
+        swarm = SwarmFeed(http_client=pool, parse_pool=parser)
+        
+        grants = await discovery.parse_feed("https://example.com/a.rss")
+        swarm_grants = await swarm.fetch_swarm_grants()
+        
+        assert grants[0]['title'] == 'Web3 Builder Grant'
+        assert swarm_grants[0]['source'] == 'swarm_rss'
+        assert 'ethereum' in swarm_grants[0]['web3_metadata']['blockchain_networks']
+        assert parser.get_stats()['completed'] == 2
+        parser.shutdown()
+        await pool.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_parse_concurrency_bounded(self):
+        """Test parse jobs never exceed the worker limit and keep the loop free"""
+        parser = FeedParsePool(max_workers=2, max_queued=1)
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def slow_parse(_):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            threading.Event().wait(0.02)
+            with lock:
+                active.pop()
+        
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.005)
+                ticks += 1
+        
+        await asyncio.gather(ticker(), *(parser.run(slow_parse, i) for i in range(6)))
+        
+        assert max(peak) <= 2
+        assert ticks == 5
+        assert parser.get_stats()['peak_pending'] <= 3
+        parser.shutdown()
+
+
+class TestDuplicateIndex:
+    """Tests for near-duplicate grant detection"""
+    
+    DESCRIPTION = (
+        "The Ethereum Foundation is funding open-source builders working on "
+        "developer tooling and public goods. Applications close in December."
+    )
+    
+    @pytest.mark.asyncio
+    async def test_merges_near_and_exact_duplicates(self):
+        """Test reworded titles and normalized links merge into one grant"""
+        index = DuplicateIndex()
+        canonical = {
+            'source': 'grants_gov', 'title': 'Ethereum Foundation Developer Tooling Grant',
+            'description': self.DESCRIPTION, 'link': 'https://esp.ethereum.foundation/tooling',
+        }
+        reworded = {
+            'source': 'rss', 'title': 'Ethereum Foundation: Developer Tooling Grants 2024',
+            'description': self.DESCRIPTION + ' Apply now!', 'link': 'https://agg.example.com/x?id=5',
+        }
+        relinked = {
+            'source': 'swarm_rss', 'title': 'EF tooling round', 'description': '',
+            'link': 'http://www.esp.ethereum.foundation/tooling/?utm_source=x',
+        }
+        unrelated = {
+            'source': 'rss', 'title': 'Women in Tech Founders Fund',
+            'description': 'Funding for women-led startups building AI products.',
+            'link': 'https://example.org/wit',
+        }
+        
+        assert index.add(canonical) is canonical
+        assert index.add(reworded) is canonical
+        assert index.add(relinked) is canonical
+        assert index.add(unrelated) is unrelated
+        
+        assert [ref['source'] for ref in canonical['sources']] == ['grants_gov', 'rss', 'swarm_rss']
+        stats = index.get_stats()
+        assert stats['canonical'] == 2
+        assert stats['exact_merges'] == 1
+        assert stats['near_merges'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_manager_merges_sources(self):
+        """Test discovery returns one grant with every source reference"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=SAMPLE_RSS))
+        pool = HTTPClientPool(transport=transport)
+        manager = SourceManager(
+            rss_feeds=["https://example.com/a.rss"],
+            swarm_feed_url="https://example.com/a.rss",
+            tenant_id="test",
+            http_client=pool
+        )
+        
+        grants = await manager.discover_all_grants()
+        builder = [g for g in grants if g['title'] == 'Web3 Builder Grant']
+        
+        assert len(builder) == 1
+        assert {ref['source'] for ref in builder[0]['sources']} == {'rss', 'swarm_rss'}
+        assert manager.get_source_stats()['dedup']['exact_merges'] >= 1
+        await manager.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_merged_deadline_is_normalized(self):
+        """Test a deadline filled in by a later duplicate updates deadline_ordinal"""
+        manager = SourceManager(tenant_id="test", http_client=HTTPClientPool(transport=httpx.MockTransport(
+            lambda request: httpx.Response(404)
+        )))
+        index = DuplicateIndex()
+        first = {'source': 'rss', 'title': 'Ethereum Tooling Grant', 'link': 'https://example.com/g'}
+        duplicate = {'source': 'grants_gov', 'title': 'Ethereum Tooling Grant', 'deadline': '12/31/2026'}
+        
+        assert manager._accept_grant(first, index)
+        assert first['deadline_ordinal'] is None
+        assert not manager._accept_grant(duplicate, index)
+        
+        assert first['deadline'] == '12/31/2026'
+        assert first['deadline_ordinal'] == date(2026, 12, 31).toordinal()
+        await manager.aclose()
+
+
+class TestGrantStore:
+    """Tests for the persistent grant store"""
+    
+    @pytest.mark.asyncio
+    async def test_cache_survives_restart(self, tmp_path):
+        """Test a new manager restores grants from the store and looks them up by id"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=SAMPLE_RSS))
+        db_path = str(tmp_path / "grants.db")
+        
+        manager = SourceManager(
+            rss_feeds=["https://example.com/a.rss"],
+            tenant_id="test",
+            http_client=HTTPClientPool(transport=transport),
+            grant_store=SQLiteGrantStore(db_path)
+        )
+        grants = await manager.discover_all_grants()
+        rss_grant = next(g for g in grants if g['source'] == 'rss')
+        await manager.aclose()
+        
+        restarted = SourceManager(
+            tenant_id="test",
+            http_client=HTTPClientPool(transport=transport),
+            grant_store=SQLiteGrantStore(db_path)
+        )
+        cached = await restarted.discover_all_grants(use_cache=True)
+        found = await restarted.get_grant(rss_grant['grant_id'])
+        by_source = await restarted.query_grants(source='rss')
+        
+        # Grants past their deadline (the stub API grants) are pruned from the store
+        current = [g for g in grants if not g['deadline_ordinal'] or g['deadline_ordinal'] >= date.today().toordinal()]
+        assert len(cached) == len(current) < len(grants)
+        assert found['title'] == 'Web3 Builder Grant'
+        assert [g['grant_id'] for g in by_source] == [rss_grant['grant_id']]
+        assert await restarted.get_grant('missing') is None
+        
+        # Restored grants are served immediately and revalidated in the background
+        assert restarted.get_source_stats()['cache']['stale_hits'] == 1
+        await restarted._refresh_task
+        assert restarted.http.get_stats()['requests'] == 1
+        await restarted.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_deadlines_compared_as_dates(self, tmp_path):
+        """Test deadlines in different formats are queried by date and expired ones pruned"""
+        store = SQLiteGrantStore(str(tmp_path / "grants.db"))
+        await store.save_grants("test", [
+            {'grant_id': 'us', 'deadline': '12/31/2098'},
+            {'grant_id': 'iso', 'deadline': '2099-02-01'},
+            {'grant_id': 'stamp', 'deadline': '2098-06-01T17:00:00Z'},
+            {'grant_id': 'past', 'deadline': '01/15/2020'},
+            {'grant_id': 'open', 'deadline': ''},
+        ])
+        
+        before = await store.query("test", deadline_before='01/01/2099')
+        assert [g['grant_id'] for g in before] == ['past', 'stamp', 'us']
+        assert (await store.get_grant("test", 'us'))['deadline'] == '12/31/2098'
+        
+        assert await store.delete_expired("test") == 1
+        remaining = {g['grant_id'] for g in await store.load_grants("test")}
+        assert remaining == {'us', 'iso', 'stamp', 'open'}
+        await store.close()
+
+
+class FakeGrantsGov:
+    """Stand-in Grants.gov search endpoint sorted by last modification"""
+    
+    def __init__(self, count):
+        self.opportunities = [
+            {'opportunityID': str(i), 'opportunityTitle': f'Opportunity {i}',
+             'lastUpdatedDate': f'2024-01-01T00:{i // 60:02d}:{i % 60:02d}'}
+            for i in range(count)
+        ]
+        self.requests = []
+        self.statuses = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def handler(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        
+        start = int(request.url.params['startRecordNum'])
+        rows = int(request.url.params['rows'])
+        statuses = request.url.params['oppStatuses'].split('|')
+        self.requests.append(start)
+        self.statuses.append(statuses)
+        ordered = sorted(
+            (o for o in self.opportunities if o.get('oppStatus', 'posted') in statuses),
+            key=lambda o: o['lastUpdatedDate'],
+            reverse=True
+        )
+        return httpx.Response(200, json={
+            'hitCount': len(ordered),
+            'opportunities': ordered[start:start + rows],
+        })
+
+
+class TestGrantsGovSync:
+    """Tests for the paginated, incremental Grants.gov sync"""
+    
+    @pytest.mark.asyncio
+    async def test_full_sync_pages_concurrently(self):
+        """Test every page is fetched with bounded concurrency"""
+        server = FakeGrantsGov(250)
+        pool = HTTPClientPool(transport=httpx.MockTransport(server.handler))
+        sync = GrantsGovSync(pool, page_size=20, max_concurrency=3)
+        
+        grants = await sync.sync("key")
+        
+        assert len(grants) == 250
+        assert sorted(server.requests) == list(range(0, 260, 20))
+        assert server.max_in_flight == 3
+        assert sync.get_stats()['cursor'] == '2024-01-01T00:04:09'
+        await pool.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_incremental_sync_resumes_from_checkpoint(self, tmp_path):
+        """Test later syncs only fetch pages modified since the persisted cursor"""
+        server = FakeGrantsGov(250)
+        pool = HTTPClientPool(transport=httpx.MockTransport(server.handler))
+        db_path = str(tmp_path / "grants.db")
+        store = SQLiteGrantStore(db_path)
+        await GrantsGovSync(pool, page_size=20, grant_store=store).sync("key")
+        await store.close()
+        
+        server.opportunities[3].update(opportunityTitle='Revised', lastUpdatedDate='2024-02-01T00:00:00')
+        server.opportunities[7].update(oppStatus='closed', lastUpdatedDate='2024-02-01T00:00:00')
+        server.opportunities[9].update(closeDate='01/15/2024', lastUpdatedDate='2024-02-01T00:00:00')
+        server.requests.clear()
+        
+        restarted = GrantsGovSync(pool, page_size=20, grant_store=SQLiteGrantStore(db_path))
+        grants = await restarted.sync("key")
+        titles = {g['grant_id']: g['title'] for g in grants}
+        
+        assert server.requests == [0]
+        assert server.statuses[0] == ['forecasted', 'posted']
+        assert server.statuses[-1] == ['forecasted', 'posted', 'archived', 'closed']
+        # The revised opportunity plus the one re-read at the cursor itself
+        assert restarted.get_stats()['last_changed'] == 2
+        assert restarted.get_stats()['last_removed'] == 2
+        assert len(grants) == 248
+        assert titles['3'] == 'Revised'
+        assert '7' not in titles and '9' not in titles
+        assert await restarted.store.get_grant('default', '7') is None
+        assert await restarted.store.get_grant('default', '9') is None
+        await restarted.store.close()
+        await pool.aclose()
+
+
+class TestDiscoveryCache:
+    """Tests for TTL, stale-while-revalidate and single-flight discovery"""
+    
+    def _manager(self, **kwargs):
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, content=SAMPLE_RSS)
+        
+        return SourceManager(
+            rss_feeds=["https://example.com/a.rss"],
+            swarm_feed_url="https://example.com/swarm.rss",
+            tenant_id="test",
+            http_client=HTTPClientPool(transport=httpx.MockTransport(handler)),
+            **kwargs
+        )
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_run(self):
+        """Test N concurrent discoveries fan out to the sources once"""
+        manager = self._manager()
+        
+        results = await asyncio.gather(*(manager.discover_all_grants() for _ in range(5)))
+        
+        assert all(result is results[0] for result in results)
+        assert manager.http.get_stats()['requests'] == 2
+        assert manager.cache_stats['refreshes'] == 1
+        assert manager.cache_stats['coalesced'] == 4
+        await manager.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_fresh_then_stale_while_revalidate(self):
+        """Test fresh hits skip the network and stale hits refresh in the background"""
+        manager = self._manager(cache_ttl=60)
+        first = await manager.discover_all_grants()
+        
+        assert await manager.discover_all_grants(use_cache=True) is first
+        assert manager.http.get_stats()['requests'] == 2
+        
+        manager.cache_ttl = 0
+        stale = await manager.discover_all_grants(use_cache=True)
+        assert stale is first
+        assert manager.cache_stats['stale_hits'] == 1
+        
+        await manager._refresh_task
+        assert manager.http.get_stats()['requests'] == 4
+        assert manager.cached_grants is not first
+        await manager.aclose()
+
+
+class TestSourceResilience:
+    """Tests for discovery deadlines, circuit breakers and hedging"""
+    
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_results(self):
+        """Test a hung feed is cut off at the deadline without losing the others"""
+        async def handler(request):
+            if request.url.path == "/hung.rss":
+                await asyncio.sleep(5)
+            return httpx.Response(200, content=SAMPLE_RSS)
+        
+        manager = SourceManager(
+            rss_feeds=["https://example.com/hung.rss", "https://example.com/ok.rss"],
+            swarm_feed_url="https://example.com/ok.rss",
+            http_client=HTTPClientPool(transport=httpx.MockTransport(handler)),
+            discovery_deadline=0.2
+        )
+        
+        grants = await manager.discover_all_grants()
+        sources = manager.get_source_stats()['sources']
+        
+        assert 'Web3 Builder Grant' in [g['title'] for g in grants]
+        assert sources['rss:https://example.com/hung.rss']['failures'] == 1
+        assert sources['rss:https://example.com/ok.rss']['avg_latency_ms'] is not None
+        await manager.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_failed_api_source_keeps_previous_grants(self):
+        """Test each API source has its own breaker and a failure reuses its last result"""
+        manager = SourceManager(breaker_failure_threshold=1)
+        first = await manager.discover_all_grants()
+        
+        async def fail():
+            raise RuntimeError("down")
+        manager.api_integrations.fetch_web3_grants = fail
+        manager.api_integrations.fetch_nonprofit_grants = fail
+        
+        second = await manager.discover_all_grants()
+        third = await manager.discover_all_grants()
+        sources = manager.get_source_stats()['sources']
+        
+        assert sorted(g['title'] for g in second) == sorted(g['title'] for g in first)
+        assert sorted(g['title'] for g in third) == sorted(g['title'] for g in first)
+        assert sources['api:web3']['failures'] == 1
+        assert sources['api:web3']['state'] == CircuitBreaker.OPEN
+        assert sources['api:women_tech']['failures'] == 0
+        assert all(len(g['sources']) == 1 for g in third)
+        await manager.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_probes(self):
+        """Test failing sources are skipped until a half-open probe succeeds"""
+        now = [0.0]
+        breaker = CircuitBreaker("feed", failure_threshold=2, reset_timeout=30, clock=lambda: now[0])
+        
+        async def fail():
+            raise RuntimeError("down")
+        
+        async def succeed():
+            return "ok"
+        
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await breaker.call(fail)
+        
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        
+        now[0] = 31
+        assert breaker.allow()
+        assert not breaker.allow()
+        assert await breaker.run(succeed) == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.get_stats()['rejected'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_hedged_request_uses_fast_mirror(self):
+        """Test a slow primary feed is hedged to its mirror"""
+        async def handler(request):
+            if request.url.host == "slow.example.com":
+                await asyncio.sleep(5)
+            return httpx.Response(200, content=SAMPLE_RSS)
+        
+        discovery = RSSDiscovery(
+            http_client=HTTPClientPool(transport=httpx.MockTransport(handler)),
+            mirrors={"https://slow.example.com/a.rss": ["https://mirror.example.com/a.rss"]},
+            hedge_delay=0.05
+        )
+        
+        result = await asyncio.wait_for(discovery.fetch_feed("https://slow.example.com/a.rss"), 1)
+        
+        assert result['grants'][0]['title'] == 'Web3 Builder Grant'
+        assert discovery.http.get_stats()['hedged_requests'] == 1
+        await discovery.http.aclose()
 
 
 if __name__ == "__main__":
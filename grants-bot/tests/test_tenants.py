@@ -0,0 +1,109 @@
+"""
+Test Suite for Grant Bot - Multi-Tenant Registry
+
+Tests for per-tenant views over the shared source layer.
+"""
+
+import httpx
+import pytest
+from grants_bot.sources import SourceManager, HTTPClientPool
+from grants_bot.tenants import TenantRegistry
+
+from .test_sources import SAMPLE_RSS, DATED_RSS
+
+
+ORG_PROFILE = {'name': 'test', 'tags': ['web3', 'ethereum']}
+
+
+class TestTenantRegistry:
+    """Tests for the tenant registry"""
+    
+    @pytest.mark.asyncio
+    async def test_shared_feed_fetched_once(self):
+        """Test tenants sharing a feed trigger one fetch and get separate views"""
+        fetched = []
+        
+        async def handler(request):
+            fetched.append(request.url.path)
+            if request.url.path == "/dated.rss":
+                return httpx.Response(200, content=DATED_RSS)
+            return httpx.Response(200, content=SAMPLE_RSS)
+        
+        manager = SourceManager(http_client=HTTPClientPool(transport=httpx.MockTransport(handler)))
+        registry = TenantRegistry(manager)
+        registry.register("a", ORG_PROFILE, rss_feeds=["https://example.com/shared.rss"], sources=[])
+        registry.register("b", ORG_PROFILE, rss_feeds=[
+            "https://example.com/shared.rss",
+            "https://example.com/dated.rss",
+        ], sources=[])
+        
+        grants_a = await registry.discover("a")
+        grants_b = await registry.discover("b")
+        
+        assert fetched.count("/shared.rss") == 1
+        assert fetched.count("/dated.rss") == 1
+        assert [g['title'] for g in grants_a] == ['Web3 Builder Grant']
+        assert sorted(g['title'] for g in grants_b) == ['Grant A', 'Grant B', 'Grant C', 'Web3 Builder Grant']
+        assert all(g['tenant_id'] == "a" for g in grants_a)
+        
+        # Per-tenant fields never leak into the shared cache or other tenants
+        grants_a[0]['match_score'] = 0.9
+        assert 'match_score' not in manager.cached_grants[0]
+        assert registry.get_stats()['shared_feeds'] == 2
+        await manager.aclose()
+    
+    def test_unregister_drops_unused_feeds(self):
+        """Test feeds only one tenant used stop being fetched"""
+        manager = SourceManager()
+        registry = TenantRegistry(manager)
+        registry.register("a", ORG_PROFILE, rss_feeds=["https://example.com/a.rss", "https://example.com/shared.rss"])
+        registry.register("b", ORG_PROFILE, rss_feeds=["https://example.com/shared.rss"])
+        
+        registry.unregister("a")
+        
+        assert manager.rss_discovery.get_feeds() == ["https://example.com/shared.rss"]
+        with pytest.raises(KeyError):
+            registry.get("a")
+    
+    def test_unregister_keeps_configured_feeds(self):
+        """Test feeds configured outside the registry are kept when tenants leave"""
+        manager = SourceManager(rss_feeds=["https://example.com/global.rss"])
+        registry = TenantRegistry(manager)
+        registry.register("a", ORG_PROFILE, rss_feeds=["https://example.com/global.rss", "https://example.com/a.rss"])
+        
+        registry.unregister("a")
+        
+        assert manager.rss_discovery.get_feeds() == ["https://example.com/global.rss"]
+    
+    @pytest.mark.asyncio
+    async def test_default_tenant_sees_only_global_feeds(self):
+        """Test a tenant without a feed list neither keeps nor sees other tenants' feeds"""
+        async def handler(request):
+            if request.url.path == "/private.rss":
+                return httpx.Response(200, content=DATED_RSS)
+            return httpx.Response(200, content=SAMPLE_RSS)
+        
+        manager = SourceManager(
+            rss_feeds=["https://example.com/global.rss"],
+            http_client=HTTPClientPool(transport=httpx.MockTransport(handler))
+        )
+        registry = TenantRegistry(manager)
+        registry.register("default", ORG_PROFILE, sources=[])
+        registry.register("t1", ORG_PROFILE, rss_feeds=["https://example.com/private.rss"], sources=[])
+        
+        assert [g['title'] for g in await registry.discover("default")] == ['Web3 Builder Grant']
+        assert sorted(g['title'] for g in await registry.discover("t1")) == ['Grant A', 'Grant B', 'Grant C']
+        
+        registry.unregister("t1")
+        
+        assert manager.rss_discovery.get_feeds() == ["https://example.com/global.rss"]
+        await manager.aclose()
+    
+    def test_reregister_releases_old_feeds(self):
+        """Test replacing a tenant stops fetching feeds only its old settings used"""
+        manager = SourceManager()
+        registry = TenantRegistry(manager)
+        registry.register("a", ORG_PROFILE, rss_feeds=["https://example.com/old.rss", "https://example.com/kept.rss"])
+        registry.register("a", ORG_PROFILE, rss_feeds=["https://example.com/kept.rss", "https://example.com/new.rss"])
+        
+        assert manager.rss_discovery.get_feeds() == ["https://example.com/kept.rss", "https://example.com/new.rss"]
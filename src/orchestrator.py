@@ -5,7 +5,6 @@ Main pipeline script for transforming raw inputs into structured outputs
 """
 
 import os
-import json
 import argparse
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,8 +14,24 @@ from swarm_orchestrator.project_scanner import scan_project_files, extract_text_
 from swarm_orchestrator.rss_fetcher import fetch_rss_feeds, summarize_rss_digest
 from swarm_orchestrator.x_scraper import scrape_x_mentions, extract_top_posts, extract_themes
 from swarm_orchestrator.keyword_extractor import KeywordExtractor, generate_keyword_clusters
-from swarm_orchestrator.seo_generator import generate_multiple_briefs
+from swarm_orchestrator.seo_generator import render_briefs_batch
+from swarm_orchestrator.coverage_index import CoverageIndex, compute_coverage
 from swarm_orchestrator.riddle_generator import generate_riddle_collection, format_riddles_markdown
+from swarm_orchestrator.artifact_writer import (
+    content_hash,
+    preserve_fields,
+    serialize_json,
+    write_json_artifact,
+    write_text_artifact,
+    write_artifact_stream,
+)
+from swarm_orchestrator.sharding import (
+    parse_shard_spec,
+    build_partial_stats,
+    merge_partial_stats,
+    load_partials,
+    partial_filename,
+)
 
 
 def ensure_build_dir(build_dir: str = "build"):
@@ -24,18 +39,83 @@ def ensure_build_dir(build_dir: str = "build"):
     Path(build_dir).mkdir(parents=True, exist_ok=True)
 
 
-def save_json(data: dict, filepath: str):
-    """Save data as JSON"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, indent=2, fp=f)
-    print(f"✓ Saved: {filepath}")
+def save_json(data: dict, filepath: str, compress: tuple = ()):
+    """Save data as JSON (atomic, skipped when unchanged)"""
+    if write_json_artifact(filepath, data, compress):
+        print(f"✓ Saved: {filepath}")
+    else:
+        print(f"✓ Unchanged: {filepath}")
 
 
-def save_markdown(content: str, filepath: str):
-    """Save content as Markdown"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"✓ Saved: {filepath}")
+def save_markdown(content: str, filepath: str, compress: tuple = ()):
+    """Save content as Markdown (atomic, skipped when unchanged)"""
+    if write_text_artifact(filepath, content, compress):
+        print(f"✓ Saved: {filepath}")
+    else:
+        print(f"✓ Unchanged: {filepath}")
+
+
+def compress_arg(value: str) -> tuple:
+    """argparse type for --compress gz,zst"""
+    methods = tuple(m.strip() for m in value.split(',') if m.strip())
+    for method in methods:
+        if method not in ('gz', 'zst'):
+            raise argparse.ArgumentTypeError(f"Unknown compression '{method}', expected gz or zst")
+    return methods
+
+
+def shard_arg(value: str):
+    """argparse type for --shard i/N"""
+    try:
+        return parse_shard_spec(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_keyword_clusters(tfidf_keywords: list, rake_keywords: list, previous_path: str = None) -> dict:
+    """
+    Combine TF-IDF and RAKE keywords into timestamped clusters
+
+    If the clusters at previous_path are the same, their generated_at is
+    kept, so keywords.json and the briefs built from it are byte-identical
+    and skipped on rebuild.
+    """
+    # Sort the union so cluster order does not depend on set iteration order
+    all_keywords = sorted(set(tfidf_keywords + rake_keywords))
+    clusters = generate_keyword_clusters(all_keywords)
+    clusters['generated_at'] = datetime.now(timezone.utc).isoformat()
+    if previous_path:
+        clusters = preserve_fields(previous_path, clusters)
+    return clusters
+
+
+def content_seed(clusters: dict) -> int:
+    """Riddle seed derived from the keyword clusters, so unchanged input gives unchanged riddles"""
+    return int(content_hash(serialize_json(clusters.get('clusters', [])))[:8], 16)
+
+
+def merge_shards(args):
+    """Merge shard partials into the final keywords.json"""
+    print("=" * 70)
+    print("🧮 WIRED CHAOS SWARM Orchestrator - Shard Merge")
+    print("=" * 70)
+    print()
+
+    ensure_build_dir(args.build_dir)
+
+    partials = load_partials(args.partials)
+    merged = merge_partial_stats(partials)
+    print(f"  - Merged {len(partials)} shard partials")
+
+    extractor = KeywordExtractor()
+    tfidf_keywords = extractor.score_tfidf(merged['doc_term_counts']) if merged['doc_term_counts'] else []
+    rake_keywords = extractor.score_rake(merged['rake'])
+
+    keywords_path = os.path.join(args.build_dir, 'keywords.json')
+    clusters = build_keyword_clusters(tfidf_keywords, rake_keywords, previous_path=keywords_path)
+    print(f"  - Generated {len(clusters.get('clusters', []))} clusters")
+
+    save_json(clusters, keywords_path, compress=args.compress)
 
 
 def main():
@@ -83,9 +163,66 @@ def main():
         action='store_true',
         help='Skip X/Twitter scraping'
     )
+    parser.add_argument(
+        '--shard',
+        type=shard_arg,
+        default=None,
+        metavar='i/N',
+        help='Process shard i of N and write partial keyword stats (merge with the merge command)'
+    )
+
+    parser.add_argument(
+        '--compress',
+        type=compress_arg,
+        default=(),
+        help='Also write compressed artifact variants, comma-separated: gz,zst'
+    )
+    parser.add_argument(
+        '--riddles',
+        type=int,
+        default=5,
+        help='Number of 589-coded riddles to generate (default: 5)'
+    )
+    parser.add_argument(
+        '--riddle-seed',
+        type=int,
+        default=None,
+        help='Seed for the riddle collection (default: derived from the keywords, '
+             'so unchanged input gives unchanged riddles)'
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+    merge_parser = subparsers.add_parser(
+        'merge',
+        help='Merge shard partials into keywords.json'
+    )
+    merge_parser.add_argument(
+        'partials',
+        nargs='+',
+        help='Partial stats files written by --shard runs'
+    )
+    merge_parser.add_argument(
+        '--build-dir',
+        default='build',
+        help='Output directory for keywords.json (default: build)'
+    )
+    merge_parser.add_argument(
+        '--compress',
+        type=compress_arg,
+        default=(),
+        help='Also write compressed variants, comma-separated: gz,zst'
+    )
 
     args = parser.parse_args()
 
+    if args.command == 'merge':
+        merge_shards(args)
+        return
+
+    shard = args.shard
+    # Feeds are not partitionable, so only the first shard fetches them
+    fetch_feeds = shard is None or shard[0] == 1
+
     print("=" * 70)
     print("🚀 WIRED CHAOS SWARM Orchestrator Pipeline")
     print("=" * 70)
@@ -105,23 +242,24 @@ def main():
 
     extractor = KeywordExtractor(stopwords=stopwords if stopwords else None)
     
-    all_text_content = []
+    all_text_content = {}
+    project_data = None
     
     # Step 1: Scan project files
     if not args.skip_project:
         print("📁 Step 1: Scanning project files...")
         project_step = monitor.start_step(
             "project_scan",
-            metadata={'project_dir': args.project_dir}
+            metadata={'project_dir': args.project_dir, 'shard': list(shard) if shard else None}
         )
         try:
-            project_data = scan_project_files(args.project_dir)
+            project_data = scan_project_files(args.project_dir, shard=shard)
             print(f"  - Scanned {project_data['stats']['total_files']} files")
             print(f"  - Total size: {project_data['stats']['total_size'] / 1024:.2f} KB")
 
             # Extract text content for keyword extraction
             text_content = extract_text_content(project_data)
-            all_text_content.append(text_content)
+            all_text_content['project'] = text_content
 
             monitor.end_step(
                 project_step,
@@ -135,7 +273,9 @@ def main():
 
     # Step 2: Fetch RSS feeds
     rss_data = None
-    if not args.skip_rss and os.path.exists(args.opml_file):
+    if not args.skip_rss and not fetch_feeds:
+        monitor.skip_step("rss_fetch", reason="handled_by_shard_1")
+    elif not args.skip_rss and os.path.exists(args.opml_file):
         print("\n📰 Step 2: Fetching RSS feeds...")
         rss_step = monitor.start_step(
             "rss_fetch",
@@ -148,14 +288,14 @@ def main():
 
             # Save RSS digest
             digest = summarize_rss_digest(rss_data)
-            save_json(digest, os.path.join(args.build_dir, 'rss_digest.json'))
+            save_json(digest, os.path.join(args.build_dir, 'rss_digest.json'), compress=args.compress)
             
             # Extract text for keywords
             rss_text = " ".join([
                 f"{item['title']} {item['summary']}"
                 for item in digest
             ])
-            all_text_content.append(rss_text)
+            all_text_content['rss'] = rss_text
 
             monitor.end_step(
                 rss_step,
@@ -179,7 +319,9 @@ def main():
 
     # Step 3: Scrape X/Twitter mentions
     tweets_data = None
-    if not args.skip_twitter:
+    if not args.skip_twitter and not fetch_feeds:
+        monitor.skip_step("twitter_scrape", reason="handled_by_shard_1")
+    elif not args.skip_twitter:
         print("\n🐦 Step 3: Scraping X/Twitter mentions...")
         twitter_step = monitor.start_step(
             "twitter_scrape",
@@ -200,11 +342,11 @@ def main():
                 'themes': themes,
                 'scraped_at': tweets_data['scraped_at']
             }
-            save_json(x_output, os.path.join(args.build_dir, 'x_mentions.json'))
+            save_json(x_output, os.path.join(args.build_dir, 'x_mentions.json'), compress=args.compress)
 
             # Extract text for keywords
             tweets_text = " ".join([t['content'] for t in tweets_data['tweets']])
-            all_text_content.append(tweets_text)
+            all_text_content['twitter'] = tweets_text
 
             monitor.end_step(
                 twitter_step,
@@ -220,28 +362,55 @@ def main():
             monitor.end_step(twitter_step, status='error', error=e)
 
     # Step 4: Extract keywords
+    if shard is not None:
+        print(f"\n🔑 Step 4: Collecting keyword stats for shard {shard[0]}/{shard[1]}...")
+        keyword_step = monitor.start_step("keyword_stats", metadata={'shard': list(shard)})
+        partial_path = os.path.join(args.build_dir, partial_filename(shard))
+        try:
+            partial = preserve_fields(partial_path, build_partial_stats(extractor, all_text_content, shard))
+            save_json(partial, partial_path, compress=args.compress)
+            monitor.end_step(keyword_step, outputs=[partial_path])
+        except Exception as e:
+            print(f"  ⚠️  Error collecting keyword stats: {e}")
+            monitor.end_step(keyword_step, status='error', error=e)
+
+        # Briefs and riddles depend on the merged keywords
+        monitor.skip_step("seo_briefs", reason="shard_mode")
+        monitor.skip_step("lore_riddles", reason="shard_mode")
+        monitor.finalize()
+        save_json(monitor.as_dict(), os.path.join(args.build_dir, 'pipeline_monitoring.json'), compress=args.compress)
+
+        print("\n" + "=" * 70)
+        print(f"✅ Shard {shard[0]}/{shard[1]} completed successfully!")
+        print(f"🧮 Merge with: orchestrator.py merge {args.build_dir}/keywords.shard-*-of-{shard[1]}.json")
+        print("=" * 70)
+        print()
+        return
+
     print("\n🔑 Step 4: Extracting keywords...")
     keyword_step = monitor.start_step("keyword_extraction")
     try:
+        texts = list(all_text_content.values())
+
         # Combine all text content
-        combined_text = " ".join(all_text_content)
+        combined_text = " ".join(texts)
 
         # Extract keywords using TF-IDF
-        documents = [content for content in all_text_content if content]
+        documents = [content for content in texts if content]
         tfidf_keywords = extractor.extract_tfidf(documents) if documents else []
         
         # Extract keywords using RAKE
         rake_keywords = extractor.extract_rake(combined_text) if combined_text else []
         
         # Generate keyword clusters
-        all_keywords = list(set(tfidf_keywords + rake_keywords))
-        clusters = generate_keyword_clusters(all_keywords)
-        clusters['generated_at'] = datetime.now(timezone.utc).isoformat()
+        all_keywords = set(tfidf_keywords + rake_keywords)
+        keywords_path = os.path.join(args.build_dir, 'keywords.json')
+        clusters = build_keyword_clusters(tfidf_keywords, rake_keywords, previous_path=keywords_path)
         
         print(f"  - Extracted {len(all_keywords)} unique keywords")
         print(f"  - Generated {len(clusters.get('clusters', []))} clusters")
 
-        save_json(clusters, os.path.join(args.build_dir, 'keywords.json'))
+        save_json(clusters, keywords_path, compress=args.compress)
 
         monitor.end_step(
             keyword_step,
@@ -257,27 +426,60 @@ def main():
         clusters = {'clusters': []}
         monitor.end_step(keyword_step, status='error', error=e)
 
-    # Step 5: Generate SEO briefs
-    print("\n📝 Step 5: Generating SEO briefs...")
+    # Step 5: Analyze SEO coverage of existing pages
+    coverage = None
+    if project_data is not None:
+        print("\n🗂️  Step 5: Analyzing SEO coverage...")
+        coverage_step = monitor.start_step("seo_coverage")
+        coverage_path = os.path.join(args.build_dir, 'seo_coverage.json')
+        try:
+            index = CoverageIndex.from_project_data(project_data, extractor.tokenize)
+            coverage = compute_coverage(index, clusters)
+            print(f"  - Indexed {coverage['index']['pages']} pages, {coverage['index']['terms']} terms")
+
+            save_json(coverage, coverage_path, compress=args.compress)
+            monitor.end_step(coverage_step, metadata=coverage['index'], outputs=[coverage_path])
+        except Exception as e:
+            print(f"  ⚠️  Error analyzing coverage: {e}")
+            monitor.end_step(coverage_step, status='error', error=e)
+    else:
+        monitor.skip_step("seo_coverage", reason="project_scan_unavailable")
+
+    # Step 6: Generate SEO briefs
+    print("\n📝 Step 6: Generating SEO briefs...")
     seo_step = monitor.start_step("seo_briefs")
     try:
-        seo_briefs = generate_multiple_briefs(clusters)
-        save_markdown(seo_briefs, os.path.join(args.build_dir, 'seo_briefs.md'))
+        # Every cluster x every content type, streamed to disk as chunks render
+        briefs_path = os.path.join(args.build_dir, 'seo_briefs.md')
+        chunks = (text.encode('utf-8') for text in render_briefs_batch(clusters, coverage=coverage))
+        if write_artifact_stream(briefs_path, chunks, compress=args.compress):
+            print(f"✓ Saved: {briefs_path}")
+        else:
+            print(f"✓ Unchanged: {briefs_path}")
         monitor.end_step(
             seo_step,
+            metadata={'clusters': len(clusters.get('clusters', []))},
             outputs=[os.path.join(args.build_dir, 'seo_briefs.md')]
         )
     except Exception as e:
         print(f"  ⚠️  Error generating SEO briefs: {e}")
         monitor.end_step(seo_step, status='error', error=e)
 
-    # Step 6: Generate 589-coded riddles
-    print("\n🧩 Step 6: Generating 589-coded riddles...")
-    riddles_step = monitor.start_step("lore_riddles")
+    # Step 7: Generate 589-coded riddles
+    print("\n🧩 Step 7: Generating 589-coded riddles...")
+    riddle_seed = args.riddle_seed if args.riddle_seed is not None else content_seed(clusters)
+    riddles_step = monitor.start_step(
+        "lore_riddles",
+        metadata={'riddles': args.riddles, 'seed': riddle_seed}
+    )
     try:
-        riddles = generate_riddle_collection(5)
+        riddles = generate_riddle_collection(
+            args.riddles,
+            seed=riddle_seed,
+            workers=os.cpu_count() or 1
+        )
         riddles_md = format_riddles_markdown(riddles)
-        save_markdown(riddles_md, os.path.join(args.build_dir, 'lore_riddles.md'))
+        save_markdown(riddles_md, os.path.join(args.build_dir, 'lore_riddles.md'), compress=args.compress)
         monitor.end_step(
             riddles_step,
             outputs=[os.path.join(args.build_dir, 'lore_riddles.md')]
@@ -286,8 +488,9 @@ def main():
         print(f"  ⚠️  Error generating riddles: {e}")
         monitor.end_step(riddles_step, status='error', error=e)
 
+    # Run timings live only here; this is the one artifact rewritten every run
     monitor.finalize()
-    save_json(monitor.as_dict(), os.path.join(args.build_dir, 'pipeline_monitoring.json'))
+    save_json(monitor.as_dict(), os.path.join(args.build_dir, 'pipeline_monitoring.json'), compress=args.compress)
 
     print("\n" + "=" * 70)
     print("✅ Pipeline completed successfully!")
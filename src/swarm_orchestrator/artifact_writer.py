@@ -0,0 +1,327 @@
+"""
+Artifact Writer
+Atomic, skip-if-unchanged writes for build artifacts with optional compressed variants
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSION_SUFFIXES = {'gz': '.gz', 'zst': '.zst'}
+
+
+def serialize_json(data: Any) -> bytes:
+    """
+    Serialize data as indented JSON, using orjson when available
+
+    Both paths emit raw UTF-8 (no \\u escapes), so the bytes and content hash
+    do not depend on whether orjson is installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # Types orjson refuses (e.g. non-str keys) fall back to stdlib
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def content_hash(content: bytes) -> str:
+    """SHA-256 hex digest of artifact content"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_hash(filepath: str) -> Optional[str]:
+    """SHA-256 hex digest of an existing file, or None if it does not exist"""
+    digest = hashlib.sha256()
+    try:
+        with open(filepath, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _default_mode() -> int:
+    """Mode a plain open() would give a new file under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _replace(tmp_path: str, filepath: str) -> None:
+    """
+    Move a finished temp file into place
+
+    mkstemp creates files as 0600; the temp file takes the mode of the file
+    it replaces (or the umask default) first so artifacts stay readable.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        mode = _default_mode()
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, filepath)
+
+
+def variant_hash(variant_path: str, method: str) -> Optional[str]:
+    """
+    SHA-256 hex digest of a compressed variant's decompressed content
+
+    Args:
+        variant_path: Compressed file
+        method: 'gz' or 'zst'
+
+    Returns:
+        Digest, or None if the variant is missing or unreadable
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(variant_path, 'rb') as raw:
+            if method == 'gz':
+                stream = gzip.GzipFile(fileobj=raw, mode='rb')
+            elif method == 'zst' and zstandard is not None:
+                stream = zstandard.ZstdDecompressor().stream_reader(raw)
+            else:
+                return None
+            with stream:
+                for block in iter(lambda: stream.read(1024 * 1024), b''):
+                    digest.update(block)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Corrupt data (gzip raises OSError/EOFError, zstandard its own ZstdError)
+        print(f"  ⚠️  Rewriting unreadable {variant_path}: {e}")
+        return None
+    return digest.hexdigest()
+
+
+def atomic_write(filepath: str, content: bytes) -> None:
+    """
+    Write bytes via a temp file in the same directory and rename into place
+
+    Readers never observe a partially written artifact.
+
+    Args:
+        filepath: Destination path
+        content: Bytes to write
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(filepath))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def compress_content(content: bytes, method: str) -> bytes:
+    """
+    Compress artifact content
+
+    Gzip output uses a fixed mtime so identical content yields identical bytes.
+
+    Args:
+        content: Bytes to compress
+        method: 'gz' or 'zst'
+
+    Returns:
+        Compressed bytes
+    """
+    if method == 'gz':
+        return gzip.compress(content, mtime=0)
+    if method == 'zst':
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        return zstandard.ZstdCompressor().compress(content)
+    raise ValueError(f"Unknown compression method: {method}")
+
+
+def write_artifact(filepath: str, content: bytes, compress: Iterable[str] = ()) -> bool:
+    """
+    Write an artifact atomically, skipping it when content is unchanged
+
+    Compressed variants are written next to the artifact (e.g. keywords.json.gz)
+    and are checked against the content on their own, so a variant left over
+    from an earlier artifact is rewritten even when the artifact is unchanged.
+
+    Args:
+        filepath: Destination path
+        content: Artifact bytes
+        compress: Compression methods for extra variants ('gz', 'zst')
+
+    Returns:
+        True if anything was written, False if everything was up to date
+    """
+    expected = content_hash(content)
+    unchanged = file_hash(filepath) == expected
+    written = False
+
+    if not unchanged:
+        atomic_write(filepath, content)
+        written = True
+
+    for method in compress:
+        variant_path = filepath + COMPRESSION_SUFFIXES[method]
+        if variant_hash(variant_path, method) == expected:
+            continue
+        try:
+            atomic_write(variant_path, compress_content(content, method))
+            written = True
+        except RuntimeError as e:
+            print(f"  ⚠️  Skipping {variant_path}: {e}")
+
+    return written
+
+
+def compress_file(filepath: str, method: str) -> None:
+    """
+    Write a compressed variant of a file without loading it into memory
+
+    Args:
+        filepath: Source file; the variant is written next to it
+        method: 'gz' or 'zst'
+    """
+    variant_path = filepath + COMPRESSION_SUFFIXES[method]
+    directory = os.path.dirname(os.path.abspath(variant_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(variant_path))
+    try:
+        with open(filepath, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            if method == 'gz':
+                with gzip.GzipFile(fileobj=dst, mode='wb', mtime=0) as gz:
+                    shutil.copyfileobj(src, gz)
+            elif method == 'zst':
+                if zstandard is None:
+                    raise RuntimeError("zstandard is not installed")
+                zstandard.ZstdCompressor().copy_stream(src, dst)
+            else:
+                raise ValueError(f"Unknown compression method: {method}")
+        _replace(tmp_path, variant_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_artifact_stream(filepath: str, chunks: Iterable[bytes], compress: Iterable[str] = ()) -> bool:
+    """
+    Stream an artifact to disk atomically, skipping it when content is unchanged
+
+    Chunks are written to a temp file and hashed as they arrive; the temp
+    file only replaces the artifact if the final hash differs. Compressed
+    variants are rewritten whenever their own content is out of date.
+
+    Args:
+        filepath: Destination path
+        chunks: Iterable of artifact byte chunks
+        compress: Compression methods for extra variants ('gz', 'zst')
+
+    Returns:
+        True if anything was written, False if everything was up to date
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(filepath))
+    digest = hashlib.sha256()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        expected = digest.hexdigest()
+        unchanged = file_hash(filepath) == expected
+        if unchanged:
+            os.remove(tmp_path)
+        else:
+            _replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    written = not unchanged
+    for method in compress:
+        if variant_hash(filepath + COMPRESSION_SUFFIXES[method], method) == expected:
+            continue
+        try:
+            compress_file(filepath, method)
+            written = True
+        except RuntimeError as e:
+            print(f"  ⚠️  Skipping {filepath + COMPRESSION_SUFFIXES[method]}: {e}")
+
+    return written
+
+
+def preserve_fields(filepath: str, data: Dict, fields: Iterable[str] = ('generated_at',)) -> Dict:
+    """
+    Keep the existing artifact's values for volatile fields when nothing else changed
+
+    Run timestamps such as generated_at would otherwise make every rebuild
+    differ from the last, so skip-if-unchanged could never fire.
+
+    Args:
+        filepath: Existing JSON artifact
+        data: New top-level JSON object
+        fields: Volatile top-level keys
+
+    Returns:
+        data, with the old values of fields if the rest of the content is unchanged
+    """
+    fields = tuple(fields)
+    try:
+        with open(filepath, 'rb') as f:
+            previous = json.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return data
+    if not isinstance(previous, dict):
+        return data
+
+    def stable(obj: Dict) -> Dict:
+        return {key: value for key, value in obj.items() if key not in fields}
+
+    # Compare through JSON so e.g. tuples and lists count as equal
+    if json.loads(serialize_json(stable(data))) != stable(previous):
+        return data
+    for field in fields:
+        if field in previous:
+            data[field] = previous[field]
+    return data
+
+
+def write_json_artifact(filepath: str, data: Any, compress: Iterable[str] = ()) -> bool:
+    """Serialize data as JSON and write it with write_artifact"""
+    return write_artifact(filepath, serialize_json(data), compress)
+
+
+def write_text_artifact(filepath: str, text: str, compress: Iterable[str] = ()) -> bool:
+    """Encode text as UTF-8 and write it with write_artifact"""
+    return write_artifact(filepath, text.encode('utf-8'), compress)
@@ -0,0 +1,144 @@
+"""
+SEO Coverage Index
+Inverted index over scanned content pages for keyword coverage and gap analysis
+"""
+
+from collections import Counter
+from typing import Dict, List
+
+# Extensions treated as published content pages
+PAGE_EXTENSIONS = {'.md', '.html'}
+
+
+class CoverageIndex:
+    """Inverted index (term -> page postings with tf) over content pages"""
+
+    def __init__(self, tokenize):
+        """
+        Initialize coverage index
+
+        Args:
+            tokenize: Tokenizer, normally KeywordExtractor.tokenize so index
+                terms match extracted keyword terms
+        """
+        self.tokenize = tokenize
+        self.pages: List[str] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+
+    @classmethod
+    def from_project_data(cls, files_data: Dict, tokenize) -> "CoverageIndex":
+        """
+        Build an index from scan_project_files output
+
+        Args:
+            files_data: Output from scan_project_files
+            tokenize: Tokenizer function
+
+        Returns:
+            Populated CoverageIndex
+        """
+        index = cls(tokenize)
+        for file_info in files_data.get('files', []):
+            if file_info.get('extension') in PAGE_EXTENSIONS:
+                index.add_page(file_info['path'], file_info.get('content', ''))
+        return index
+
+    def add_page(self, path: str, content: str) -> None:
+        """Tokenize a page once and add its term frequencies to the postings"""
+        page_id = len(self.pages)
+        self.pages.append(path)
+        for term, tf in Counter(self.tokenize(content)).items():
+            self.postings.setdefault(term, {})[page_id] = tf
+
+    def lookup(self, keyword: str) -> Dict[int, int]:
+        """
+        Find pages containing every word of a keyword
+
+        Multi-word keywords (RAKE phrases) intersect the postings of their
+        words, smallest list first; the phrase tf is the minimum word tf.
+
+        Args:
+            keyword: Single term or phrase
+
+        Returns:
+            Dictionary of page id -> tf
+        """
+        words = self.tokenize(keyword)
+        if not words:
+            return {}
+
+        postings = [self.postings.get(word) for word in set(words)]
+        if not all(postings):
+            return {}
+
+        postings.sort(key=len)
+        matches = dict(postings[0])
+        for other in postings[1:]:
+            matches = {
+                page_id: min(tf, other[page_id])
+                for page_id, tf in matches.items()
+                if page_id in other
+            }
+            if not matches:
+                break
+        return matches
+
+    def top_pages(self, keyword: str, limit: int = 5) -> List[Dict]:
+        """Pages covering a keyword, highest tf first"""
+        matches = self.lookup(keyword)
+        ranked = sorted(matches.items(), key=lambda x: (-x[1], self.pages[x[0]]))
+        return [{'path': self.pages[page_id], 'tf': tf} for page_id, tf in ranked[:limit]]
+
+    def get_stats(self) -> Dict:
+        """Get index size statistics"""
+        return {
+            'pages': len(self.pages),
+            'terms': len(self.postings),
+            'postings': sum(len(p) for p in self.postings.values()),
+        }
+
+
+def compute_coverage(
+    index: CoverageIndex,
+    keyword_clusters: Dict,
+    pages_per_term: int = 5
+) -> Dict:
+    """
+    Compute per-cluster keyword coverage and gaps
+
+    Args:
+        index: Populated CoverageIndex
+        keyword_clusters: Dictionary with keyword clusters
+        pages_per_term: Maximum pages listed per covered term
+
+    Returns:
+        Dictionary with index stats and per-cluster coverage keyed by cluster id
+    """
+    coverage = {}
+
+    for i, cluster in enumerate(keyword_clusters.get('clusters', [])):
+        cluster_id = cluster.get('cluster_id', i + 1)
+        covered = {}
+        gaps = []
+
+        for kw in cluster.get('keywords', []):
+            term = kw.get('term', '')
+            pages = index.top_pages(term, limit=pages_per_term)
+            if pages:
+                covered[term] = pages
+            else:
+                gaps.append(term)
+
+        total = len(covered) + len(gaps)
+        coverage[str(cluster_id)] = {
+            'cluster_id': cluster_id,
+            'covered': covered,
+            'gaps': gaps,
+            'coverage_ratio': len(covered) / total if total else 0.0,
+        }
+
+    return {
+        'index': index.get_stats(),
+        'clusters': coverage,
+    }
+
@@ -59,34 +59,56 @@ class KeywordExtractor:
         Returns:
             List of (keyword, score) tuples
         """
-        # Calculate term frequency
-        tf = defaultdict(Counter)
-        for i, doc in enumerate(documents):
-            words = self.tokenize(doc)
-            tf[i] = Counter(words)
+        return self.score_tfidf(self.tfidf_stats(documents), top_n=top_n)
+    
+    def tfidf_stats(self, documents: List[str]) -> List[Counter]:
+        """
+        Collect per-document term counts for TF-IDF
+        
+        Counts are additive: counting two halves of a document and summing
+        the Counters gives the same result as counting the whole document.
+        
+        Args:
+            documents: List of text documents
         
+        Returns:
+            List of term Counters, one per document
+        """
+        return [Counter(self.tokenize(doc)) for doc in documents]
+    
+    def score_tfidf(self, doc_term_counts: List[Counter], top_n: int = 50) -> List[Tuple[str, float]]:
+        """
+        Score keywords from per-document term counts
+        
+        Args:
+            doc_term_counts: Output from tfidf_stats (or merged partials)
+            top_n: Number of top keywords to return
+        
+        Returns:
+            List of (keyword, score) tuples
+        """
         # Calculate document frequency
         df = Counter()
-        for doc_tf in tf.values():
+        for doc_tf in doc_term_counts:
             df.update(doc_tf.keys())
         
         # Calculate TF-IDF
-        num_docs = len(documents)
+        num_docs = len(doc_term_counts)
         tfidf_scores = defaultdict(float)
         
-        for doc_id, doc_tf in tf.items():
+        for doc_tf in doc_term_counts:
+            doc_length = sum(doc_tf.values())
             for term, freq in doc_tf.items():
                 # TF-IDF = TF * IDF
                 # IDF = log(N / DF)
-                tf_score = freq / sum(doc_tf.values())
+                tf_score = freq / doc_length
                 idf_score = math.log(num_docs / df[term])
                 tfidf_scores[term] += tf_score * idf_score
         
-        # Sort by score
+        # Sort by score, ties broken by term so output is reproducible
         sorted_keywords = sorted(
             tfidf_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
+            key=lambda x: (-x[1], x[0])
         )
         
         return sorted_keywords[:top_n]
@@ -102,6 +124,20 @@ class KeywordExtractor:
         Returns:
             List of (keyword_phrase, score) tuples
         """
+        return self.score_rake(self.rake_stats(text), top_n=top_n)
+    
+    def rake_stats(self, text: str) -> Dict[str, Counter]:
+        """
+        Collect RAKE word frequencies, degrees and candidate phrases
+        
+        Counts are additive across texts split on sentence boundaries.
+        
+        Args:
+            text: Input text
+        
+        Returns:
+            Dictionary with 'word_freq', 'word_degree' and 'phrase_counts' Counters
+        """
         # Split text into sentences
         sentences = re.split(r'[.!?;\n]', text.lower())
         
@@ -120,7 +156,7 @@ class KeywordExtractor:
             if phrase:
                 phrase_list.append(' '.join(phrase))
         
-        # Calculate word scores
+        # Calculate word statistics
         word_freq = Counter()
         word_degree = Counter()
         
@@ -132,6 +168,26 @@ class KeywordExtractor:
             for word in words:
                 word_degree[word] += len(words) - 1
         
+        return {
+            'word_freq': word_freq,
+            'word_degree': word_degree,
+            'phrase_counts': Counter(phrase_list),
+        }
+    
+    def score_rake(self, stats: Dict[str, Counter], top_n: int = 30) -> List[Tuple[str, float]]:
+        """
+        Score RAKE phrases from collected statistics
+        
+        Args:
+            stats: Output from rake_stats (or merged partials)
+            top_n: Number of top keywords to return
+        
+        Returns:
+            List of (keyword_phrase, score) tuples
+        """
+        word_freq = stats['word_freq']
+        word_degree = stats['word_degree']
+        
         # Calculate word scores (degree/frequency)
         word_scores = {
             word: (word_degree[word] + word_freq[word]) / word_freq[word]
@@ -140,16 +196,15 @@ class KeywordExtractor:
         
         # Calculate phrase scores
         phrase_scores = {}
-        for phrase in set(phrase_list):
+        for phrase in stats['phrase_counts']:
             words = phrase.split()
             score = sum(word_scores.get(word, 0) for word in words)
             phrase_scores[phrase] = score
         
-        # Sort by score
+        # Sort by score, ties broken by phrase so output is reproducible
         sorted_phrases = sorted(
             phrase_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
+            key=lambda x: (-x[1], x[0])
         )
         
         return sorted_phrases[:top_n]
@@ -6,7 +6,9 @@ Scans project directories and extracts content from source files
 import os
 import json
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional, Tuple
+
+from .sharding import path_in_shard
 
 SUPPORTED_EXTENSIONS = {
     '.py', '.js', '.jsx', '.ts', '.tsx', '.sol', '.md', '.txt',
@@ -19,13 +21,18 @@ IGNORED_DIRS = {
 }
 
 
-def scan_project_files(root_dir: str, max_file_size: int = 1024 * 1024) -> Dict:
+def scan_project_files(
+    root_dir: str,
+    max_file_size: int = 1024 * 1024,
+    shard: Optional[Tuple[int, int]] = None
+) -> Dict:
     """
     Scan project directory and extract file contents
     
     Args:
         root_dir: Root directory to scan
         max_file_size: Maximum file size to read (default 1MB)
+        shard: Optional (index, count) to only read this shard's files
     
     Returns:
         Dictionary with file paths and contents
@@ -41,6 +48,9 @@ def scan_project_files(root_dir: str, max_file_size: int = 1024 * 1024) -> Dict:
         }
     }
     
+    if shard is not None:
+        files_data['shard'] = {'index': shard[0], 'count': shard[1]}
+    
     root_path = Path(root_dir).resolve()
     
     for file_path in root_path.rglob('*'):
@@ -55,6 +65,10 @@ def scan_project_files(root_dir: str, max_file_size: int = 1024 * 1024) -> Dict:
         if file_path.suffix not in SUPPORTED_EXTENSIONS:
             continue
         
+        # Skip files owned by other shards before reading them
+        if not path_in_shard(file_path.relative_to(root_path).as_posix(), shard):
+            continue
+        
         # Check file size
         try:
             file_size = file_path.stat().st_size
@@ -3,8 +3,12 @@
 Generates WIRED CHAOS lore riddles with 589 encoding
 """
 
+import itertools
+import os
 import random
-from typing import List, Dict
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterator, Optional, Tuple
 
 
 # 589 encoding mapping (simple cipher for demonstration)
@@ -17,6 +21,24 @@ ENCODING_589 = {
 }
 
 
+# Bulk encoder: one str.translate pass instead of a per-character loop
+_ENCODE_TABLE = str.maketrans({**ENCODING_589, ' ': '-'})
+
+
+def _build_decode_trie() -> Dict:
+    """Build a digit trie over ENCODING_589; '' holds the letters ending at a node"""
+    trie = {}
+    for letter, code in sorted(ENCODING_589.items()):
+        node = trie
+        for digit in code:
+            node = node.setdefault(digit, {})
+        node.setdefault('', []).append(letter)
+    return trie
+
+
+_DECODE_TRIE = _build_decode_trie()
+
+
 def encode_589(text: str) -> str:
     """
     Encode text using 589 cipher
@@ -27,39 +49,122 @@ def encode_589(text: str) -> str:
     Returns:
         589-encoded text
     """
-    encoded = []
-    for char in text.lower():
-        if char in ENCODING_589:
-            encoded.append(ENCODING_589[char])
-        elif char == ' ':
-            encoded.append('-')
-        else:
-            encoded.append(char)
-    return ''.join(encoded)
+    return text.lower().translate(_ENCODE_TABLE)
 
 
-def decode_589(encoded_text: str) -> str:
+def _decode_steps(word: str, start: int) -> List[Tuple[str, int]]:
+    """All (letter, next_position) steps that consume a code at word[start:]"""
+    steps = []
+    node = _DECODE_TRIE
+    for pos in range(start, len(word)):
+        node = node.get(word[pos])
+        if node is None:
+            break
+        for letter in node.get('', []):
+            steps.append((letter, pos + 1))
+    if not steps and word[start] not in '589':
+        # Characters the encoder passed through decode as themselves
+        steps.append((word[start], start + 1))
+    return steps
+
+
+def _decode_word_table(word: str) -> Tuple[List[List[Tuple[str, int]]], List[int]]:
+    """
+    DP over one encoded word
+    
+    Returns:
+        Tuple of (steps per position, number of decodings of word[i:])
+    """
+    n = len(word)
+    steps = [_decode_steps(word, i) for i in range(n)]
+    counts = [0] * n + [1]
+    for i in range(n - 1, -1, -1):
+        counts[i] = sum(counts[nxt] for _, nxt in steps[i])
+    return steps, counts
+
+
+def count_589_decodings(encoded_text: str) -> int:
     """
-    Decode 589-encoded text (reverse mapping)
+    Count the valid decodings of 589-encoded text
+    
+    Codes collide (e.g. 'n', 's' and 'y' all encode to 985) and overlap
+    as prefixes, so one encoding usually has many decodings.
     
     Args:
         encoded_text: 589-encoded text
     
     Returns:
-        Decoded text
+        Number of distinct decodings
     """
-    # Create reverse mapping
-    reverse_map = {v: k for k, v in ENCODING_589.items()}
+    total = 1
+    for word in encoded_text.split('-'):
+        total *= _decode_word_table(word)[1][0]
+    return total
+
+
+def _iter_word_decodings(word: str, table: Optional[Tuple] = None) -> Iterator[str]:
+    """Yield decodings of one encoded word, pruning dead-end branches"""
+    steps, counts = table or _decode_word_table(word)
+    if counts[0] == 0:
+        return
     
-    # Simple decode (this is a placeholder - actual decode would be more complex)
-    decoded = []
-    parts = encoded_text.split('-')
-    for part in parts:
-        if part in reverse_map:
-            decoded.append(reverse_map[part])
-        else:
-            decoded.append('?')
+    stack = [(0, '')]
+    while stack:
+        pos, prefix = stack.pop()
+        if pos == len(word):
+            yield prefix
+            continue
+        # Push in reverse so letters come out in alphabetical order
+        for letter, nxt in reversed(steps[pos]):
+            if counts[nxt]:
+                stack.append((nxt, prefix + letter))
+
+
+def iter_589_decodings(encoded_text: str, limit: Optional[int] = None) -> Iterator[str]:
+    """
+    Enumerate valid decodings of 589-encoded text
+    
+    Args:
+        encoded_text: 589-encoded text ('-' separates words)
+        limit: Maximum number of decodings to yield
+    
+    Yields:
+        Decoded candidate strings
+    """
+    words = encoded_text.split('-')
+    tables = [_decode_word_table(word) for word in words]
+    if any(counts[0] == 0 for _, counts in tables):
+        return
+    
+    # Depth-first product: itertools.product would exhaust every word's
+    # decodings up front, so limit would not bound the work
+    def product(index: int) -> Iterator[Tuple[str, ...]]:
+        if index == len(words):
+            yield ()
+            return
+        for head in _iter_word_decodings(words[index], tables[index]):
+            for tail in product(index + 1):
+                yield (head,) + tail
+    
+    for decoded in itertools.islice(product(0), limit):
+        yield ' '.join(decoded)
+
+
+def decode_589(encoded_text: str) -> str:
+    """
+    Decode 589-encoded text (first valid decoding)
+    
+    Use iter_589_decodings to see every candidate.
+    
+    Args:
+        encoded_text: 589-encoded text
     
+    Returns:
+        Decoded text ('?' for words with no valid decoding)
+    """
+    decoded = []
+    for word in encoded_text.split('-'):
+        decoded.append(next(_iter_word_decodings(word), '?'))
     return ' '.join(decoded)
 
 
@@ -117,50 +222,112 @@ RIDDLE_VOCABULARY = {
 }
 
 
-def generate_riddle() -> Dict:
+DIFFICULTIES = ['Easy', 'Medium', 'Hard', 'Expert']
+
+# Riddles per independently seeded block; fixed so output does not depend on worker count
+RIDDLE_BLOCK_SIZE = 10000
+
+
+def _compile_templates() -> List[Tuple[str, List[str], str, str]]:
+    """Precompile templates into (format string, placeholders, encoded answer, hint)"""
+    compiled = []
+    for template_data in RIDDLE_TEMPLATES:
+        template = template_data['template']
+        fields = [name for _, name, _, _ in string.Formatter().parse(template) if name]
+        compiled.append((
+            template,
+            [name for name in RIDDLE_VOCABULARY if name in fields],
+            encode_589(template_data['answer']),
+            template_data['hint'],
+        ))
+    return compiled
+
+
+_COMPILED_TEMPLATES = _compile_templates()
+
+
+def generate_riddle(rng: Optional[random.Random] = None) -> Dict:
     """
     Generate a single 589-coded riddle
     
+    Args:
+        rng: Random generator to draw from (default: module-level random)
+    
     Returns:
         Dictionary with riddle, encoded version, and hint
     """
+    rng = rng or random
+    
     # Select random template
-    template_data = random.choice(RIDDLE_TEMPLATES)
-    template = template_data['template']
+    template, fields, encoded_answer, hint = rng.choice(_COMPILED_TEMPLATES)
     
     # Fill template with random vocabulary
-    riddle_text = template
-    for key in RIDDLE_VOCABULARY:
-        if f'{{{key}}}' in riddle_text:
-            word = random.choice(RIDDLE_VOCABULARY[key])
-            riddle_text = riddle_text.replace(f'{{{key}}}', word)
-    
-    # Encode the answer
-    encoded_answer = encode_589(template_data['answer'])
+    riddle_text = template.format(**{
+        key: rng.choice(RIDDLE_VOCABULARY[key]) for key in fields
+    })
     
     return {
         'riddle': riddle_text,
         'encoded_answer': encoded_answer,
-        'hint': template_data['hint'],
-        'difficulty': random.choice(['Easy', 'Medium', 'Hard', 'Expert'])
+        'hint': hint,
+        'difficulty': rng.choice(DIFFICULTIES)
     }
 
 
-def generate_riddle_collection(num_riddles: int = 5) -> List[Dict]:
+def _generate_riddle_block(seed: int, block: int, count: int) -> List[Dict]:
+    """Generate one independently seeded block of riddles (worker entry point)"""
+    rng = random.Random(f"{seed}:{block}")
+    first_id = block * RIDDLE_BLOCK_SIZE + 1
+    riddles = []
+    for i in range(count):
+        riddle = generate_riddle(rng)
+        riddle['id'] = first_id + i
+        riddles.append(riddle)
+    return riddles
+
+
+def generate_riddle_collection(
+    num_riddles: int = 5,
+    seed: Optional[int] = None,
+    workers: int = 1
+) -> List[Dict]:
     """
     Generate a collection of riddles
     
+    Riddles are generated in fixed-size blocks, each seeded from (seed, block),
+    so the same seed yields the same collection for any worker count.
+    
     Args:
         num_riddles: Number of riddles to generate
+        seed: Seed for a reproducible collection (default: random)
+        workers: Worker processes for large collections
     
     Returns:
         List of riddle dictionaries
     """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    
+    blocks = [
+        (block, min(RIDDLE_BLOCK_SIZE, num_riddles - block * RIDDLE_BLOCK_SIZE))
+        for block in range((num_riddles + RIDDLE_BLOCK_SIZE - 1) // RIDDLE_BLOCK_SIZE)
+    ]
+    
     riddles = []
-    for i in range(num_riddles):
-        riddle = generate_riddle()
-        riddle['id'] = i + 1
-        riddles.append(riddle)
+    if workers <= 1 or len(blocks) <= 1:
+        for block, count in blocks:
+            riddles.extend(_generate_riddle_block(seed, block, count))
+        return riddles
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(blocks), os.cpu_count() or 1)) as executor:
+        results = executor.map(
+            _generate_riddle_block,
+            [seed] * len(blocks),
+            [block for block, _ in blocks],
+            [count for _, count in blocks],
+        )
+        for block_riddles in results:
+            riddles.extend(block_riddles)
     
     return riddles
 
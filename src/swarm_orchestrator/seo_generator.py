@@ -3,88 +3,194 @@ SEO Brief Generator
 Generates SEO-optimized briefs for pages, blogs, and threads
 """
 
-from typing import List, Dict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterator, Optional, Tuple
 
+CONTENT_TYPES = ["page", "blog", "thread"]
 
-def generate_seo_brief(keywords: List[Dict], content_type: str = "page") -> str:
+# Precompiled template sections: everything after the keyword list is static
+# per content type, so it is assembled once at import time.
+_OUTLINES = {
+    "page": (
+        "### Hero Section\n"
+        "- Headline incorporating primary keyword\n"
+        "- Subheadline with secondary keywords\n"
+        "- CTA button with action-oriented text\n\n"
+        "### Features Section\n"
+        "- 3-4 key features highlighting benefits\n"
+        "- Use keywords naturally in descriptions\n\n"
+        "### Social Proof\n"
+        "- Testimonials or case studies\n"
+        "- Trust indicators\n\n"
+        "### Final CTA\n"
+        "- Strong closing with primary keyword\n\n"
+    ),
+    "blog": (
+        "### Introduction (150-200 words)\n"
+        "- Hook with primary keyword in first paragraph\n"
+        "- Preview what readers will learn\n\n"
+        "### Main Content (800-1200 words)\n"
+        "- 3-5 H2 sections using secondary keywords\n"
+        "- Bullet points and numbered lists\n"
+        "- Examples and case studies\n\n"
+        "### Conclusion (100-150 words)\n"
+        "- Summarize key points\n"
+        "- CTA with next steps\n\n"
+    ),
+    "thread": (
+        "### Thread Structure (8-12 tweets)\n\n"
+        "1. **Hook Tweet**: Start with attention-grabbing statement using primary keyword\n"
+        "2. **Problem Statement**: Define the challenge or question\n"
+        "3-8. **Value Tweets**: Share insights, tips, or steps\n"
+        "9-10. **Supporting Evidence**: Data, examples, or case studies\n"
+        "11. **Summary**: Recap key points\n"
+        "12. **CTA**: Encourage engagement (like, RT, follow)\n\n"
+    ),
+}
+
+_FOOTER = (
+    "## SEO Optimization Tips\n\n"
+    "- **Keyword Density**: 1-2% for primary keyword\n"
+    "- **Meta Title**: 50-60 characters, include primary keyword\n"
+    "- **Meta Description**: 150-160 characters, include CTA\n"
+    "- **Headers**: Use H1 for main title, H2-H3 for sections\n"
+    "- **Internal Links**: 2-3 relevant internal links\n"
+    "- **External Links**: 1-2 authoritative sources\n"
+    "- **Images**: Alt text with keywords, compressed for speed\n\n"
+    "## WIRED CHAOS Brand Voice\n\n"
+    "- **Tone**: Bold, innovative, cyberpunk-inspired\n"
+    "- **Style**: Technical yet accessible, cutting-edge\n"
+    "- **Colors**: Neon (00FFFF, 39FF14, FF3131)\n"
+    "- **Themes**: Web3, AI, AR/VR, decentralization\n\n"
+)
+
+_BODIES = {
+    content_type: "\n## Content Outline\n\n" + outline + _FOOTER
+    for content_type, outline in _OUTLINES.items()
+}
+_DEFAULT_BODY = "\n## Content Outline\n\n" + _FOOTER
+
+# Clusters per worker task when rendering in parallel
+BATCH_CHUNK_SIZE = 64
+
+
+def _render_coverage(coverage: Dict) -> str:
+    """Render the coverage section for one cluster"""
+    covered = coverage.get('covered', {})
+    gaps = coverage.get('gaps', [])
+    parts = [
+        "\n## Coverage\n\n",
+        f"- **Covered**: {len(covered)}/{len(covered) + len(gaps)} keywords already on site\n",
+        f"- **Gaps**: {', '.join(gaps) if gaps else 'none'}\n",
+    ]
+    for term, pages in covered.items():
+        paths = ", ".join(f"`{page['path']}`" for page in pages)
+        parts.append(f"- **{term}**: {paths}\n")
+    return "".join(parts)
+
+
+def _render_brief(
+    keywords: List[Dict],
+    content_type: str,
+    title_suffix: str = "",
+    coverage: Optional[Dict] = None
+) -> str:
+    """Render one brief from the precompiled template sections"""
+    parts = [f"# SEO Brief - {content_type.upper()}{title_suffix}\n\n## Primary Keywords\n\n"]
+    
+    # Top 5 keywords
+    for i, kw in enumerate(keywords[:5], 1):
+        parts.append(f"{i}. **{kw.get('term', '')}** (weight: {kw.get('weight', 0):.3f})\n")
+    
+    if coverage:
+        parts.append(_render_coverage(coverage))
+    
+    parts.append(_BODIES.get(content_type, _DEFAULT_BODY))
+    return "".join(parts)
+
+
+def generate_seo_brief(
+    keywords: List[Dict],
+    content_type: str = "page",
+    coverage: Optional[Dict] = None
+) -> str:
     """
     Generate SEO brief based on keywords
     
     Args:
         keywords: List of keyword dictionaries with 'term' and 'weight'
         content_type: Type of content (page, blog, thread)
+        coverage: Optional cluster coverage from coverage_index.compute_coverage
     
     Returns:
         Markdown-formatted SEO brief
     """
-    brief = f"# SEO Brief - {content_type.upper()}\n\n"
-    brief += "## Primary Keywords\n\n"
-    
-    # Extract top 5 keywords
-    top_keywords = keywords[:5] if len(keywords) >= 5 else keywords
-    for i, kw in enumerate(top_keywords, 1):
-        term = kw.get('term', '')
-        weight = kw.get('weight', 0)
-        brief += f"{i}. **{term}** (weight: {weight:.3f})\n"
-    
-    brief += "\n## Content Outline\n\n"
-    
-    if content_type == "page":
-        brief += "### Hero Section\n"
-        brief += "- Headline incorporating primary keyword\n"
-        brief += "- Subheadline with secondary keywords\n"
-        brief += "- CTA button with action-oriented text\n\n"
-        
-        brief += "### Features Section\n"
-        brief += "- 3-4 key features highlighting benefits\n"
-        brief += "- Use keywords naturally in descriptions\n\n"
-        
-        brief += "### Social Proof\n"
-        brief += "- Testimonials or case studies\n"
-        brief += "- Trust indicators\n\n"
-        
-        brief += "### Final CTA\n"
-        brief += "- Strong closing with primary keyword\n\n"
+    return _render_brief(keywords, content_type, coverage=coverage)
+
+
+def _render_cluster_chunk(
+    chunk: List[Tuple[int, List[Dict], Optional[Dict]]],
+    content_types: List[str]
+) -> str:
+    """Render every content type for a chunk of clusters (worker entry point)"""
+    parts = []
+    for cluster_id, keywords, coverage in chunk:
+        for content_type in content_types:
+            parts.append(_render_brief(keywords, content_type, f" - Cluster {cluster_id}", coverage))
+            parts.append("\n---\n\n")
+    return "".join(parts)
+
+
+def render_briefs_batch(
+    keyword_clusters: Dict,
+    content_types: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    coverage: Optional[Dict] = None
+) -> Iterator[str]:
+    """
+    Render briefs for every cluster and every content type
     
-    elif content_type == "blog":
-        brief += "### Introduction (150-200 words)\n"
-        brief += "- Hook with primary keyword in first paragraph\n"
-        brief += "- Preview what readers will learn\n\n"
-        
-        brief += "### Main Content (800-1200 words)\n"
-        brief += "- 3-5 H2 sections using secondary keywords\n"
-        brief += "- Bullet points and numbered lists\n"
-        brief += "- Examples and case studies\n\n"
-        
-        brief += "### Conclusion (100-150 words)\n"
-        brief += "- Summarize key points\n"
-        brief += "- CTA with next steps\n\n"
-    
-    elif content_type == "thread":
-        brief += "### Thread Structure (8-12 tweets)\n\n"
-        brief += "1. **Hook Tweet**: Start with attention-grabbing statement using primary keyword\n"
-        brief += "2. **Problem Statement**: Define the challenge or question\n"
-        brief += "3-8. **Value Tweets**: Share insights, tips, or steps\n"
-        brief += "9-10. **Supporting Evidence**: Data, examples, or case studies\n"
-        brief += "11. **Summary**: Recap key points\n"
-        brief += "12. **CTA**: Encourage engagement (like, RT, follow)\n\n"
-    
-    brief += "## SEO Optimization Tips\n\n"
-    brief += "- **Keyword Density**: 1-2% for primary keyword\n"
-    brief += "- **Meta Title**: 50-60 characters, include primary keyword\n"
-    brief += "- **Meta Description**: 150-160 characters, include CTA\n"
-    brief += "- **Headers**: Use H1 for main title, H2-H3 for sections\n"
-    brief += "- **Internal Links**: 2-3 relevant internal links\n"
-    brief += "- **External Links**: 1-2 authoritative sources\n"
-    brief += "- **Images**: Alt text with keywords, compressed for speed\n\n"
-    
-    brief += "## WIRED CHAOS Brand Voice\n\n"
-    brief += "- **Tone**: Bold, innovative, cyberpunk-inspired\n"
-    brief += "- **Style**: Technical yet accessible, cutting-edge\n"
-    brief += "- **Colors**: Neon (00FFFF, 39FF14, FF3131)\n"
-    brief += "- **Themes**: Web3, AI, AR/VR, decentralization\n\n"
-    
-    return brief
+    Clusters are rendered in chunks across a process pool and yielded in
+    cluster order as each chunk completes, so callers can stream output.
+    
+    Args:
+        keyword_clusters: Dictionary with keyword clusters
+        content_types: Content types to render (default: page, blog, thread)
+        workers: Worker processes (default: CPU count, 1 renders inline)
+        chunk_size: Clusters per worker task
+        coverage: Optional output from coverage_index.compute_coverage
+    
+    Yields:
+        Markdown text, starting with the document header
+    """
+    content_types = content_types or CONTENT_TYPES
+    cluster_coverage = (coverage or {}).get('clusters', {})
+    clusters = []
+    for i, cluster in enumerate(keyword_clusters.get('clusters', [])):
+        cluster_id = cluster.get('cluster_id', i + 1)
+        clusters.append((
+            cluster_id,
+            cluster.get('keywords', []),
+            cluster_coverage.get(str(cluster_id))
+        ))
+    chunks = [clusters[i:i + chunk_size] for i in range(0, len(clusters), chunk_size)]
+    
+    yield (
+        "# WIRED CHAOS SEO Content Briefs\n\n"
+        f"Generated: {keyword_clusters.get('generated_at', 'N/A')}\n\n"
+        "---\n\n"
+    )
+    
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield _render_cluster_chunk(chunk, content_types)
+        return
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        yield from executor.map(_render_cluster_chunk, chunks, [content_types] * len(chunks))
 
 
 def generate_multiple_briefs(keyword_clusters: Dict) -> str:
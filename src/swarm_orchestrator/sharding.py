@@ -0,0 +1,164 @@
+"""
+Sharded Keyword Statistics
+Deterministic file partitioning and mergeable keyword statistics for multi-node runs
+"""
+
+import json
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+# Documents fed to TF-IDF, in the order a single-node run builds them
+DOCUMENT_ORDER = ['project', 'rss', 'twitter']
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification of the form "i/N"
+
+    Args:
+        spec: Shard spec, 1-based (e.g. "2/4")
+
+    Returns:
+        Tuple of (index, count)
+    """
+    try:
+        index_str, count_str = spec.split('/')
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard spec '{spec}', expected i/N (e.g. 1/4)")
+
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard spec '{spec}', need 1 <= i <= N")
+
+    return index, count
+
+
+def path_in_shard(relative_path: str, shard: Optional[Tuple[int, int]]) -> bool:
+    """
+    Check whether a file belongs to a shard
+
+    Uses a stable CRC32 of the POSIX-style relative path so every node
+    computes the same partition regardless of platform or scan order.
+
+    Args:
+        relative_path: Path relative to the scan root, with '/' separators
+        shard: Tuple of (index, count), or None for no sharding
+
+    Returns:
+        True if the file should be processed by this shard
+    """
+    if shard is None:
+        return True
+    index, count = shard
+    return zlib.crc32(relative_path.encode('utf-8')) % count == index - 1
+
+
+def build_partial_stats(
+    extractor,
+    documents: Dict[str, str],
+    shard: Tuple[int, int]
+) -> Dict:
+    """
+    Collect mergeable keyword statistics for one shard
+
+    Args:
+        extractor: KeywordExtractor used for tokenization
+        documents: Text per document name (see DOCUMENT_ORDER)
+        shard: Tuple of (index, count)
+
+    Returns:
+        JSON-serializable partial statistics
+    """
+    names = [name for name in DOCUMENT_ORDER if name in documents]
+    texts = [documents[name] for name in names]
+    term_counts = extractor.tfidf_stats(texts)
+
+    # RAKE runs over the same combined text a single-node run would use
+    rake = extractor.rake_stats(" ".join(texts))
+
+    return {
+        'shard': {'index': shard[0], 'count': shard[1]},
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'documents': [
+            {
+                'name': name,
+                'has_content': bool(text),
+                'term_counts': dict(counts),
+            }
+            for name, text, counts in zip(names, texts, term_counts)
+        ],
+        'rake': {key: dict(counter) for key, counter in rake.items()},
+    }
+
+
+def merge_partial_stats(partials: List[Dict]) -> Dict:
+    """
+    Merge shard partials into whole-tree statistics
+
+    Document frequency is not stored in partials: the project tree is a
+    single TF-IDF document split across shards, so DF is derived here
+    from the merged per-document term counts.
+
+    Args:
+        partials: Outputs from build_partial_stats, one per shard
+
+    Returns:
+        Dictionary with 'doc_term_counts' (list of Counters, in
+        single-node document order) and 'rake' (dict of Counters)
+    """
+    if not partials:
+        raise ValueError("No shard partials to merge")
+
+    counts = {p['shard']['count'] for p in partials}
+    if len(counts) != 1:
+        raise ValueError(f"Partials come from different shard counts: {sorted(counts)}")
+
+    count = counts.pop()
+    indices = sorted(p['shard']['index'] for p in partials)
+    if indices != list(range(1, count + 1)):
+        raise ValueError(f"Expected shards 1..{count}, got {indices}")
+
+    doc_counts = {}
+    doc_has_content = {}
+    rake = {'word_freq': Counter(), 'word_degree': Counter(), 'phrase_counts': Counter()}
+
+    for partial in partials:
+        for doc in partial['documents']:
+            name = doc['name']
+            doc_counts.setdefault(name, Counter()).update(doc['term_counts'])
+            doc_has_content[name] = doc_has_content.get(name, False) or doc['has_content']
+        for key in rake:
+            rake[key].update(partial['rake'].get(key, {}))
+
+    # Single-node runs drop empty documents before TF-IDF
+    doc_term_counts = [
+        doc_counts[name]
+        for name in DOCUMENT_ORDER
+        if doc_has_content.get(name)
+    ]
+
+    return {'doc_term_counts': doc_term_counts, 'rake': rake}
+
+
+def load_partials(paths: List[str]) -> List[Dict]:
+    """
+    Load shard partials from JSON files
+
+    Args:
+        paths: Paths to partial statistics files
+
+    Returns:
+        List of partial statistics dictionaries
+    """
+    partials = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            partials.append(json.load(f))
+    return partials
+
+
+def partial_filename(shard: Tuple[int, int]) -> str:
+    """Filename for a shard's partial statistics"""
+    return f"keywords.shard-{shard[0]}-of-{shard[1]}.json"
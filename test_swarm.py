@@ -76,6 +76,13 @@ def test_seo_generator():
         assert len(brief) > 100
         assert 'SEO Brief' in brief
         print(f"✓ Generated SEO brief ({len(brief)} characters)")
+        
+        from swarm_orchestrator.seo_generator import render_briefs_batch
+        clusters = {'clusters': [{'cluster_id': i, 'keywords': keywords} for i in range(1, 201)]}
+        briefs = "".join(render_briefs_batch(clusters, workers=2, chunk_size=50))
+        assert briefs.count('# SEO Brief') == 600
+        assert briefs == "".join(render_briefs_batch(clusters, workers=1))
+        print("✓ Batch-rendered 600 briefs (200 clusters x 3 content types)")
         return True
     except Exception as e:
         print(f"✗ Error: {e}")
@@ -91,6 +98,179 @@ def test_riddle_generator():
         assert 'riddle' in riddles[0]
         assert 'encoded_answer' in riddles[0]
         print(f"✓ Generated {len(riddles)} riddles")
+        
+        seeded = generate_riddle_collection(12000, seed=589)
+        assert seeded == generate_riddle_collection(12000, seed=589, workers=2)
+        print(f"✓ Seeded collection of {len(seeded)} riddles is reproducible")
+        return True
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return False
+
+def test_sharding():
+    """Test sharded keyword stats merge to the single-node result"""
+    print("\nTesting sharded keyword stats...")
+    try:
+        from swarm_orchestrator.keyword_extractor import KeywordExtractor
+        from swarm_orchestrator.project_scanner import scan_project_files, extract_text_content
+        from swarm_orchestrator.sharding import build_partial_stats, merge_partial_stats
+        extractor = KeywordExtractor()
+        
+        whole = extract_text_content(scan_project_files('backend', max_file_size=50*1024))
+        partials = [
+            build_partial_stats(
+                extractor,
+                {'project': extract_text_content(
+                    scan_project_files('backend', max_file_size=50*1024, shard=(i, 3))
+                )},
+                (i, 3)
+            )
+            for i in range(1, 4)
+        ]
+        merged = merge_partial_stats(partials)
+        
+        assert extractor.score_tfidf(merged['doc_term_counts']) == extractor.extract_tfidf([whole])
+        assert extractor.score_rake(merged['rake']) == extractor.extract_rake(whole)
+        print(f"✓ Merged {len(partials)} shards into the single-node keywords")
+        return True
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return False
+
+def test_artifact_writer():
+    """Test atomic artifact writes skip unchanged content"""
+    print("\nTesting artifact writer...")
+    try:
+        import gzip
+        import stat
+        import tempfile
+        from swarm_orchestrator.artifact_writer import write_json_artifact, _default_mode
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'keywords.json')
+            data = {'clusters': [{'cluster_id': 1, 'keywords': []}]}
+            
+            assert write_json_artifact(path, data, compress=('gz',))
+            assert not write_json_artifact(path, data, compress=('gz',))
+            assert write_json_artifact(path, {'clusters': []})
+            
+            # The .gz from the first write is stale; it is refreshed even
+            # though the main artifact is unchanged
+            assert write_json_artifact(path, {'clusters': []}, compress=('gz',))
+            with gzip.open(path + '.gz') as f:
+                assert json.load(f) == {'clusters': []}
+            assert not write_json_artifact(path, {'clusters': []}, compress=('gz',))
+            assert sorted(os.listdir(tmp)) == ['keywords.json', 'keywords.json.gz']
+            
+            # Replaced artifacts keep their mode (mkstemp creates 0600)
+            os.chmod(path, 0o644)
+            assert write_json_artifact(path, data, compress=('gz',))
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+            assert stat.S_IMODE(os.stat(path + '.gz').st_mode) == _default_mode()
+        
+        # orjson and the stdlib fallback must produce the same bytes
+        from swarm_orchestrator import artifact_writer
+        unicode_data = {'title': 'Café ☕ grants', 'tags': ['naïve', 'Zürich'], 'score': 0.5}
+        fast = artifact_writer.serialize_json(unicode_data)
+        saved_orjson, artifact_writer.orjson = artifact_writer.orjson, None
+        try:
+            plain = artifact_writer.serialize_json(unicode_data)
+        finally:
+            artifact_writer.orjson = saved_orjson
+        assert fast == plain
+        assert 'Café ☕'.encode('utf-8') in plain
+        print("✓ Wrote, skipped unchanged and compressed artifacts")
+        return True
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return False
+
+def test_pipeline_rebuild():
+    """Test rebuilding from unchanged input skips every deployable artifact"""
+    print("\nTesting pipeline rebuild...")
+    try:
+        import contextlib
+        import io
+        import tempfile
+        import orchestrator
+        with tempfile.TemporaryDirectory() as tmp:
+            project = os.path.join(tmp, 'project')
+            os.makedirs(project)
+            with open(os.path.join(project, 'grants.md'), 'w') as f:
+                f.write("# Solar grants\n\nClimate energy funding for women founders building solar microgrids.\n")
+            with open(os.path.join(project, 'web3.html'), 'w') as f:
+                f.write("<html><head><title>Web3 builders</title></head>"
+                        "<body>Ethereum tooling grants and developer funding.</body></html>")
+            argv = ['orchestrator.py', '--project-dir', project, '--skip-rss', '--skip-twitter',
+                    '--build-dir', os.path.join(tmp, 'build')]
+            
+            outputs = []
+            for _ in range(2):
+                out = io.StringIO()
+                old_argv, sys.argv = sys.argv, argv
+                try:
+                    with contextlib.redirect_stdout(out):
+                        orchestrator.main()
+                finally:
+                    sys.argv = old_argv
+                outputs.append(out.getvalue())
+            
+            for name in ('keywords.json', 'seo_coverage.json', 'seo_briefs.md', 'lore_riddles.md'):
+                assert f"Saved: {os.path.join(tmp, 'build', name)}" in outputs[0], name
+                assert f"Unchanged: {os.path.join(tmp, 'build', name)}" in outputs[1], name
+        print("✓ Second run skipped keywords, coverage, briefs and riddles")
+        return True
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return False
+
+def test_coverage_index():
+    """Test SEO coverage index lookups and gaps"""
+    print("\nTesting coverage index...")
+    try:
+        from swarm_orchestrator.keyword_extractor import KeywordExtractor
+        from swarm_orchestrator.coverage_index import CoverageIndex, compute_coverage
+        extractor = KeywordExtractor()
+        files_data = {'files': [
+            {'path': 'docs/web3.md', 'extension': '.md', 'content': 'Web3 platform with NFT certificates. NFT minting.'},
+            {'path': 'site/index.html', 'extension': '.html', 'content': '<h1>Blockchain platform</h1>'},
+            {'path': 'src/app.py', 'extension': '.py', 'content': 'nft quantum'},
+        ]}
+        index = CoverageIndex.from_project_data(files_data, extractor.tokenize)
+        assert index.get_stats()['pages'] == 2
+        
+        clusters = {'clusters': [{'cluster_id': 1, 'keywords': [
+            {'term': 'nft', 'weight': 0.9},
+            {'term': 'blockchain platform', 'weight': 0.8},
+            {'term': 'quantum', 'weight': 0.7},
+        ]}]}
+        coverage = compute_coverage(index, clusters)['clusters']['1']
+        assert coverage['covered']['nft'] == [{'path': 'docs/web3.md', 'tf': 2}]
+        assert coverage['covered']['blockchain platform'][0]['path'] == 'site/index.html'
+        assert coverage['gaps'] == ['quantum']
+        print(f"✓ Indexed {index.get_stats()['terms']} terms, found {len(coverage['gaps'])} gap")
+        return True
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return False
+
+def test_589_cipher():
+    """Test 589 bulk encoder and decoder"""
+    print("\nTesting 589 cipher...")
+    try:
+        from swarm_orchestrator.riddle_generator import (
+            encode_589, iter_589_decodings, count_589_decodings
+        )
+        encoded = encode_589('Vault33 ember')
+        decodings = list(iter_589_decodings(encoded))
+        assert 'vault33 ember' in decodings
+        assert len(decodings) == count_589_decodings(encoded)
+        assert all(encode_589(d) == encoded for d in decodings)
+        
+        # limit bounds the work even when there are ~1e16 decodings
+        long_word = encode_589('n' * 18 + ' ember')
+        first = list(iter_589_decodings(long_word, limit=1))
+        assert len(first) == 1 and encode_589(first[0]) == long_word
+        print(f"✓ Enumerated {len(decodings)} valid decodings of {encoded}")
         return True
     except Exception as e:
         print(f"✗ Error: {e}")
@@ -150,6 +330,11 @@ def main():
         ("Keyword Extraction", test_keyword_extraction),
         ("SEO Generator", test_seo_generator),
         ("Riddle Generator", test_riddle_generator),
+        ("589 Cipher", test_589_cipher),
+        ("Sharding", test_sharding),
+        ("Artifact Writer", test_artifact_writer),
+        ("Pipeline Rebuild", test_pipeline_rebuild),
+        ("Coverage Index", test_coverage_index),
         ("RSS Fetcher", test_rss_fetcher),
         ("Build Outputs", test_build_outputs)
     ]